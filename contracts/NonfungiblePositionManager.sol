@@ -3,21 +3,27 @@ pragma solidity =0.8.15;
 
 import {ERC721} from "@openzeppelin/contracts/token/ERC721/ERC721.sol";
 import {IERC721Metadata} from "@openzeppelin/contracts/token/ERC721/extensions/IERC721Metadata.sol";
+import {Math} from "@openzeppelin/contracts/utils/math/Math.sol";
 
 import {TickMath} from "@uniswap/v3-core/contracts/libraries/TickMath.sol";
 import {Multicall} from "@uniswap/v3-periphery/contracts/base/Multicall.sol";
 import {PeripheryValidation} from "@uniswap/v3-periphery/contracts/base/PeripheryValidation.sol";
+import {SelfPermit} from "@uniswap/v3-periphery/contracts/base/SelfPermit.sol";
 
 import {IMarginalV1Pool} from "@marginal/v1-core/contracts/interfaces/IMarginalV1Pool.sol";
+import {Position as PositionLibrary} from "@marginal/v1-core/contracts/libraries/Position.sol";
 
 import {PeripheryImmutableState} from "./base/PeripheryImmutableState.sol";
 import {PositionManagement} from "./base/PositionManagement.sol";
 import {PositionState} from "./base/PositionState.sol";
+import {SelfPermit2} from "./base/SelfPermit2.sol";
+import {PackedCalldata} from "./libraries/PackedCalldata.sol";
 import {PoolAddress} from "./libraries/PoolAddress.sol";
 import {PositionAmounts} from "./libraries/PositionAmounts.sol";
 
 import {INonfungibleTokenPositionDescriptor} from "./interfaces/INonfungibleTokenPositionDescriptor.sol";
 import {INonfungiblePositionManager} from "./interfaces/INonfungiblePositionManager.sol";
+import {IPeripheryPayments} from "./interfaces/IPeripheryPayments.sol";
 
 /// @title Non-fungible token for Marginal v1 leverage positions
 /// @notice Wraps Marginal v1 leverage positions in the ERC721 non-fungible token interface
@@ -28,14 +34,21 @@ contract NonfungiblePositionManager is
     PeripheryImmutableState,
     PositionManagement,
     PositionState,
-    PeripheryValidation
+    PeripheryValidation,
+    SelfPermit,
+    SelfPermit2
 {
     struct Position {
         address pool;
         uint96 id;
     }
+
     mapping(uint256 => Position) private _positions;
 
+    // owner => index => token id, token id => index in owner list
+    mapping(address => mapping(uint256 => uint256)) private _ownedTokens;
+    mapping(uint256 => uint256) private _ownedTokensIndex;
+
     uint256 private _nextId = 1;
     address private immutable _tokenDescriptor;
 
@@ -81,17 +94,38 @@ contract NonfungiblePositionManager is
         uint256 amountOut,
         uint256 rewards
     );
+    event Roll(
+        uint256 indexed tokenId,
+        address indexed sender,
+        address recipient,
+        uint256 positionId,
+        uint256 size,
+        uint256 debt,
+        uint256 margin,
+        uint256 fees,
+        uint256 rewards
+    );
+    event IgniteMany(
+        uint256[] tokenIds,
+        address indexed sender,
+        address recipient,
+        uint256 amountOut,
+        uint256 rewards
+    );
 
     error Unauthorized();
     error InvalidPoolKey();
+    error InvalidDirection();
 
     constructor(
         address _factory,
         address _WETH9,
+        address _PERMIT2,
         address _tokenDescriptor_
     )
         ERC721("Marginal V1 Position Token", "MARGV1-POS")
         PeripheryImmutableState(_factory, _WETH9)
+        SelfPermit2(_PERMIT2)
     {
         _tokenDescriptor = _tokenDescriptor_;
     }
@@ -110,6 +144,136 @@ contract NonfungiblePositionManager is
             );
     }
 
+    /// @inheritdoc INonfungiblePositionManager
+    function positionsBatch(
+        uint256[] calldata tokenIds
+    ) external view returns (PositionInfo[] memory infos) {
+        infos = new PositionInfo[](tokenIds.length);
+
+        address[] memory pools = new address[](tokenIds.length);
+        uint24[] memory maintenances = new uint24[](tokenIds.length);
+        PoolStateSynced[] memory states = new PoolStateSynced[](
+            tokenIds.length
+        );
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            Position memory position = _positions[tokenIds[i]];
+            pools[i] = position.pool;
+
+            // reuse maintenance and state synced from earlier entries on the same pool
+            uint256 k;
+            while (k < i && pools[k] != pools[i]) k++;
+            if (k < i) {
+                maintenances[i] = maintenances[k];
+                states[i] = states[k];
+            } else {
+                maintenances[i] = IMarginalV1Pool(position.pool).maintenance();
+            }
+
+            PositionSynced memory synced = getPositionSynced(
+                position.pool,
+                address(this),
+                position.id,
+                maintenances[i],
+                states[i]
+            );
+            infos[i] = PositionInfo({
+                pool: position.pool,
+                positionId: position.id,
+                zeroForOne: synced.zeroForOne,
+                size: synced.size,
+                debt: synced.debt,
+                margin: synced.margin,
+                safeMarginMinimum: synced.safeMarginMinimum,
+                liquidated: synced.liquidated,
+                safe: synced.safe,
+                rewards: synced.rewards,
+                health: synced.health
+            });
+        }
+    }
+
+    /// @inheritdoc INonfungiblePositionManager
+    function tokensOfOwner(
+        address owner,
+        uint256 cursor,
+        uint256 limit
+    )
+        external
+        view
+        returns (uint256[] memory tokenIds, uint256 cursorNext)
+    {
+        uint256 length = balanceOf(owner);
+        if (cursor > length) cursor = length;
+        if (limit > length - cursor) limit = length - cursor;
+
+        tokenIds = new uint256[](limit);
+        for (uint256 i = 0; i < limit; i++)
+            tokenIds[i] = _ownedTokens[owner][cursor + i];
+        cursorNext = cursor + limit;
+    }
+
+    /// @dev Updates the owner to token ids index on mint, transfer and burn
+    function _beforeTokenTransfer(
+        address from,
+        address to,
+        uint256 firstTokenId,
+        uint256 batchSize
+    ) internal virtual override {
+        super._beforeTokenTransfer(from, to, firstTokenId, batchSize);
+        if (from == to) return;
+
+        if (from != address(0)) _removeTokenFromOwner(from, firstTokenId);
+        if (to != address(0)) _addTokenToOwner(to, firstTokenId);
+    }
+
+    /// @notice Appends the token to the owner's list of token ids
+    /// @dev Called before the owner balance is incremented
+    /// @param to The owner receiving the token
+    /// @param tokenId The NFT token id to add
+    function _addTokenToOwner(address to, uint256 tokenId) private {
+        uint256 index = balanceOf(to);
+        _ownedTokens[to][index] = tokenId;
+        _ownedTokensIndex[tokenId] = index;
+    }
+
+    /// @notice Removes the token from the owner's list of token ids by swapping in the last token id then popping
+    /// @dev Called before the owner balance is decremented
+    /// @param from The owner sending the token
+    /// @param tokenId The NFT token id to remove
+    function _removeTokenFromOwner(address from, uint256 tokenId) private {
+        uint256 indexLast = balanceOf(from) - 1;
+        uint256 index = _ownedTokensIndex[tokenId];
+
+        if (index != indexLast) {
+            uint256 tokenIdLast = _ownedTokens[from][indexLast];
+            _ownedTokens[from][index] = tokenIdLast;
+            _ownedTokensIndex[tokenIdLast] = index;
+        }
+
+        delete _ownedTokensIndex[tokenId];
+        delete _ownedTokens[from][indexLast];
+    }
+
+    /// @inheritdoc IPeripheryPayments
+    /// @dev Clears any deposits credited to the sender in token, as they are returned by the sweep
+    function sweepToken(
+        address token,
+        uint256 amountMinimum,
+        address recipient
+    ) public payable override {
+        delete deposits[msg.sender][token];
+        super.sweepToken(token, amountMinimum, recipient);
+    }
+
+    /// @dev Credits tokens pulled with Permit2 to the payer, spent first when paying pools on their behalf
+    function creditDeposit(
+        address payer,
+        address token,
+        uint256 amount
+    ) internal override {
+        deposits[payer][token] += amount;
+    }
+
     /// @inheritdoc INonfungiblePositionManager
     function positions(
         uint256 tokenId
@@ -161,6 +325,74 @@ contract NonfungiblePositionManager is
             uint256 fees,
             uint256 rewards
         )
+    {
+        (tokenId, size, debt, margin, fees, rewards) = _mintPosition(
+            params,
+            escrowRewards(1)
+        );
+
+        // refund any excess ETH from escrowed rewards to sender at end of function to avoid re-entrancy with fallback
+        refundETH();
+    }
+
+    /// @inheritdoc INonfungiblePositionManager
+    function mintMany(
+        MintParams[] calldata params
+    )
+        external
+        payable
+        returns (
+            uint256[] memory tokenIds,
+            uint256[] memory sizes,
+            uint256[] memory debts,
+            uint256[] memory margins,
+            uint256[] memory fees,
+            uint256[] memory rewards
+        )
+    {
+        // liquidation rewards the same for all positions opened in this block so check balance once against total
+        uint256 rewardsEscrowed = escrowRewards(params.length);
+
+        tokenIds = new uint256[](params.length);
+        sizes = new uint256[](params.length);
+        debts = new uint256[](params.length);
+        margins = new uint256[](params.length);
+        fees = new uint256[](params.length);
+        rewards = new uint256[](params.length);
+        for (uint256 i = 0; i < params.length; i++) {
+            MintParams memory param = params[i];
+            require(_blockTimestamp() <= param.deadline, "Transaction too old");
+            (
+                tokenIds[i],
+                sizes[i],
+                debts[i],
+                margins[i],
+                fees[i],
+                rewards[i]
+            ) = _mintPosition(param, rewardsEscrowed);
+        }
+
+        // refund any excess ETH from escrowed rewards to sender at end of function to avoid re-entrancy with fallback
+        refundETH();
+    }
+
+    /// @notice Opens a position on the pool and mints its token to the recipient
+    /// @dev Caller must check the contract balance covers `rewardsEscrowed` and refund any excess ETH
+    /// @param params The parameters necessary to open the position
+    /// @param rewardsEscrowed The rewards to escrow in the opened position
+    function _mintPosition(
+        MintParams memory params,
+        uint256 rewardsEscrowed
+    )
+        private
+        returns (
+            uint256 tokenId,
+            uint256 size,
+            uint256 debt,
+            uint256 margin,
+            uint256 fees,
+            uint256 rewards
+        )
     {
         IMarginalV1Pool pool = getPool(
             PoolAddress.PoolKey({
@@ -182,6 +414,7 @@ contract NonfungiblePositionManager is
 
         uint256 positionId;
         (positionId, size, debt, margin, fees, rewards) = open(
+            pool,
             OpenParams({
                 token0: params.token0,
                 token1: params.token1,
@@ -205,7 +438,8 @@ contract NonfungiblePositionManager is
                 amountInMaximum: params.amountInMaximum == 0
                     ? type(uint256).max
                     : params.amountInMaximum
-            })
+            }),
+            rewardsEscrowed
         );
 
         // @dev ok to call before set position since _safeMint not used so no callback
@@ -216,9 +450,6 @@ contract NonfungiblePositionManager is
             id: uint96(positionId)
         });
 
-        // refund any excess ETH from escrowed rewards to sender at end of function to avoid re-entrancy with fallback
-        refundETH();
-
         emit Mint(
             tokenId,
             msg.sender,
@@ -243,33 +474,87 @@ contract NonfungiblePositionManager is
         returns (uint256 margin)
     {
         Position memory position = _positions[params.tokenId];
-        if (
-            address(
-                getPool(
-                    PoolAddress.PoolKey({
-                        token0: params.token0,
-                        token1: params.token1,
-                        maintenance: params.maintenance,
-                        oracle: params.oracle
-                    })
-                )
-            ) != position.pool
-        ) revert InvalidPoolKey();
+        PoolAddress.PoolKey memory poolKey = PoolAddress.PoolKey({
+            token0: params.token0,
+            token1: params.token1,
+            maintenance: params.maintenance,
+            oracle: params.oracle
+        });
+        IMarginalV1Pool pool = getPool(poolKey);
+        if (address(pool) != position.pool) revert InvalidPoolKey();
+
+        margin = _lockMargin(
+            params.tokenId,
+            pool,
+            poolKey,
+            position.id,
+            params.marginIn
+        );
+    }
+
+    /// @inheritdoc INonfungiblePositionManager
+    function lockById(
+        LockByIdParams calldata params
+    ) external payable returns (uint256 margin) {
+        margin = _lockById(params.tokenId, params.marginIn, params.deadline);
+    }
+
+    /// @notice Adds margin to the position associated with the NFT token id
+    /// @dev Shared by the ABI encoded and packed entry points
+    /// @param tokenId The NFT token id associated with the position
+    /// @param marginIn The amount of margin to add
+    /// @param deadline The timestamp by which the transaction must be executed
+    /// @return margin The margin backing the position after adding margin
+    function _lockById(
+        uint256 tokenId,
+        uint128 marginIn,
+        uint256 deadline
+    )
+        private
+        onlyApprovedOrOwner(tokenId)
+        checkDeadline(deadline)
+        returns (uint256 margin)
+    {
+        Position memory position = _positions[tokenId];
+        IMarginalV1Pool pool = IMarginalV1Pool(position.pool);
+        margin = _lockMargin(
+            tokenId,
+            pool,
+            getPoolKey(pool),
+            position.id,
+            marginIn
+        );
+    }
 
+    /// @notice Adds margin to the position on the pool
+    /// @param tokenId The NFT token id associated with the position
+    /// @param pool The pool the position is on
+    /// @param poolKey The pool key of the pool
+    /// @param id The position ID stored in the pool
+    /// @param marginIn The amount of margin to add
+    /// @return margin The margin backing the position after adding margin
+    function _lockMargin(
+        uint256 tokenId,
+        IMarginalV1Pool pool,
+        PoolAddress.PoolKey memory poolKey,
+        uint96 id,
+        uint128 marginIn
+    ) private returns (uint256 margin) {
         (uint256 margin0, uint256 margin1) = adjust(
+            pool,
             AdjustParams({
-                token0: params.token0,
-                token1: params.token1,
-                maintenance: params.maintenance,
-                oracle: params.oracle,
+                token0: poolKey.token0,
+                token1: poolKey.token1,
+                maintenance: poolKey.maintenance,
+                oracle: poolKey.oracle,
                 recipient: msg.sender, // rebates to sender if dust leftover
-                id: position.id,
-                marginDelta: int128(params.marginIn)
+                id: id,
+                marginDelta: int128(marginIn)
             })
         );
         margin = margin0 > 0 ? margin0 : margin1;
 
-        emit Lock(params.tokenId, msg.sender, margin);
+        emit Lock(tokenId, msg.sender, margin);
     }
 
     /// @inheritdoc INonfungiblePositionManager
@@ -282,33 +567,98 @@ contract NonfungiblePositionManager is
         returns (uint256 margin)
     {
         Position memory position = _positions[params.tokenId];
-        if (
-            address(
-                getPool(
-                    PoolAddress.PoolKey({
-                        token0: params.token0,
-                        token1: params.token1,
-                        maintenance: params.maintenance,
-                        oracle: params.oracle
-                    })
-                )
-            ) != position.pool
-        ) revert InvalidPoolKey();
+        PoolAddress.PoolKey memory poolKey = PoolAddress.PoolKey({
+            token0: params.token0,
+            token1: params.token1,
+            maintenance: params.maintenance,
+            oracle: params.oracle
+        });
+        IMarginalV1Pool pool = getPool(poolKey);
+        if (address(pool) != position.pool) revert InvalidPoolKey();
+
+        margin = _freeMargin(
+            params.tokenId,
+            pool,
+            poolKey,
+            position.id,
+            params.marginOut,
+            params.recipient
+        );
+    }
+
+    /// @inheritdoc INonfungiblePositionManager
+    function freeById(
+        FreeByIdParams calldata params
+    ) external returns (uint256 margin) {
+        margin = _freeById(
+            params.tokenId,
+            params.marginOut,
+            params.recipient,
+            params.deadline
+        );
+    }
+
+    /// @notice Removes margin from the position associated with the NFT token id
+    /// @dev Shared by the ABI encoded and packed entry points
+    /// @param tokenId The NFT token id associated with the position
+    /// @param marginOut The amount of margin to remove
+    /// @param recipient The recipient of the margin removed
+    /// @param deadline The timestamp by which the transaction must be executed
+    /// @return margin The margin backing the position after removing margin
+    function _freeById(
+        uint256 tokenId,
+        uint128 marginOut,
+        address recipient,
+        uint256 deadline
+    )
+        private
+        onlyApprovedOrOwner(tokenId)
+        checkDeadline(deadline)
+        returns (uint256 margin)
+    {
+        Position memory position = _positions[tokenId];
+        IMarginalV1Pool pool = IMarginalV1Pool(position.pool);
+        margin = _freeMargin(
+            tokenId,
+            pool,
+            getPoolKey(pool),
+            position.id,
+            marginOut,
+            recipient
+        );
+    }
 
+    /// @notice Removes margin from the position on the pool
+    /// @param tokenId The NFT token id associated with the position
+    /// @param pool The pool the position is on
+    /// @param poolKey The pool key of the pool
+    /// @param id The position ID stored in the pool
+    /// @param marginOut The amount of margin to remove
+    /// @param recipient The recipient of the margin removed
+    /// @return margin The margin backing the position after removing margin
+    function _freeMargin(
+        uint256 tokenId,
+        IMarginalV1Pool pool,
+        PoolAddress.PoolKey memory poolKey,
+        uint96 id,
+        uint128 marginOut,
+        address recipient
+    ) private returns (uint256 margin) {
         (uint256 margin0, uint256 margin1) = adjust(
+            pool,
             AdjustParams({
-                token0: params.token0,
-                token1: params.token1,
-                maintenance: params.maintenance,
-                oracle: params.oracle,
-                recipient: params.recipient,
-                id: position.id,
-                marginDelta: -int128(params.marginOut)
+                token0: poolKey.token0,
+                token1: poolKey.token1,
+                maintenance: poolKey.maintenance,
+                oracle: poolKey.oracle,
+                recipient: recipient,
+                id: id,
+                marginDelta: -int128(marginOut)
             })
         );
         margin = margin0 > 0 ? margin0 : margin1;
 
-        emit Free(params.tokenId, msg.sender, params.recipient, margin);
+        emit Free(tokenId, msg.sender, recipient, margin);
     }
 
     /// @inheritdoc INonfungiblePositionManager
@@ -322,31 +672,243 @@ contract NonfungiblePositionManager is
         returns (uint256 amountIn, uint256 amountOut, uint256 rewards)
     {
         Position memory position = _positions[params.tokenId];
-        if (
-            address(
-                getPool(
-                    PoolAddress.PoolKey({
-                        token0: params.token0,
-                        token1: params.token1,
-                        maintenance: params.maintenance,
-                        oracle: params.oracle
-                    })
-                )
-            ) != position.pool
-        ) revert InvalidPoolKey();
+        PoolAddress.PoolKey memory poolKey = PoolAddress.PoolKey({
+            token0: params.token0,
+            token1: params.token1,
+            maintenance: params.maintenance,
+            oracle: params.oracle
+        });
+        IMarginalV1Pool pool = getPool(poolKey);
+        if (address(pool) != position.pool) revert InvalidPoolKey();
+
+        (amountIn, amountOut, rewards) = _burnPosition(
+            params.tokenId,
+            pool,
+            poolKey,
+            position.id,
+            params.recipient,
+            msg.sender
+        );
+
+        // any remaining ETH in the contract from payable return to sender
+        refundETH();
+    }
 
+    /// @inheritdoc INonfungiblePositionManager
+    function burnById(
+        BurnByIdParams calldata params
+    )
+        external
+        payable
+        returns (uint256 amountIn, uint256 amountOut, uint256 rewards)
+    {
+        (amountIn, amountOut, rewards) = _burnById(
+            params.tokenId,
+            params.recipient,
+            params.deadline
+        );
+    }
+
+    /// @notice Burns the position associated with the NFT token id, refunding any remaining ETH to sender
+    /// @dev Shared by the ABI encoded and packed entry points
+    /// @param tokenId The NFT token id associated with the position
+    /// @param recipient The recipient of the amounts out of the position
+    /// @param deadline The timestamp by which the transaction must be executed
+    /// @return amountIn The amount of debt token in used to settle position
+    /// @return amountOut The amount of margin token received after settling position
+    /// @return rewards The amount of escrowed liquidation rewards released by pool after settling position
+    function _burnById(
+        uint256 tokenId,
+        address recipient,
+        uint256 deadline
+    )
+        private
+        onlyApprovedOrOwner(tokenId)
+        checkDeadline(deadline)
+        returns (uint256 amountIn, uint256 amountOut, uint256 rewards)
+    {
+        Position memory position = _positions[tokenId];
+        IMarginalV1Pool pool = IMarginalV1Pool(position.pool);
+        (amountIn, amountOut, rewards) = _burnPosition(
+            tokenId,
+            pool,
+            getPoolKey(pool),
+            position.id,
+            recipient,
+            msg.sender
+        );
+
+        // any remaining ETH in the contract from payable return to sender
+        refundETH();
+    }
+
+    /// @inheritdoc INonfungiblePositionManager
+    function burnMany(
+        BurnParams[] calldata params
+    )
+        external
+        payable
+        returns (
+            uint256[] memory amountsIn,
+            uint256[] memory amountsOut,
+            uint256[] memory rewards
+        )
+    {
+        (
+            IMarginalV1Pool[] memory pools,
+            address[] memory tokens,
+            uint256[] memory debts,
+            uint256[] memory tokenIndices
+        ) = _getDebtsSynced(params);
+
+        // pull total debt owed across positions once per debt token, tracking the amount actually received
+        for (uint256 i = 0; i < tokens.length; i++) {
+            if (tokens[i] == address(0)) break;
+            uint256 balanceBefore = balance(tokens[i]);
+            pay(tokens[i], msg.sender, address(this), debts[i]);
+            debts[i] = balance(tokens[i]) - balanceBefore;
+        }
+
+        amountsIn = new uint256[](params.length);
+        amountsOut = new uint256[](params.length);
+        rewards = new uint256[](params.length);
+        for (uint256 i = 0; i < params.length; i++) {
+            BurnParams calldata param = params[i];
+            (amountsIn[i], amountsOut[i], rewards[i]) = _burnPosition(
+                param.tokenId,
+                pools[i],
+                PoolAddress.PoolKey({
+                    token0: param.token0,
+                    token1: param.token1,
+                    maintenance: param.maintenance,
+                    oracle: param.oracle
+                }),
+                _positions[param.tokenId].id,
+                param.recipient,
+                address(this)
+            );
+            if (amountsIn[i] > debts[tokenIndices[i]])
+                revert DebtGreaterThanMax(amountsIn[i]);
+            debts[tokenIndices[i]] -= amountsIn[i];
+        }
+
+        // return any excess debt tokens pulled to sender from tokens held, leaving excess ETH for refund below
+        for (uint256 i = 0; i < tokens.length; i++) {
+            if (tokens[i] == address(0)) break;
+            if (debts[i] > 0)
+                payFrom(tokens[i], address(this), msg.sender, debts[i]);
+        }
+
+        // any remaining ETH in the contract from payable return to sender
+        refundETH();
+    }
+
+    /// @notice Authorizes positions to burn and gets debts owed synced for funding, netted per debt token
+    /// @dev Pool and oracle state are read once per unique pool across positions
+    /// @param params The parameters for the positions to burn
+    /// @return pools The pools the positions are on
+    /// @return tokens The unique debt tokens owed, with unused trailing entries left as the zero address
+    /// @return debts The total debt owed in each of `tokens`
+    /// @return tokenIndices The index in `tokens` of the debt token for each position
+    function _getDebtsSynced(
+        BurnParams[] calldata params
+    )
+        private
+        view
+        returns (
+            IMarginalV1Pool[] memory pools,
+            address[] memory tokens,
+            uint256[] memory debts,
+            uint256[] memory tokenIndices
+        )
+    {
+        pools = new IMarginalV1Pool[](params.length);
+        tokens = new address[](params.length);
+        debts = new uint256[](params.length);
+        tokenIndices = new uint256[](params.length);
+
+        PoolStateSynced[] memory states = new PoolStateSynced[](
+            params.length
+        );
+        uint256 tokensLength;
+        for (uint256 i = 0; i < params.length; i++) {
+            BurnParams calldata param = params[i];
+            if (!_isApprovedOrOwner(msg.sender, param.tokenId))
+                revert Unauthorized();
+            require(_blockTimestamp() <= param.deadline, "Transaction too old");
+
+            Position memory position = _positions[param.tokenId];
+            pools[i] = getPool(
+                PoolAddress.PoolKey({
+                    token0: param.token0,
+                    token1: param.token1,
+                    maintenance: param.maintenance,
+                    oracle: param.oracle
+                })
+            );
+            if (address(pools[i]) != position.pool) revert InvalidPoolKey();
+
+            // reuse state from earlier entries on the same pool
+            uint256 k;
+            while (k < i && address(pools[k]) != address(pools[i])) k++;
+            states[i] = k < i
+                ? states[k]
+                : getPoolStateSynced(address(pools[i]));
+            PositionLibrary.Info memory info = getPositionInfoSynced(
+                position.pool,
+                address(this),
+                position.id,
+                states[i].blockTimestamp,
+                states[i].tickCumulative,
+                states[i].oracleTickCumulative
+            );
+
+            address token = info.zeroForOne ? param.token0 : param.token1;
+            uint256 j;
+            while (j < tokensLength && tokens[j] != token) j++;
+            if (j == tokensLength) {
+                tokens[j] = token;
+                tokensLength++;
+            }
+            debts[j] += info.zeroForOne ? info.debt0 : info.debt1;
+            tokenIndices[i] = j;
+        }
+    }
+
+    /// @notice Burns the token and settles the position on the pool via external payer
+    /// @param tokenId The NFT token id associated with the position
+    /// @param pool The pool the position is on
+    /// @param poolKey The pool key of the pool
+    /// @param id The position ID stored in the pool
+    /// @param recipient The recipient of the position size and margin
+    /// @param payer The payer of the position debt
+    /// @return amountIn The amount of debt token in used to settle position
+    /// @return amountOut The amount of margin token received after settling position
+    /// @return rewards The amount of escrowed liquidation rewards released by pool after settling position
+    function _burnPosition(
+        uint256 tokenId,
+        IMarginalV1Pool pool,
+        PoolAddress.PoolKey memory poolKey,
+        uint96 id,
+        address recipient,
+        address payer
+    ) private returns (uint256 amountIn, uint256 amountOut, uint256 rewards) {
         // @dev delete the position and burn token before settling on pool to avoid re-entrancy view issues
-        delete _positions[params.tokenId];
-        _burn(params.tokenId);
+        delete _positions[tokenId];
+        _burn(tokenId);
 
-        (int256 amount0, int256 amount1, uint256 rewards) = settle(
+        int256 amount0;
+        int256 amount1;
+        (amount0, amount1, rewards) = settle(
+            pool,
             SettleParams({
-                token0: params.token0,
-                token1: params.token1,
-                maintenance: params.maintenance,
-                oracle: params.oracle,
-                recipient: params.recipient,
-                id: position.id
+                token0: poolKey.token0,
+                token1: poolKey.token1,
+                maintenance: poolKey.maintenance,
+                oracle: poolKey.oracle,
+                recipient: recipient,
+                id: id,
+                payer: payer
             })
         );
         amountIn = amount0 > 0
@@ -357,15 +919,202 @@ contract NonfungiblePositionManager is
             : (amount1 < 0 ? uint256(-amount1) : 0);
 
         emit Burn(
-            params.tokenId,
+            tokenId,
             msg.sender,
-            params.recipient,
+            recipient,
             amountIn,
             amountOut,
             rewards
         );
     }
 
+    /// @inheritdoc INonfungiblePositionManager
+    function mintPacked()
+        external
+        payable
+        returns (
+            uint256 tokenId,
+            uint256 size,
+            uint256 debt,
+            uint256 margin,
+            uint256 fees,
+            uint256 rewards
+        )
+    {
+        MintParams memory params = PackedCalldata.decodeMintParams(
+            msg.data[4:]
+        );
+        require(_blockTimestamp() <= params.deadline, "Transaction too old");
+
+        (tokenId, size, debt, margin, fees, rewards) = _mintPosition(
+            params,
+            escrowRewards(1)
+        );
+
+        // refund any excess ETH from escrowed rewards to sender at end of function to avoid re-entrancy with fallback
+        refundETH();
+    }
+
+    /// @inheritdoc INonfungiblePositionManager
+    function lockPacked() external payable returns (uint256 margin) {
+        LockByIdParams memory params = PackedCalldata.decodeLockByIdParams(
+            msg.data[4:]
+        );
+        margin = _lockById(params.tokenId, params.marginIn, params.deadline);
+    }
+
+    /// @inheritdoc INonfungiblePositionManager
+    function freePacked() external returns (uint256 margin) {
+        FreeByIdParams memory params = PackedCalldata.decodeFreeByIdParams(
+            msg.data[4:]
+        );
+        margin = _freeById(
+            params.tokenId,
+            params.marginOut,
+            params.recipient,
+            params.deadline
+        );
+    }
+
+    /// @inheritdoc INonfungiblePositionManager
+    function burnPacked()
+        external
+        payable
+        returns (uint256 amountIn, uint256 amountOut, uint256 rewards)
+    {
+        BurnByIdParams memory params = PackedCalldata.decodeBurnByIdParams(
+            msg.data[4:]
+        );
+        (amountIn, amountOut, rewards) = _burnById(
+            params.tokenId,
+            params.recipient,
+            params.deadline
+        );
+    }
+
+    /// @inheritdoc INonfungiblePositionManager
+    function roll(
+        RollParams calldata params
+    )
+        external
+        payable
+        onlyApprovedOrOwner(params.tokenId)
+        checkDeadline(params.deadline)
+        returns (
+            uint256 size,
+            uint256 debt,
+            uint256 margin,
+            uint256 fees,
+            uint256 rewards
+        )
+    {
+        Position memory position = _positions[params.tokenId];
+        IMarginalV1Pool pool = IMarginalV1Pool(position.pool);
+        PoolAddress.PoolKey memory poolKey = getPoolKey(pool);
+
+        // settle to manager so size, margin and rewards released can be used to open new position
+        (int256 amount0, int256 amount1, ) = settle(
+            pool,
+            SettleParams({
+                token0: poolKey.token0,
+                token1: poolKey.token1,
+                maintenance: poolKey.maintenance,
+                oracle: poolKey.oracle,
+                recipient: address(this),
+                id: position.id,
+                payer: msg.sender
+            })
+        );
+        bool zeroForOne = amount0 > 0; // debt in token0 if long token1
+
+        // credit size and margin released to sender so open pays from it before pulling any remainder
+        address tokenOut = zeroForOne ? poolKey.token1 : poolKey.token0;
+        uint256 depositedBefore = deposits[msg.sender][tokenOut];
+        deposits[msg.sender][tokenOut] =
+            depositedBefore +
+            uint256(-(zeroForOne ? amount1 : amount0));
+
+        uint256 positionId;
+        (positionId, size, debt, margin, fees, rewards) = open(
+            pool,
+            _getOpenParamsForRoll(pool, poolKey, zeroForOne, params)
+        );
+        _positions[params.tokenId].id = uint96(positionId);
+
+        // send any released size and margin in excess of amount in to open, leaving prior deposits credited
+        uint256 deposited = deposits[msg.sender][tokenOut];
+        uint256 amountOut = deposited > depositedBefore
+            ? Math.min(deposited - depositedBefore, balance(tokenOut))
+            : 0;
+        if (amountOut > 0) {
+            deposits[msg.sender][tokenOut] = deposited - amountOut;
+            payFrom(tokenOut, address(this), params.recipient, amountOut);
+        }
+
+        // refund any excess ETH from released rewards to sender at end of function to avoid re-entrancy with fallback
+        refundETH();
+
+        emit Roll(
+            params.tokenId,
+            msg.sender,
+            params.recipient,
+            positionId,
+            size,
+            debt,
+            margin,
+            fees,
+            rewards
+        );
+    }
+
+    /// @notice Gets the parameters to open the new position with when rolling
+    /// @param pool The pool the position is on
+    /// @param poolKey The pool key of the pool
+    /// @param zeroForOne Whether the position is long token1 (true) or long token0 (false)
+    /// @param params The parameters for rolling the position
+    /// @return The parameters necessary to open the new position on the pool
+    function _getOpenParamsForRoll(
+        IMarginalV1Pool pool,
+        PoolAddress.PoolKey memory poolKey,
+        bool zeroForOne,
+        RollParams calldata params
+    ) private view returns (OpenParams memory) {
+        (uint160 sqrtPriceX96, , uint128 liquidity, , , , , ) = pool.state();
+        uint128 liquidityDelta = PositionAmounts.getLiquidityForSize(
+            liquidity,
+            sqrtPriceX96,
+            poolKey.maintenance,
+            zeroForOne,
+            params.sizeDesired
+        );
+
+        return
+            OpenParams({
+                token0: poolKey.token0,
+                token1: poolKey.token1,
+                maintenance: poolKey.maintenance,
+                oracle: poolKey.oracle,
+                recipient: address(this),
+                zeroForOne: zeroForOne,
+                liquidityDelta: liquidityDelta,
+                sqrtPriceLimitX96: params.sqrtPriceLimitX96 == 0
+                    ? (
+                        zeroForOne
+                            ? TickMath.MIN_SQRT_RATIO + 1
+                            : TickMath.MAX_SQRT_RATIO - 1
+                    )
+                    : params.sqrtPriceLimitX96,
+                margin: params.margin,
+                sizeMinimum: params.sizeMinimum,
+                debtMaximum: params.debtMaximum == 0
+                    ? type(uint128).max
+                    : params.debtMaximum,
+                amountInMaximum: params.amountInMaximum == 0
+                    ? type(uint256).max
+                    : params.amountInMaximum
+            });
+    }
+
     /// @inheritdoc INonfungiblePositionManager
     function ignite(
         IgniteParams calldata params
@@ -376,41 +1125,177 @@ contract NonfungiblePositionManager is
         returns (uint256 amountOut, uint256 rewards)
     {
         Position memory position = _positions[params.tokenId];
-        if (
-            address(
-                getPool(
-                    PoolAddress.PoolKey({
-                        token0: params.token0,
-                        token1: params.token1,
-                        maintenance: params.maintenance,
-                        oracle: params.oracle
-                    })
-                )
-            ) != position.pool
-        ) revert InvalidPoolKey();
+        PoolAddress.PoolKey memory poolKey = PoolAddress.PoolKey({
+            token0: params.token0,
+            token1: params.token1,
+            maintenance: params.maintenance,
+            oracle: params.oracle
+        });
+        IMarginalV1Pool pool = getPool(poolKey);
+        if (address(pool) != position.pool) revert InvalidPoolKey();
 
-        // @dev delete the position and burn token before settling on pool to avoid re-entrancy view issues
-        delete _positions[params.tokenId];
-        _burn(params.tokenId);
+        (amountOut, rewards) = _ignitePosition(
+            params.tokenId,
+            pool,
+            poolKey,
+            position.id,
+            params.amountOutMinimum,
+            params.recipient
+        );
+    }
 
-        (amountOut, rewards) = flash(
-            FlashParams({
+    /// @inheritdoc INonfungiblePositionManager
+    function igniteById(
+        IgniteByIdParams calldata params
+    )
+        external
+        onlyApprovedOrOwner(params.tokenId)
+        checkDeadline(params.deadline)
+        returns (uint256 amountOut, uint256 rewards)
+    {
+        Position memory position = _positions[params.tokenId];
+        IMarginalV1Pool pool = IMarginalV1Pool(position.pool);
+        (amountOut, rewards) = _ignitePosition(
+            params.tokenId,
+            pool,
+            getPoolKey(pool),
+            position.id,
+            params.amountOutMinimum,
+            params.recipient
+        );
+    }
+
+    /// @inheritdoc INonfungiblePositionManager
+    function igniteMany(
+        IgniteManyParams calldata params
+    )
+        external
+        checkDeadline(params.deadline)
+        returns (uint256 amountOut, uint256 rewards)
+    {
+        PoolAddress.PoolKey memory poolKey = PoolAddress.PoolKey({
+            token0: params.token0,
+            token1: params.token1,
+            maintenance: params.maintenance,
+            oracle: params.oracle
+        });
+        IMarginalV1Pool pool = getPool(poolKey);
+        uint96[] memory ids;
+        bool zeroForOne;
+        uint256 debt;
+        (ids, zeroForOne, debt, rewards) = _burnPositionsSynced(
+            pool,
+            params.tokenIds
+        );
+
+        amountOut = flashMany(
+            pool,
+            FlashManyParams({
                 token0: params.token0,
                 token1: params.token1,
                 maintenance: params.maintenance,
                 oracle: params.oracle,
                 recipient: params.recipient,
-                id: position.id,
+                ids: ids,
+                zeroForOne: zeroForOne,
+                debt: debt,
                 amountOutMinimum: params.amountOutMinimum
             })
         );
 
-        emit Ignite(
-            params.tokenId,
+        emit IgniteMany(
+            params.tokenIds,
             msg.sender,
             params.recipient,
             amountOut,
             rewards
         );
     }
+
+    /// @notice Burns the tokens for positions on the same pool and direction, getting total debts and rewards synced for funding
+    /// @dev Pool and oracle state are read once for all positions
+    /// @param pool The pool the positions are on
+    /// @param tokenIds The NFT token ids associated with the positions
+    /// @return ids The position IDs stored in the pool
+    /// @return zeroForOne Whether the positions are long token1 (true) or long token0 (false)
+    /// @return debt The total debt owed to the pool by the positions
+    /// @return rewards The total escrowed liquidation rewards released by pool after settling positions
+    function _burnPositionsSynced(
+        IMarginalV1Pool pool,
+        uint256[] calldata tokenIds
+    )
+        private
+        returns (
+            uint96[] memory ids,
+            bool zeroForOne,
+            uint256 debt,
+            uint256 rewards
+        )
+    {
+        PoolStateSynced memory state = getPoolStateSynced(address(pool));
+        ids = new uint96[](tokenIds.length);
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            uint256 tokenId = tokenIds[i];
+            if (!_isApprovedOrOwner(msg.sender, tokenId)) revert Unauthorized();
+
+            Position memory position = _positions[tokenId];
+            if (address(pool) != position.pool) revert InvalidPoolKey();
+
+            PositionLibrary.Info memory info = getPositionInfoSynced(
+                position.pool,
+                address(this),
+                position.id,
+                state.blockTimestamp,
+                state.tickCumulative,
+                state.oracleTickCumulative
+            );
+            if (i == 0) zeroForOne = info.zeroForOne;
+            if (info.zeroForOne != zeroForOne) revert InvalidDirection();
+
+            ids[i] = position.id;
+            debt += zeroForOne ? info.debt0 : info.debt1;
+            rewards += info.rewards;
+
+            // @dev delete the position and burn token before settling on pool to avoid re-entrancy view issues
+            delete _positions[tokenId];
+            _burn(tokenId);
+        }
+    }
+
+    /// @notice Burns the token and settles the position on the pool via swap through spot
+    /// @param tokenId The NFT token id associated with the position
+    /// @param pool The pool the position is on
+    /// @param poolKey The pool key of the pool
+    /// @param id The position ID stored in the pool
+    /// @param amountOutMinimum The minimum amount of margin token to receive after settling position
+    /// @param recipient The recipient of the margin token less debts repaid
+    /// @return amountOut The amount of margin token received after settling position
+    /// @return rewards The amount of escrowed liquidation rewards released by pool after settling position
+    function _ignitePosition(
+        uint256 tokenId,
+        IMarginalV1Pool pool,
+        PoolAddress.PoolKey memory poolKey,
+        uint96 id,
+        uint256 amountOutMinimum,
+        address recipient
+    ) private returns (uint256 amountOut, uint256 rewards) {
+        // @dev delete the position and burn token before settling on pool to avoid re-entrancy view issues
+        delete _positions[tokenId];
+        _burn(tokenId);
+
+        (amountOut, rewards) = flash(
+            pool,
+            FlashParams({
+                token0: poolKey.token0,
+                token1: poolKey.token1,
+                maintenance: poolKey.maintenance,
+                oracle: poolKey.oracle,
+                recipient: recipient,
+                id: id,
+                amountOutMinimum: amountOutMinimum
+            })
+        );
+
+        emit Ignite(tokenId, msg.sender, recipient, amountOut, rewards);
+    }
 }
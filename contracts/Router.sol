@@ -24,8 +24,10 @@ import {PeripheryImmutableState} from "./base/PeripheryImmutableState.sol";
 
 import {CallbackValidation} from "./libraries/CallbackValidation.sol";
 import {LiquidityAmounts} from "./libraries/LiquidityAmounts.sol";
+import {PackedCalldata} from "./libraries/PackedCalldata.sol";
 import {Path} from "./libraries/Path.sol";
 import {PoolAddress} from "./libraries/PoolAddress.sol";
+import {PoolConstants} from "./libraries/PoolConstants.sol";
 
 /// @title Marginal v1 router
 /// @notice Facilitates swaps and liquidity provision on Marginal v1 pools
@@ -46,7 +48,9 @@ contract Router is
     /// can never actually be this value
     uint256 private constant DEFAULT_AMOUNT_IN_CACHED = type(uint256).max;
 
-    /// @dev Transient storage variable used for returning the computed amount in for an exact output swap.
+    /// @dev Transient storage variable used for returning the computed amount in for a multihop exact output swap.
+    /// Pools only return their own deltas, so the amount in paid in the innermost callback frame cannot be propagated
+    /// back through the nested swap return values. Single hop exact output swaps use the swap return data instead
     uint256 private amountInCached = DEFAULT_AMOUNT_IN_CACHED;
 
     constructor(
@@ -97,15 +101,17 @@ contract Router is
             oracle
         );
 
-        (bool isExactInput, uint256 amountToPay) = amount0Delta > 0
+        // path is in the forward direction when the token owed to the pool is the first token in path,
+        // as for exact input swaps and exact output single swaps
+        (bool isForwardPath, uint256 amountToPay) = amount0Delta > 0
             ? (tokenIn < tokenOut, uint256(amount0Delta))
             : (tokenOut < tokenIn, uint256(amount1Delta));
-        if (isExactInput) {
-            pay(tokenIn, data.payer, msg.sender, amountToPay);
+        if (isForwardPath) {
+            payFrom(tokenIn, data.payer, msg.sender, amountToPay);
         } else {
             // either initiate the next swap or pay
             if (data.path.hasMultiplePools()) {
-                data.path = data.path.skipToken();
+                data.path = data.path.skipTokenInPlace(); // avoid copying remaining path on each nested hop
                 exactOutputInternal(amountToPay, msg.sender, 0, data);
             } else {
                 amountInCached = amountToPay;
@@ -166,26 +172,63 @@ contract Router is
         checkDeadline(params.deadline)
         returns (uint256 amountOut)
     {
-        amountOut = exactInputInternal(
-            params.amountIn,
+        amountOut = exactInputSingleInternal(
+            params.tokenIn,
+            params.tokenOut,
+            params.maintenance,
+            params.oracle,
             params.recipient,
-            params.sqrtPriceLimitX96,
+            params.amountIn,
+            params.amountOutMinimum,
+            params.sqrtPriceLimitX96
+        );
+    }
+
+    /// @dev Performs a single exact input swap paid for by sender, shared by the ABI encoded and packed entry points
+    function exactInputSingleInternal(
+        address tokenIn,
+        address tokenOut,
+        uint24 maintenance,
+        address oracle,
+        address recipient,
+        uint256 amountIn,
+        uint256 amountOutMinimum,
+        uint160 sqrtPriceLimitX96
+    ) private returns (uint256 amountOut) {
+        amountOut = exactInputInternal(
+            amountIn,
+            recipient,
+            sqrtPriceLimitX96,
             SwapCallbackData({
-                path: abi.encodePacked(
-                    params.tokenIn,
-                    params.maintenance,
-                    params.oracle,
-                    params.tokenOut
-                ),
+                path: abi.encodePacked(tokenIn, maintenance, oracle, tokenOut),
                 payer: msg.sender
             })
         );
-        require(amountOut >= params.amountOutMinimum, "Too little received");
+        require(amountOut >= amountOutMinimum, "Too little received");
     }
 
     /// @inheritdoc IRouter
     function exactInput(
-        ExactInputParams memory params
+        ExactInputParams calldata params
+    )
+        external
+        payable
+        override
+        checkDeadline(params.deadline)
+        returns (uint256 amountOut)
+    {
+        amountOut = exactInputMultihopInternal(
+            params.amountIn,
+            params.recipient,
+            msg.sender,
+            params.path
+        );
+        require(amountOut >= params.amountOutMinimum, "Too little received");
+    }
+
+    /// @inheritdoc IRouter
+    function exactInputSplit(
+        ExactInputSplitParams calldata params
     )
         external
         payable
@@ -193,18 +236,64 @@ contract Router is
         checkDeadline(params.deadline)
         returns (uint256 amountOut)
     {
-        address payer = msg.sender; // msg.sender pays for the first hop
+        uint256 amountIn;
+        for (uint256 i = 0; i < params.legs.length; i++) {
+            bytes calldata path = params.legs[i].path;
+            (address tokenIn, , , ) = path.decodePoolAt(0);
+            require(
+                tokenIn == params.tokenIn &&
+                    path.decodeLastToken() == params.tokenOut,
+                "Invalid path"
+            );
+            require(params.legs[i].amountIn > 0, "Invalid leg amount in");
+            amountIn += params.legs[i].amountIn;
+        }
+        require(amountIn == params.amountIn, "Invalid amount in");
+
+        // pull input once, wrapping ETH to WETH9 once if input is native, then pay every leg from this contract
+        uint256 balanceBefore = balance(params.tokenIn);
+        pay(params.tokenIn, msg.sender, address(this), amountIn);
+
+        for (uint256 i = 0; i < params.legs.length; i++) {
+            amountOut += exactInputMultihopInternal(
+                params.legs[i].amountIn,
+                params.recipient,
+                address(this),
+                params.legs[i].path
+            );
+        }
+        require(amountOut >= params.amountOutMinimum, "Too little received");
+
+        // return any input left unspent by legs filled only partially
+        uint256 amountLeft = balance(params.tokenIn) - balanceBefore;
+        if (amountLeft > 0)
+            payFrom(params.tokenIn, address(this), msg.sender, amountLeft);
+
+        // refund any excess ETH to sender at end of function to avoid re-entrancy with fallback
+        refundETH();
+    }
+
+    /// @dev Performs a multihop exact input swap, walking the calldata path with an offset cursor
+    function exactInputMultihopInternal(
+        uint256 amountIn,
+        address recipient,
+        address payer,
+        bytes calldata path
+    ) private returns (uint256 amountOut) {
+        uint256 offset;
 
         while (true) {
-            bool hasMultiplePools = params.path.hasMultiplePools();
+            bool hasMultiplePools = path.hasMultiplePoolsAt(offset);
 
             // the outputs of prior swaps become the inputs to subsequent ones
-            params.amountIn = exactInputInternal(
-                params.amountIn,
-                hasMultiplePools ? address(this) : params.recipient, // for intermediate swaps, this contract custodies
+            // @dev intermediate outputs cannot be sent straight to the next pool, since pools measure their balance
+            // immediately before the swap callback and only count tokens received within it as payment
+            amountIn = exactInputInternal(
+                amountIn,
+                hasMultiplePools ? address(this) : recipient, // for intermediate swaps, this contract custodies
                 0,
                 SwapCallbackData({
-                    path: params.path.getFirstPool(), // only the first pool in the path is necessary
+                    path: path.getPoolAt(offset), // only the current pool in the path is necessary
                     payer: payer
                 })
             );
@@ -212,26 +301,63 @@ contract Router is
             // decide whether to continue or terminate
             if (hasMultiplePools) {
                 payer = address(this); // at this point, the caller has paid
-                params.path = params.path.skipToken();
+                offset = Path.skipTokenAt(offset);
             } else {
-                amountOut = params.amountIn;
+                amountOut = amountIn;
                 break;
             }
         }
+    }
 
-        require(amountOut >= params.amountOutMinimum, "Too little received");
+    /// @inheritdoc IRouter
+    function exactInputSinglePacked()
+        external
+        payable
+        returns (uint256 amountOut)
+    {
+        ExactInputSingleParams memory params = PackedCalldata
+            .decodeExactInputSingleParams(msg.data[4:]);
+        require(_blockTimestamp() <= params.deadline, "Transaction too old");
+
+        amountOut = exactInputSingleInternal(
+            params.tokenIn,
+            params.tokenOut,
+            params.maintenance,
+            params.oracle,
+            params.recipient,
+            params.amountIn,
+            params.amountOutMinimum,
+            params.sqrtPriceLimitX96
+        );
     }
 
-    /// @dev Performs a single exact output swap
+    /// @inheritdoc IRouter
+    function exactInputPacked() external payable returns (uint256 amountOut) {
+        (
+            address recipient,
+            uint256 deadline,
+            uint256 amountIn,
+            uint256 amountOutMinimum,
+            bytes calldata path
+        ) = PackedCalldata.decodeExactInputParams(msg.data[4:]);
+        require(_blockTimestamp() <= deadline, "Transaction too old");
+
+        amountOut = exactInputMultihopInternal(
+            amountIn,
+            recipient,
+            msg.sender,
+            path
+        );
+        require(amountOut >= amountOutMinimum, "Too little received");
+    }
+
+    /// @dev Performs a single exact output swap along the first pool in the reversed path
     function exactOutputInternal(
         uint256 amountOut,
         address recipient,
         uint160 sqrtPriceLimitX96,
         SwapCallbackData memory data
     ) private returns (uint256 amountIn) {
-        // allow swapping to the router address with address 0
-        if (recipient == address(0)) recipient = address(this);
-
         (
             address tokenOut,
             address tokenIn,
@@ -239,26 +365,41 @@ contract Router is
             address oracle
         ) = data.path.decodeFirstPool();
 
-        bool zeroForOne = tokenIn < tokenOut;
+        amountIn = exactOutputSwapInternal(
+            amountOut,
+            recipient,
+            sqrtPriceLimitX96,
+            getPool(tokenIn, tokenOut, maintenance, oracle),
+            tokenIn < tokenOut,
+            abi.encode(data)
+        );
+    }
 
-        (int256 amount0Delta, int256 amount1Delta) = getPool(
-            tokenIn,
-            tokenOut,
-            maintenance,
-            oracle
-        ).swap(
-                recipient,
-                zeroForOne,
-                -amountOut.toInt256(),
-                sqrtPriceLimitX96 == 0
-                    ? (
-                        zeroForOne
-                            ? TickMath.MIN_SQRT_RATIO + 1
-                            : TickMath.MAX_SQRT_RATIO - 1
-                    )
-                    : sqrtPriceLimitX96,
-                abi.encode(data)
-            );
+    /// @dev Performs a single exact output swap on the given pool
+    function exactOutputSwapInternal(
+        uint256 amountOut,
+        address recipient,
+        uint160 sqrtPriceLimitX96,
+        IMarginalV1Pool pool,
+        bool zeroForOne,
+        bytes memory data
+    ) private returns (uint256 amountIn) {
+        // allow swapping to the router address with address 0
+        if (recipient == address(0)) recipient = address(this);
+
+        (int256 amount0Delta, int256 amount1Delta) = pool.swap(
+            recipient,
+            zeroForOne,
+            -amountOut.toInt256(),
+            sqrtPriceLimitX96 == 0
+                ? (
+                    zeroForOne
+                        ? TickMath.MIN_SQRT_RATIO + 1
+                        : TickMath.MAX_SQRT_RATIO - 1
+                )
+                : sqrtPriceLimitX96,
+            data
+        );
 
         uint256 amountOutReceived;
         (amountIn, amountOutReceived) = zeroForOne
@@ -273,6 +414,37 @@ contract Router is
         refundETH();
     }
 
+    /// @dev Performs a single hop exact output swap with path encoded in the forward direction, so the callback pays
+    /// directly and amount in is returned from the swap return data without caching
+    function exactOutputSingleInternal(
+        uint256 amountOut,
+        address recipient,
+        uint160 sqrtPriceLimitX96,
+        address tokenIn,
+        address tokenOut,
+        uint24 maintenance,
+        address oracle
+    ) private returns (uint256 amountIn) {
+        amountIn = exactOutputSwapInternal(
+            amountOut,
+            recipient,
+            sqrtPriceLimitX96,
+            getPool(tokenIn, tokenOut, maintenance, oracle),
+            tokenIn < tokenOut,
+            abi.encode(
+                SwapCallbackData({
+                    path: abi.encodePacked(
+                        tokenIn,
+                        maintenance,
+                        oracle,
+                        tokenOut
+                    ),
+                    payer: msg.sender
+                })
+            )
+        );
+    }
+
     /// @inheritdoc IRouter
     function exactOutputSingle(
         ExactOutputSingleParams calldata params
@@ -284,24 +456,16 @@ contract Router is
         returns (uint256 amountIn)
     {
         // avoid an SLOAD by using the swap return data
-        amountIn = exactOutputInternal(
+        amountIn = exactOutputSingleInternal(
             params.amountOut,
             params.recipient,
             params.sqrtPriceLimitX96,
-            SwapCallbackData({
-                path: abi.encodePacked(
-                    params.tokenOut,
-                    params.maintenance,
-                    params.oracle,
-                    params.tokenIn
-                ),
-                payer: msg.sender
-            })
+            params.tokenIn,
+            params.tokenOut,
+            params.maintenance,
+            params.oracle
         );
-
         require(amountIn <= params.amountInMaximum, "Too much requested");
-        // has to be reset even though we don't use it in the single hop case
-        amountInCached = DEFAULT_AMOUNT_IN_CACHED;
     }
 
     /// @inheritdoc IRouter
@@ -314,18 +478,37 @@ contract Router is
         checkDeadline(params.deadline)
         returns (uint256 amountIn)
     {
-        // it's okay that the payer is fixed to msg.sender here, as they're only paying for the "final" exact output
-        // swap, which happens first, and subsequent swaps are paid for within nested callback frames
-        exactOutputInternal(
-            params.amountOut,
-            params.recipient,
-            0,
-            SwapCallbackData({path: params.path, payer: msg.sender})
-        );
+        if (!params.path.hasMultiplePoolsAt(0)) {
+            (
+                address tokenOut,
+                address tokenIn,
+                uint24 maintenance,
+                address oracle
+            ) = params.path.decodePoolAt(0);
+            amountIn = exactOutputSingleInternal(
+                params.amountOut,
+                params.recipient,
+                0,
+                tokenIn,
+                tokenOut,
+                maintenance,
+                oracle
+            );
+        } else {
+            // it's okay that the payer is fixed to msg.sender here, as they're only paying for the "final" exact output
+            // swap, which happens first, and subsequent swaps are paid for within nested callback frames
+            exactOutputInternal(
+                params.amountOut,
+                params.recipient,
+                0,
+                SwapCallbackData({path: params.path, payer: msg.sender})
+            );
 
-        amountIn = amountInCached;
+            // amount in paid in innermost callback frame can only be returned through storage
+            amountIn = amountInCached;
+            amountInCached = DEFAULT_AMOUNT_IN_CACHED;
+        }
         require(amountIn <= params.amountInMaximum, "Too much requested");
-        amountInCached = DEFAULT_AMOUNT_IN_CACHED;
     }
 
     /// @inheritdoc IRouter
@@ -370,6 +553,115 @@ contract Router is
         emit IncreaseLiquidity(shares, liquidityDelta, amount0, amount1);
     }
 
+    /// @inheritdoc IRouter
+    function addLiquiditySingle(
+        AddLiquiditySingleParams calldata params
+    )
+        external
+        payable
+        checkDeadline(params.deadline)
+        returns (uint256 shares, uint256 amount0, uint256 amount1)
+    {
+        IMarginalV1Pool pool = getPool(
+            params.token0,
+            params.token1,
+            params.maintenance,
+            params.oracle
+        );
+        (
+            uint160 sqrtPriceX96,
+            ,
+            uint128 liquidity,
+            ,
+            ,
+            ,
+            ,
+            bool initialized
+        ) = pool.state();
+        require(initialized, "Pool not initialized");
+
+        (address tokenIn, address tokenOut) = params.zeroForOne
+            ? (params.token0, params.token1)
+            : (params.token1, params.token0);
+
+        // pull single token in once, then swap portion so remainder matches pool reserve ratio after swap
+        pay(tokenIn, msg.sender, address(this), params.amountIn);
+        uint256 amountSwap = LiquidityAmounts.getAmountSwapForSingle(
+            liquidity,
+            sqrtPriceX96,
+            params.zeroForOne,
+            params.amountIn,
+            PoolConstants.fee
+        );
+        require(
+            amountSwap > 0 && params.amountIn - amountSwap > 1,
+            "Amount in too small"
+        );
+        uint256 amountOut = exactInputInternal(
+            amountSwap,
+            address(this),
+            0,
+            SwapCallbackData({
+                path: abi.encodePacked(
+                    tokenIn,
+                    params.maintenance,
+                    params.oracle,
+                    tokenOut
+                ),
+                payer: address(this)
+            })
+        );
+
+        (uint256 amount0Desired, uint256 amount1Desired) = params.zeroForOne
+            ? (params.amountIn - amountSwap, amountOut)
+            : (amountOut, params.amountIn - amountSwap);
+        require(amountOut > 1, "Amount in too small");
+        (sqrtPriceX96, , , , , , , ) = pool.state();
+
+        // less one on amounts desired since pool rounds up amounts in on mint
+        uint128 liquidityDelta = LiquidityAmounts.getLiquidityForAmounts(
+            sqrtPriceX96,
+            amount0Desired - 1,
+            amount1Desired - 1
+        );
+
+        (shares, amount0, amount1) = mint(
+            MintParams({
+                token0: params.token0,
+                token1: params.token1,
+                maintenance: params.maintenance,
+                oracle: params.oracle,
+                recipient: params.recipient,
+                liquidityDelta: liquidityDelta,
+                amount0Min: 0,
+                amount1Min: 0
+            }),
+            address(this)
+        );
+        require(shares >= params.sharesMinimum, "Too little received");
+
+        // return any dust left from rounding to sender from tokens held, leaving excess ETH for refund below
+        if (amount0Desired > amount0)
+            payFrom(
+                params.token0,
+                address(this),
+                msg.sender,
+                amount0Desired - amount0
+            );
+        if (amount1Desired > amount1)
+            payFrom(
+                params.token1,
+                address(this),
+                msg.sender,
+                amount1Desired - amount1
+            );
+
+        // any remaining ETH in the contract from payable return to sender
+        refundETH();
+
+        emit IncreaseLiquidity(shares, liquidityDelta, amount0, amount1);
+    }
+
     /// @inheritdoc IRouter
     function removeLiquidity(
         RemoveLiquidityParams calldata params
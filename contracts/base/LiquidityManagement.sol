@@ -52,6 +52,23 @@ abstract contract LiquidityManagement is
         internal
         virtual
         returns (uint256 shares, uint256 amount0, uint256 amount1)
+    {
+        return mint(params, msg.sender);
+    }
+
+    /// @notice Mints liquidity on pool with amounts owed paid by the given payer
+    /// @param params The parameters necessary to mint liquidity on the pool
+    /// @param payer The payer of amounts owed to the pool, with this contract paying from its balance
+    /// @return shares The amount of LP token shares minted to recipient
+    /// @return amount0 The amount of token0 added to the pool reserves
+    /// @return amount1 The amount of token1 added to the pool reserves
+    function mint(
+        MintParams memory params,
+        address payer
+    )
+        internal
+        virtual
+        returns (uint256 shares, uint256 amount0, uint256 amount1)
     {
         PoolAddress.PoolKey memory poolKey = PoolAddress.PoolKey({
             token0: params.token0,
@@ -65,7 +82,7 @@ abstract contract LiquidityManagement is
             params.recipient,
             params.liquidityDelta,
             abi.encode(
-                LiquidityCallbackData({poolKey: poolKey, payer: msg.sender})
+                LiquidityCallbackData({poolKey: poolKey, payer: payer})
             )
         );
 
@@ -86,9 +103,19 @@ abstract contract LiquidityManagement is
         CallbackValidation.verifyCallback(factory, decoded.poolKey);
 
         if (amount0Owed > 0)
-            pay(decoded.poolKey.token0, decoded.payer, msg.sender, amount0Owed);
+            payFrom(
+                decoded.poolKey.token0,
+                decoded.payer,
+                msg.sender,
+                amount0Owed
+            );
         if (amount1Owed > 0)
-            pay(decoded.poolKey.token1, decoded.payer, msg.sender, amount1Owed);
+            payFrom(
+                decoded.poolKey.token1,
+                decoded.payer,
+                msg.sender,
+                amount1Owed
+            );
     }
 
     struct BurnParams {
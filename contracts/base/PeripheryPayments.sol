@@ -41,7 +41,7 @@ abstract contract PeripheryPayments is
         address token,
         uint256 amountMinimum,
         address recipient
-    ) public payable override {
+    ) public payable virtual override {
         uint256 balanceToken = IERC20(token).balanceOf(address(this));
         require(balanceToken >= amountMinimum, "Insufficient token");
 
@@ -95,6 +95,26 @@ abstract contract PeripheryPayments is
         }
     }
 
+    /// @notice Pays from tokens held by this contract if it is the payer, otherwise pulls from payer
+    /// @dev Tokens held are transferred directly rather than through `pay`, which would wrap any ETH sent with the
+    /// call again when the token is WETH9 and leave the WETH9 already held stranded in the contract
+    /// @param token The token to pay
+    /// @param payer The entity that must pay
+    /// @param recipient The entity that will receive payment
+    /// @param value The amount to pay
+    function payFrom(
+        address token,
+        address payer,
+        address recipient,
+        uint256 value
+    ) internal {
+        if (payer == address(this)) {
+            TransferHelper.safeTransfer(token, recipient, value);
+        } else {
+            pay(token, payer, recipient, value);
+        }
+    }
+
     /// @notice Balance of ERC20 token held by this contract
     /// @param token The token to check
     /// @return value The balance amount
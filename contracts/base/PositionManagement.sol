@@ -1,6 +1,8 @@
 // SPDX-License-Identifier: AGPL-3.0
 pragma solidity =0.8.15;
 
+import {Math} from "@openzeppelin/contracts/utils/math/Math.sol";
+
 import {TickMath} from "@uniswap/v3-core/contracts/libraries/TickMath.sol";
 import {IUniswapV3SwapCallback} from "@uniswap/v3-core/contracts/interfaces/callback/IUniswapV3SwapCallback.sol";
 import {IUniswapV3Pool} from "@uniswap/v3-core/contracts/interfaces/IUniswapV3Pool.sol";
@@ -30,8 +32,19 @@ abstract contract PositionManagement is
     struct PositionCallbackData {
         PoolAddress.PoolKey poolKey;
         address payer;
+        bool flash;
+    }
+
+    struct OracleSwapCallbackData {
+        PoolAddress.PoolKey poolKey;
+        bool settleMany;
+        address pool;
+        uint96[] ids;
     }
 
+    /// @dev Tokens deposited into the manager on purpose for each payer, spent first when paying pools on their behalf
+    mapping(address => mapping(address => uint256)) internal deposits;
+
     error SizeLessThanMin(uint256 size);
     error DebtGreaterThanMax(uint256 debt);
     error AmountInGreaterThanMax(uint256 amountIn);
@@ -45,6 +58,19 @@ abstract contract PositionManagement is
         return IMarginalV1Pool(PoolAddress.getAddress(factory, poolKey));
     }
 
+    /// @dev Returns the pool key for the given pool from the pool immutables
+    function getPoolKey(
+        IMarginalV1Pool pool
+    ) internal view returns (PoolAddress.PoolKey memory) {
+        return
+            PoolAddress.PoolKey({
+                token0: pool.token0(),
+                token1: pool.token1(),
+                maintenance: pool.maintenance(),
+                oracle: pool.oracle()
+            });
+    }
+
     struct OpenParams {
         address token0;
         address token1;
@@ -60,7 +86,26 @@ abstract contract PositionManagement is
         uint256 amountInMaximum;
     }
 
+    /// @notice Returns the rewards to escrow per opened position, checking the contract balance covers `count` positions
+    /// @param count The number of positions to be opened
+    /// @return rewards The rewards to escrow in each opened position
+    function escrowRewards(
+        uint256 count
+    ) internal view returns (uint256 rewards) {
+        rewards = PositionLibrary.liquidationRewards(
+            block.basefee,
+            PoolConstants.blockBaseFeeMin,
+            PoolConstants.gasLiquidate,
+            PoolConstants.rewardPremium
+        ); // deposited for liquidation reward escrow
+        // @dev use address(this).balance and not msg.value to avoid issues with multicall
+        uint256 rewardsTotal = rewards * count;
+        if (address(this).balance < rewardsTotal)
+            revert RewardsLessThanMin(rewardsTotal); // only send the min required
+    }
+
     /// @notice Opens a new position on pool
+    /// @param pool The pool for the pool key in params, already resolved by the caller
     /// @param params The parameters necessary to open the position on the pool
     /// @return id The position ID stored in the pool
     /// @return size The position size on the pool in the margin token
@@ -69,6 +114,7 @@ abstract contract PositionManagement is
     /// @return fees The fees paid in margin token to open the position on the pool
     /// @return rewards The rewards escrowed in opened position available to liquidators when position not safe
     function open(
+        IMarginalV1Pool pool,
         OpenParams memory params
     )
         internal
@@ -81,6 +127,35 @@ abstract contract PositionManagement is
             uint256 fees,
             uint256 rewards
         )
+    {
+        return open(pool, params, escrowRewards(1));
+    }
+
+    /// @notice Opens a new position on pool escrowing rewards already checked against the contract balance
+    /// @param pool The pool for the pool key in params, already resolved by the caller
+    /// @param params The parameters necessary to open the position on the pool
+    /// @param rewardsEscrowed The rewards to escrow in the opened position
+    /// @return id The position ID stored in the pool
+    /// @return size The position size on the pool in the margin token
+    /// @return debt The position debt owed to the pool in the non-margin token
+    /// @return margin The margin backing the position opened on the pool
+    /// @return fees The fees paid in margin token to open the position on the pool
+    /// @return rewards The rewards escrowed in opened position available to liquidators when position not safe
+    function open(
+        IMarginalV1Pool pool,
+        OpenParams memory params,
+        uint256 rewardsEscrowed
+    )
+        internal
+        virtual
+        returns (
+            uint256 id,
+            uint256 size,
+            uint256 debt,
+            uint256 margin,
+            uint256 fees,
+            uint256 rewards
+        )
     {
         PoolAddress.PoolKey memory poolKey = PoolAddress.PoolKey({
             token0: params.token0,
@@ -88,16 +163,7 @@ abstract contract PositionManagement is
             maintenance: params.maintenance,
             oracle: params.oracle
         });
-        IMarginalV1Pool pool = getPool(poolKey);
-
-        rewards = PositionLibrary.liquidationRewards(
-            block.basefee,
-            PoolConstants.blockBaseFeeMin,
-            PoolConstants.gasLiquidate,
-            PoolConstants.rewardPremium
-        ); // deposited for liquidation reward escrow
-        // @dev use address(this).balance and not msg.value to avoid issues with multicall
-        if (address(this).balance < rewards) revert RewardsLessThanMin(rewards); // only send the min required
+        rewards = rewardsEscrowed;
 
         uint256 amount0;
         uint256 amount1;
@@ -108,7 +174,11 @@ abstract contract PositionManagement is
             params.sqrtPriceLimitX96,
             params.margin,
             abi.encode(
-                PositionCallbackData({poolKey: poolKey, payer: msg.sender})
+                PositionCallbackData({
+                    poolKey: poolKey,
+                    payer: msg.sender,
+                    flash: false
+                })
             )
         );
         if (size < uint256(params.sizeMinimum)) revert SizeLessThanMin(size);
@@ -135,9 +205,19 @@ abstract contract PositionManagement is
         CallbackValidation.verifyCallback(factory, decoded.poolKey);
 
         if (amount0Owed > 0)
-            pay(decoded.poolKey.token0, decoded.payer, msg.sender, amount0Owed);
+            payOwed(
+                decoded.poolKey.token0,
+                decoded.payer,
+                msg.sender,
+                amount0Owed
+            );
         if (amount1Owed > 0)
-            pay(decoded.poolKey.token1, decoded.payer, msg.sender, amount1Owed);
+            payOwed(
+                decoded.poolKey.token1,
+                decoded.payer,
+                msg.sender,
+                amount1Owed
+            );
     }
 
     struct AdjustParams {
@@ -151,10 +231,12 @@ abstract contract PositionManagement is
     }
 
     /// @notice Adjusts margin backing position on pool
+    /// @param pool The pool for the pool key in params, already resolved by the caller
     /// @param params The parameters necessary to adjust the position on the pool
     /// @return margin0 The amount of token0 to be used as the new margin backing the position
     /// @return margin1 The amount of token1 to be used as the new margin backing the position
     function adjust(
+        IMarginalV1Pool pool,
         AdjustParams memory params
     ) internal virtual returns (uint256 margin0, uint256 margin1) {
         PoolAddress.PoolKey memory poolKey = PoolAddress.PoolKey({
@@ -163,7 +245,6 @@ abstract contract PositionManagement is
             maintenance: params.maintenance,
             oracle: params.oracle
         });
-        IMarginalV1Pool pool = getPool(poolKey);
 
         // manager receives flashed out margin and must handle delta in callback
         (margin0, margin1) = pool.adjust(
@@ -171,7 +252,11 @@ abstract contract PositionManagement is
             params.id,
             params.marginDelta,
             abi.encode(
-                PositionCallbackData({poolKey: poolKey, payer: msg.sender})
+                PositionCallbackData({
+                    poolKey: poolKey,
+                    payer: msg.sender,
+                    flash: false
+                })
             )
         );
 
@@ -194,28 +279,51 @@ abstract contract PositionManagement is
         );
         CallbackValidation.verifyCallback(factory, decoded.poolKey);
 
-        if (amount0Owed > 0) {
-            uint256 balance0 = balance(decoded.poolKey.token0);
-            if (amount0Owed > balance0)
-                pay(
-                    decoded.poolKey.token0,
-                    decoded.payer,
-                    address(this),
-                    amount0Owed - balance0
-                );
-            pay(decoded.poolKey.token0, address(this), msg.sender, amount0Owed);
-        }
-        if (amount1Owed > 0) {
-            uint256 balance1 = balance(decoded.poolKey.token1);
-            if (amount1Owed > balance1)
-                pay(
-                    decoded.poolKey.token1,
-                    decoded.payer,
-                    address(this),
-                    amount1Owed - balance1
-                );
-            pay(decoded.poolKey.token1, address(this), msg.sender, amount1Owed);
+        if (amount0Owed > 0)
+            payOwed(
+                decoded.poolKey.token0,
+                decoded.payer,
+                msg.sender,
+                amount0Owed
+            );
+        if (amount1Owed > 0)
+            payOwed(
+                decoded.poolKey.token1,
+                decoded.payer,
+                msg.sender,
+                amount1Owed
+            );
+    }
+
+    /// @notice Pays the amount owed to the pool from tokens the payer deposited into the manager first, then pulls the rest from payer
+    /// @dev Only amounts deposited on purpose for the payer are spent, i.e. size and margin released on roll or tokens pulled
+    /// in with Permit2 earlier in the same multicall. Any other balance held by the manager is never used, so ordinary opens
+    /// and adjusts are paid entirely by the payer
+    /// @param token The token owed to the pool
+    /// @param payer The entity that pays any amount owed in excess of its deposits
+    /// @param recipient The pool owed
+    /// @param amountOwed The amount owed to the pool
+    function payOwed(
+        address token,
+        address payer,
+        address recipient,
+        uint256 amountOwed
+    ) internal {
+        uint256 amountHeld = deposits[payer][token];
+        if (amountHeld > 0) {
+            // clamp to balance in case deposits were swept without being spent
+            amountHeld = Math.min(
+                Math.min(amountHeld, balance(token)),
+                amountOwed
+            );
+            deposits[payer][token] -= amountHeld;
+
+            // transfer held tokens directly so any native (gas) token held is not wrapped in their place
+            if (amountHeld > 0)
+                TransferHelper.safeTransfer(token, recipient, amountHeld);
         }
+        if (amountOwed > amountHeld)
+            pay(token, payer, recipient, amountOwed - amountHeld);
     }
 
     struct SettleParams {
@@ -225,15 +333,18 @@ abstract contract PositionManagement is
         address oracle;
         address recipient;
         uint96 id;
+        address payer;
     }
 
     /// @notice Settles a position on pool via external payer of debt
-    /// @dev Beware of re-entrancy issues given implicit ETH transfer at end of function
+    /// @dev If `params.payer` is this contract, debt is paid from tokens already held by the manager
+    /// @param pool The pool for the pool key in params, already resolved by the caller
     /// @param params The parameters necessary to settle the position on the pool
     /// @return amount0 The delta of the balance of token0 of the pool. Position debt into the pool (> 0) if long token1 (zeroForOne = true), or position size and margin out of the pool (< 0) if long token0 (zeroForOne = false)
     /// @return amount1 The delta of the balance of token1 of the pool. Position size and margin out of the pool (< 0) if long token1 (zeroForOne = true), or position debt into the pool (> 0) if long token0 (zeroForOne = false)
     /// @return rewards The amount of escrowed native (gas) token sent to `params.recipient`
     function settle(
+        IMarginalV1Pool pool,
         SettleParams memory params
     )
         internal
@@ -246,18 +357,18 @@ abstract contract PositionManagement is
             maintenance: params.maintenance,
             oracle: params.oracle
         });
-        IMarginalV1Pool pool = getPool(poolKey);
 
         (amount0, amount1, rewards) = pool.settle(
             params.recipient,
             params.id,
             abi.encode(
-                PositionCallbackData({poolKey: poolKey, payer: msg.sender})
+                PositionCallbackData({
+                    poolKey: poolKey,
+                    payer: params.payer,
+                    flash: false
+                })
             )
         );
-
-        // any remaining ETH in the contract from payable return to sender
-        refundETH();
     }
 
     struct FlashParams {
@@ -272,10 +383,12 @@ abstract contract PositionManagement is
 
     /// @notice Settles a position by repaying debt with portion of size swapped through spot
     /// @dev Beware of re-entrancy issues given implicit ETH transfer at end of function
+    /// @param pool The pool for the pool key in params, already resolved by the caller
     /// @param params The parameters necessary to flash settle the position on the pool
     /// @return amountOut The amount of margin token received from pool less debts repaid via swapping on spot
     /// @return rewards The amount of escrowed native (gas) token released by pool after flash settling the position
     function flash(
+        IMarginalV1Pool pool,
         FlashParams memory params
     ) internal virtual returns (uint256 amountOut, uint256 rewards) {
         PoolAddress.PoolKey memory poolKey = PoolAddress.PoolKey({
@@ -284,15 +397,21 @@ abstract contract PositionManagement is
             maintenance: params.maintenance,
             oracle: params.oracle
         });
-        IMarginalV1Pool pool = getPool(poolKey);
 
+        // @dev flash signals debt repaid via swap through spot in settle callback
         address payer = address(this);
         int256 amount0;
         int256 amount1;
         (amount0, amount1, rewards) = pool.settle(
             payer,
             params.id,
-            abi.encode(PositionCallbackData({poolKey: poolKey, payer: payer}))
+            abi.encode(
+                PositionCallbackData({
+                    poolKey: poolKey,
+                    payer: payer,
+                    flash: true
+                })
+            )
         );
 
         address tokenOut = amount0 < 0 ? params.token0 : params.token1;
@@ -306,6 +425,67 @@ abstract contract PositionManagement is
         if (params.recipient != address(this)) unwrapWETH9(0, params.recipient);
     }
 
+    struct FlashManyParams {
+        address token0;
+        address token1;
+        uint24 maintenance;
+        address oracle;
+        address recipient;
+        uint96[] ids;
+        bool zeroForOne;
+        uint256 debt;
+        uint256 amountOutMinimum;
+    }
+
+    /// @notice Settles multiple positions on the same pool and direction by repaying total debt with a portion of size swapped through spot once
+    /// @dev Total debt is flashed out of spot first, with each position settled from the manager balance in the swap callback
+    /// @param pool The pool for the pool key in params, already resolved by the caller
+    /// @param params The parameters necessary to flash settle the positions on the pool
+    /// @return amountOut The amount of margin token received from pool less debts repaid via swapping on spot
+    function flashMany(
+        IMarginalV1Pool pool,
+        FlashManyParams memory params
+    ) internal virtual returns (uint256 amountOut) {
+        PoolAddress.PoolKey memory poolKey = PoolAddress.PoolKey({
+            token0: params.token0,
+            token1: params.token1,
+            maintenance: params.maintenance,
+            oracle: params.oracle
+        });
+
+        // swap margin token in for exact total debt out through spot
+        bool zeroForOne = !params.zeroForOne; // owe 1 to marginal if true
+        IUniswapV3Pool(params.oracle).swap(
+            address(this),
+            zeroForOne,
+            -int256(params.debt),
+            (
+                zeroForOne
+                    ? TickMath.MIN_SQRT_RATIO + 1
+                    : TickMath.MAX_SQRT_RATIO - 1
+            ),
+            abi.encode(
+                OracleSwapCallbackData({
+                    poolKey: poolKey,
+                    settleMany: true,
+                    pool: address(pool),
+                    ids: params.ids
+                })
+            )
+        );
+
+        address tokenOut = params.zeroForOne ? params.token1 : params.token0;
+        amountOut = balance(tokenOut);
+
+        if (amountOut < params.amountOutMinimum)
+            revert AmountOutLessThanMin(amountOut);
+        if (amountOut > 0)
+            pay(tokenOut, address(this), params.recipient, amountOut);
+
+        // any remaining WETH in contract from liquidation rewards return as ETH
+        if (params.recipient != address(this)) unwrapWETH9(0, params.recipient);
+    }
+
     /// @inheritdoc IMarginalV1SettleCallback
     function marginalV1SettleCallback(
         int256 amount0Delta,
@@ -319,7 +499,7 @@ abstract contract PositionManagement is
         );
         CallbackValidation.verifyCallback(factory, decoded.poolKey);
 
-        if (decoded.payer == address(this)) {
+        if (decoded.flash) {
             // wrap ETH balance from liquidation rewards returned for possible use in settlement
             wrapETH();
 
@@ -334,19 +514,26 @@ abstract contract PositionManagement is
                         ? TickMath.MIN_SQRT_RATIO + 1
                         : TickMath.MAX_SQRT_RATIO - 1
                 ),
-                abi.encode(decoded.poolKey)
+                abi.encode(
+                    OracleSwapCallbackData({
+                        poolKey: decoded.poolKey,
+                        settleMany: false,
+                        pool: msg.sender,
+                        ids: new uint96[](0)
+                    })
+                )
             );
         } else {
-            // simply pay debt from external payer
+            // simply pay debt from external payer or from tokens already held by the manager
             if (amount0Delta > 0)
-                pay(
+                payFrom(
                     decoded.poolKey.token0,
                     decoded.payer,
                     msg.sender,
                     uint256(amount0Delta)
                 );
             if (amount1Delta > 0)
-                pay(
+                payFrom(
                     decoded.poolKey.token1,
                     decoded.payer,
                     msg.sender,
@@ -362,22 +549,43 @@ abstract contract PositionManagement is
         bytes calldata data
     ) external virtual {
         require(amount0Delta > 0 || amount1Delta > 0); // swaps entirely within 0-liquidity regions are not supported
-        PoolAddress.PoolKey memory poolKey = abi.decode(
+        OracleSwapCallbackData memory decoded = abi.decode(
             data,
-            (PoolAddress.PoolKey)
+            (OracleSwapCallbackData)
         );
-        CallbackValidation.verifyUniswapV3Callback(factory, poolKey);
+        CallbackValidation.verifyUniswapV3Callback(factory, decoded.poolKey);
+
+        // settle each position with debt flashed out of spot when flash settling many
+        // @dev pool in data is trusted since spot only calls back the manager that initiated the swap
+        if (decoded.settleMany) {
+            bytes memory settleData = abi.encode(
+                PositionCallbackData({
+                    poolKey: decoded.poolKey,
+                    payer: address(this),
+                    flash: false
+                })
+            );
+            for (uint256 i = 0; i < decoded.ids.length; i++)
+                IMarginalV1Pool(decoded.pool).settle(
+                    address(this),
+                    decoded.ids[i],
+                    settleData
+                );
+
+            // wrap ETH balance from liquidation rewards returned for possible use in repaying swap
+            wrapETH();
+        }
 
         if (amount0Delta > 0)
-            pay(
-                poolKey.token0,
+            payFrom(
+                decoded.poolKey.token0,
                 address(this),
                 msg.sender,
                 uint256(amount0Delta)
             );
         if (amount1Delta > 0)
-            pay(
-                poolKey.token1,
+            payFrom(
+                decoded.poolKey.token1,
                 address(this),
                 msg.sender,
                 uint256(amount1Delta)
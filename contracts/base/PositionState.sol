@@ -13,6 +13,25 @@ import {PositionHealth} from "../libraries/PositionHealth.sol";
 abstract contract PositionState {
     using PositionLibrary for PositionLibrary.Info;
 
+    struct PoolStateSynced {
+        uint32 blockTimestamp;
+        int56 tickCumulative;
+        int56 oracleTickCumulative;
+        int56 oracleTickCumulativeDelta;
+    }
+
+    struct PositionSynced {
+        bool zeroForOne;
+        uint128 size;
+        uint128 debt;
+        uint128 margin;
+        uint128 safeMarginMinimum;
+        bool liquidated;
+        bool safe;
+        uint256 rewards;
+        uint256 health;
+    }
+
     /// @notice Gets pool state synced for pool oracle updates
     /// @param pool The pool to get state of
     function getStateSynced(
@@ -78,6 +97,108 @@ abstract contract PositionState {
         );
     }
 
+    /// @notice Syncs pool state for pool oracle updates and external oracle tick cumulatives over [secondsAgo, 0] into `state`
+    /// @param pool The pool to sync state for
+    /// @param secondsAgo The seconds ago to average the oracle TWAP over to calculate position safety attributes
+    /// @param state The pool and oracle state to sync in place
+    function _syncPoolState(
+        address pool,
+        uint32 secondsAgo,
+        PoolStateSynced memory state
+    ) internal view {
+        (
+            ,
+            ,
+            ,
+            ,
+            state.blockTimestamp,
+            state.tickCumulative,
+            ,
+
+        ) = getStateSynced(pool);
+
+        int56[] memory oracleTickCumulatives = _getOracleSynced(
+            pool,
+            secondsAgo
+        );
+        state.oracleTickCumulative = oracleTickCumulatives[1]; // zero seconds ago
+        state.oracleTickCumulativeDelta = OracleLibrary
+            .oracleTickCumulativeDelta(
+                oracleTickCumulatives[0],
+                oracleTickCumulatives[1]
+            );
+    }
+
+    /// @notice Gets pool state synced for pool oracle updates and external oracle tick cumulatives over [PoolConstants.secondsAgo, 0]
+    /// @param pool The pool to get state for
+    function getPoolStateSynced(
+        address pool
+    ) internal view returns (PoolStateSynced memory state) {
+        _syncPoolState(pool, PoolConstants.secondsAgo, state);
+    }
+
+    /// @notice Gets the pool position info synced for funding given synced pool and oracle state
+    /// @dev Allows callers to sync multiple positions on the same pool against a single pool and oracle state read
+    /// @param pool The address of the pool position is on
+    /// @param recipient The recipient of the position at open
+    /// @param id The position id
+    /// @param blockTimestampLast The last synced Marginal v1 pool timestamp
+    /// @param tickCumulativeLast The last synced Marginal v1 pool tick cumulative
+    /// @param oracleTickCumulativeLast The last synced Uniswap v3 oracle pool tick cumulative
+    /// @return info The synced pool position info
+    function getPositionInfoSynced(
+        address pool,
+        address recipient,
+        uint96 id,
+        uint32 blockTimestampLast,
+        int56 tickCumulativeLast,
+        int56 oracleTickCumulativeLast
+    ) internal view returns (PositionLibrary.Info memory info) {
+        bytes32 key = keccak256(abi.encodePacked(recipient, id));
+        (
+            uint128 _size,
+            uint128 _debt0,
+            uint128 _debt1,
+            uint128 _insurance0,
+            uint128 _insurance1,
+            bool _zeroForOne,
+            bool _liquidated,
+            int24 _tick,
+            uint32 _blockTimestamp,
+            int56 _tickCumulativeDelta,
+            uint128 _margin,
+            uint128 _liquidityLocked,
+            uint256 _rewards
+        ) = IMarginalV1Pool(pool).positions(key);
+
+        info = PositionLibrary.Info({
+            size: _size,
+            debt0: _debt0,
+            debt1: _debt1,
+            insurance0: _insurance0,
+            insurance1: _insurance1,
+            zeroForOne: _zeroForOne,
+            liquidated: _liquidated,
+            tick: _tick,
+            blockTimestamp: _blockTimestamp,
+            tickCumulativeDelta: _tickCumulativeDelta,
+            margin: _margin,
+            liquidityLocked: _liquidityLocked,
+            rewards: _rewards
+        });
+
+        // sync if not settled or liquidated
+        if (info.size > 0) {
+            info.sync(
+                blockTimestampLast,
+                tickCumulativeLast,
+                oracleTickCumulativeLast,
+                PoolConstants.tickCumulativeRateMax,
+                PoolConstants.fundingPeriod
+            );
+        }
+    }
+
     /// @notice Calculates the minimum margin requirement for the position to remain safe from liquidation
     /// @dev c_y (safe) >= (1+M) * d_x * max(P, TWAP) - s_y when zeroForOne = true when no funding
     /// or c_x (safe) >= (1+M) * d_y / min(P, TWAP) - s_x when zeroForOne = false when no funding
@@ -132,6 +253,43 @@ abstract contract PositionState {
             uint256 health
         )
     {
+        PoolStateSynced memory state; // synced only if position not settled or liquidated
+        PositionSynced memory position = _getPositionSynced(
+            pool,
+            recipient,
+            id,
+            IMarginalV1Pool(pool).maintenance(),
+            state,
+            secondsAgo
+        );
+
+        zeroForOne = position.zeroForOne;
+        size = position.size;
+        debt = position.debt;
+        margin = position.margin;
+        safeMarginMinimum = position.safeMarginMinimum;
+        liquidated = position.liquidated;
+        safe = position.safe;
+        rewards = position.rewards;
+        health = position.health;
+    }
+
+    /// @notice Gets pool position synced for funding updates using oracle TWAP averaged over `secondsAgo`, given pool maintenance and state
+    /// @dev Syncs `state` in place if not yet synced so callers can reuse it across positions on the same pool
+    /// @param pool The pool the position is on
+    /// @param recipient The recipient of the position at open
+    /// @param id The position id
+    /// @param maintenance The minimum maintenance margin requirement of the pool
+    /// @param state The synced pool and oracle state, or empty if not yet synced
+    /// @param secondsAgo The seconds ago to average the oracle TWAP over to calculate position safety attributes
+    function _getPositionSynced(
+        address pool,
+        address recipient,
+        uint96 id,
+        uint24 maintenance,
+        PoolStateSynced memory state,
+        uint32 secondsAgo
+    ) internal view returns (PositionSynced memory position) {
         PositionLibrary.Info memory info;
         {
             bytes32 key = keccak256(abi.encodePacked(recipient, id));
@@ -142,102 +300,104 @@ abstract contract PositionState {
             uint32 _blockTimestamp;
             int56 _tickCumulativeDelta;
             (
-                size,
+                position.size,
                 _debt0,
                 _debt1,
                 ,
                 ,
-                zeroForOne,
-                liquidated,
+                position.zeroForOne,
+                position.liquidated,
                 _tick,
                 _blockTimestamp,
                 _tickCumulativeDelta,
-                margin,
+                position.margin,
                 ,
-                rewards
+                position.rewards
             ) = IMarginalV1Pool(pool).positions(key);
             info = PositionLibrary.Info({
-                size: size,
+                size: position.size,
                 debt0: _debt0,
                 debt1: _debt1,
                 insurance0: 0, // @dev irrelevant for sync
                 insurance1: 0,
-                zeroForOne: zeroForOne,
-                liquidated: liquidated,
+                zeroForOne: position.zeroForOne,
+                liquidated: position.liquidated,
                 tick: _tick,
                 blockTimestamp: _blockTimestamp,
                 tickCumulativeDelta: _tickCumulativeDelta,
-                margin: margin,
+                margin: position.margin,
                 liquidityLocked: 0, // @dev irrelevant for sync
-                rewards: rewards
+                rewards: position.rewards
             });
         }
 
-        uint24 maintenance = IMarginalV1Pool(pool).maintenance();
         uint128 marginMinimum = info.marginMinimum(maintenance);
         uint160 oracleSqrtPriceX96;
 
         // sync if not settled or liquidated
         if (info.size > 0) {
-            int56 oracleTickCumulativeDelta;
-            {
-                (
-                    ,
-                    ,
-                    ,
-                    ,
-                    uint32 blockTimestampLast,
-                    int56 tickCumulativeLast,
-                    ,
-
-                ) = getStateSynced(pool);
-
-                int56[] memory oracleTickCumulativesLast = _getOracleSynced(
-                    pool,
-                    secondsAgo
-                );
-                oracleTickCumulativeDelta = OracleLibrary
-                    .oracleTickCumulativeDelta(
-                        oracleTickCumulativesLast[0],
-                        oracleTickCumulativesLast[1]
-                    );
-
-                info.sync(
-                    blockTimestampLast,
-                    tickCumulativeLast,
-                    oracleTickCumulativesLast[1], // zero seconds ago
-                    PoolConstants.tickCumulativeRateMax,
-                    PoolConstants.fundingPeriod
-                );
-            }
+            if (state.blockTimestamp == 0)
+                _syncPoolState(pool, secondsAgo, state);
+
+            info.sync(
+                state.blockTimestamp,
+                state.tickCumulative,
+                state.oracleTickCumulative,
+                PoolConstants.tickCumulativeRateMax,
+                PoolConstants.fundingPeriod
+            );
 
             oracleSqrtPriceX96 = OracleLibrary.oracleSqrtPriceX96(
-                oracleTickCumulativeDelta,
+                state.oracleTickCumulativeDelta,
                 secondsAgo
             );
-            safe = info.safe(oracleSqrtPriceX96, maintenance);
-            safeMarginMinimum = _safeMarginMinimum(
+            position.safe = info.safe(oracleSqrtPriceX96, maintenance);
+            position.safeMarginMinimum = _safeMarginMinimum(
                 info,
                 marginMinimum,
                 maintenance,
-                oracleTickCumulativeDelta,
+                state.oracleTickCumulativeDelta,
                 secondsAgo
             );
         }
 
-        debt = zeroForOne ? info.debt0 : info.debt1;
-        health = oracleSqrtPriceX96 > 0
+        position.debt = position.zeroForOne ? info.debt0 : info.debt1;
+        position.health = oracleSqrtPriceX96 > 0
             ? PositionHealth.getHealthForPosition(
-                zeroForOne,
-                size,
-                debt,
-                margin,
+                position.zeroForOne,
+                position.size,
+                position.debt,
+                position.margin,
                 maintenance,
                 oracleSqrtPriceX96
             )
             : 0;
     }
 
+    /// @notice Gets pool position synced for funding updates, given pool maintenance and state
+    /// @dev Syncs `state` in place if not yet synced so callers can reuse it across positions on the same pool
+    /// @param pool The pool the position is on
+    /// @param recipient The recipient of the position at open
+    /// @param id The position id
+    /// @param maintenance The minimum maintenance margin requirement of the pool
+    /// @param state The synced pool and oracle state, or empty if not yet synced
+    function getPositionSynced(
+        address pool,
+        address recipient,
+        uint96 id,
+        uint24 maintenance,
+        PoolStateSynced memory state
+    ) internal view returns (PositionSynced memory position) {
+        position = _getPositionSynced(
+            pool,
+            recipient,
+            id,
+            maintenance,
+            state,
+            PoolConstants.secondsAgo
+        );
+    }
+
     /// @notice Gets pool position synced for funding updates
     /// @param pool The pool the position is on
     /// @param recipient The recipient of the position at open
@@ -0,0 +1,51 @@
+// SPDX-License-Identifier: GPL-2.0-or-later
+pragma solidity =0.8.15;
+
+import {ISelfPermit2} from "../interfaces/ISelfPermit2.sol";
+import {ISignatureTransfer} from "../interfaces/ISignatureTransfer.sol";
+
+/// @title Self permit2
+/// @notice Functionality to pull tokens into the contract with a Permit2 signature transfer
+/// @dev Allows approval and action to be bundled in a single multicall for tokens already approved on Permit2.
+/// Tokens are pulled into this contract rather than routed through `pay`, so that Permit2 signatures remain bound
+/// to this contract as spender. The amount pulled is credited to `msg.sender` with `creditDeposit`, so the inheriting
+/// contract pays pools on their behalf from it first, and any unused amount is returned with `sweepToken`
+abstract contract SelfPermit2 is ISelfPermit2 {
+    /// @notice The address of the Permit2 contract
+    address public immutable PERMIT2;
+
+    constructor(address _PERMIT2) {
+        PERMIT2 = _PERMIT2;
+    }
+
+    /// @inheritdoc ISelfPermit2
+    function selfPermit2TransferFrom(
+        ISignatureTransfer.PermitTransferFrom calldata permit,
+        bytes calldata signature
+    ) external payable override {
+        ISignatureTransfer(PERMIT2).permitTransferFrom(
+            permit,
+            ISignatureTransfer.SignatureTransferDetails({
+                to: address(this),
+                requestedAmount: permit.permitted.amount
+            }),
+            msg.sender,
+            signature
+        );
+        creditDeposit(
+            msg.sender,
+            permit.permitted.token,
+            permit.permitted.amount
+        );
+    }
+
+    /// @notice Credits tokens pulled into this contract to the payer, to be spent first when paying on their behalf
+    /// @param payer The entity the tokens were pulled from
+    /// @param token The token pulled
+    /// @param amount The amount of token pulled
+    function creditDeposit(
+        address payer,
+        address token,
+        uint256 amount
+    ) internal virtual;
+}
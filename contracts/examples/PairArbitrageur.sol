@@ -33,13 +33,6 @@ contract PairArbitrageur is
     PeripheryValidation,
     Multicall
 {
-    /// @dev Used as the placeholder value for sqrtPriceLimit1X96
-    uint160 private constant DEFAULT_SQRT_PRICE_LIMIT_X96_CACHED = 0;
-
-    /// @dev Transient storage variable used for returning the computed amount in for an exact output swap.
-    uint160 private sqrtPriceLimit1X96Cached =
-        DEFAULT_SQRT_PRICE_LIMIT_X96_CACHED;
-
     error PoolNotInitialized();
     error PoolInvalid();
     error ArbitrageNotAvailable();
@@ -53,6 +46,7 @@ contract PairArbitrageur is
     struct SwapCallbackData {
         bytes path;
         address payer;
+        uint160 sqrtPriceLimitX96; // limit on next pool swap initiated in callback
     }
 
     /// @inheritdoc IMarginalV1SwapCallback
@@ -103,19 +97,20 @@ contract PairArbitrageur is
                     oracle,
                     tokenOut_
                 ),
-                payer: data.payer
+                payer: data.payer,
+                sqrtPriceLimitX96: 0 // second swap initiates no further swaps
             });
             IUniswapV3Pool(oracle).swap(
                 data.payer,
                 zeroForOne,
                 amountSpecified,
-                sqrtPriceLimit1X96Cached == 0
+                data.sqrtPriceLimitX96 == 0
                     ? (
                         zeroForOne
                             ? TickMath.MIN_SQRT_RATIO + 1
                             : TickMath.MAX_SQRT_RATIO - 1
                     )
-                    : sqrtPriceLimit1X96Cached,
+                    : data.sqrtPriceLimitX96,
                 abi.encode(data_)
             );
             // pay Marginal pool for what is still owed
@@ -176,19 +171,20 @@ contract PairArbitrageur is
                     msg.sender, // oracle
                     tokenOut_ // tokenOut
                 ),
-                payer: data.payer
+                payer: data.payer,
+                sqrtPriceLimitX96: 0 // second swap initiates no further swaps
             });
             IMarginalV1Pool(pool).swap(
                 data.payer,
                 zeroForOne,
                 amountSpecified,
-                sqrtPriceLimit1X96Cached == 0
+                data.sqrtPriceLimitX96 == 0
                     ? (
                         zeroForOne
                             ? TickMath.MIN_SQRT_RATIO + 1
                             : TickMath.MAX_SQRT_RATIO - 1
                     )
-                    : sqrtPriceLimit1X96Cached,
+                    : data.sqrtPriceLimitX96,
                 abi.encode(data_)
             );
             // pay Marginal pool for what is still owed
@@ -253,9 +249,6 @@ contract PairArbitrageur is
             .slot0();
         uint128 oracleLiquidity = IUniswapV3Pool(params.oracle).liquidity();
 
-        // for access in callback
-        sqrtPriceLimit1X96Cached = params.sqrtPriceLimit1X96;
-
         // del y = ((L0 * L1) / (L0 + L1)) * (sqrtPrice1X96 - sqrtPrice0X96) is y amount to add to (> 0) or take out of (< 0)
         // or del x = ((L0 * L1) / (L0 + L1)) * (1 / sqrtPrice1X96 - 1 / sqrtPrice0X96) is x amount to add to (> 0) or take out of (< 0)
         // first pool and send to second pool for prices to align post arbitrage. Ignores fees and assumes x*y = L^2 for both pools
@@ -294,7 +287,8 @@ contract PairArbitrageur is
                     params.oracle,
                     zeroForOne ? params.token0 : params.token1 // tokenIn
                 ),
-                payer: address(this)
+                payer: address(this),
+                sqrtPriceLimitX96: params.sqrtPriceLimit1X96 // for second swap in callback
             });
             IMarginalV1Pool(pool).swap(
                 address(this),
@@ -338,7 +332,8 @@ contract PairArbitrageur is
                     params.oracle,
                     zeroForOne ? params.token0 : params.token1 // tokenIn
                 ),
-                payer: address(this)
+                payer: address(this),
+                sqrtPriceLimitX96: params.sqrtPriceLimit1X96 // for second swap in callback
             });
             IUniswapV3Pool(params.oracle).swap(
                 address(this),
@@ -355,9 +350,6 @@ contract PairArbitrageur is
             );
         }
 
-        // reset for next call to execute
-        sqrtPriceLimit1X96Cached = DEFAULT_SQRT_PRICE_LIMIT_X96_CACHED;
-
         // send profits to recipient
         amountOut = balance(params.tokenOut);
         if (amountOut < params.amountOutMinimum)
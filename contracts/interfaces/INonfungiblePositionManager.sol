@@ -42,6 +42,41 @@ interface INonfungiblePositionManager is IERC721Metadata {
             uint256 health
         );
 
+    struct PositionInfo {
+        address pool;
+        uint96 positionId;
+        bool zeroForOne;
+        uint128 size;
+        uint128 debt;
+        uint128 margin;
+        uint128 safeMarginMinimum;
+        bool liquidated;
+        bool safe;
+        uint256 rewards;
+        uint256 health;
+    }
+
+    /// @notice Returns details of multiple existing positions, reading pool and oracle state once per pool
+    /// @dev Do *NOT* use in callback. Vulnerable to re-entrancy view issues.
+    /// @param tokenIds The NFT token ids associated with the positions
+    /// @return infos The details of each position, with the same fields as returned by `positions`
+    function positionsBatch(
+        uint256[] calldata tokenIds
+    ) external view returns (PositionInfo[] memory infos);
+
+    /// @notice Returns a page of the token IDs owned by `owner`
+    /// @dev Order of token IDs is not preserved across transfers given swap and pop on removal
+    /// @param owner The address to get the owned token IDs of
+    /// @param cursor The index in the owner's list of token IDs to start the page at
+    /// @param limit The maximum number of token IDs to return
+    /// @return tokenIds The token IDs owned by `owner` from `cursor`
+    /// @return cursorNext The cursor to pass to get the next page, equal to the owner balance once all token IDs returned
+    function tokensOfOwner(
+        address owner,
+        uint256 cursor,
+        uint256 limit
+    ) external view returns (uint256[] memory tokenIds, uint256 cursorNext);
+
     struct MintParams {
         address token0;
         address token1;
@@ -81,6 +116,30 @@ interface INonfungiblePositionManager is IERC721Metadata {
             uint256 rewards
         );
 
+    /// @notice Creates many new positions wrapped in NFTs, escrowing liquidation rewards with a single balance check
+    /// @dev Rewards are computed once for the block, so send at least `params.length` times the rewards in native (gas) token.
+    /// Excess is refunded once at the end
+    /// @param params The parameters necessary to open each position, encoded as `MintParams[]` in calldata
+    /// @return tokenIds The IDs of the tokens that represent ownership of the positions
+    /// @return sizes The sizes of the positions in margin token
+    /// @return debts The debts of the positions in non-margin token
+    /// @return margins The amounts of margin token in used to open the positions
+    /// @return fees The amounts of fees in margin token paid to open the positions
+    /// @return rewards The amounts of liquidation rewards in native (gas) token escrowed in opened positions
+    function mintMany(
+        MintParams[] calldata params
+    )
+        external
+        payable
+        returns (
+            uint256[] memory tokenIds,
+            uint256[] memory sizes,
+            uint256[] memory debts,
+            uint256[] memory margins,
+            uint256[] memory fees,
+            uint256[] memory rewards
+        );
+
     struct LockParams {
         address token0;
         address token1;
@@ -98,6 +157,19 @@ interface INonfungiblePositionManager is IERC721Metadata {
         LockParams calldata params
     ) external payable returns (uint256 margin);
 
+    struct LockByIdParams {
+        uint256 tokenId;
+        uint128 marginIn;
+        uint256 deadline;
+    }
+
+    /// @notice Adds margin to an existing position, with pool read from the stored position
+    /// @param params The parameters necessary for adding margin to the position, encoded as `LockByIdParams` in calldata
+    /// @return margin The margin backing the position after calling lockById
+    function lockById(
+        LockByIdParams calldata params
+    ) external payable returns (uint256 margin);
+
     struct FreeParams {
         address token0;
         address token1;
@@ -114,6 +186,20 @@ interface INonfungiblePositionManager is IERC721Metadata {
     /// @return margin The margin backing the position after calling free
     function free(FreeParams calldata params) external returns (uint256 margin);
 
+    struct FreeByIdParams {
+        uint256 tokenId;
+        uint128 marginOut;
+        address recipient;
+        uint256 deadline;
+    }
+
+    /// @notice Removes margin from an existing position, with pool read from the stored position
+    /// @param params The parameters necessary for removing margin from the position, encoded as `FreeByIdParams` in calldata
+    /// @return margin The margin backing the position after calling freeById
+    function freeById(
+        FreeByIdParams calldata params
+    ) external returns (uint256 margin);
+
     struct BurnParams {
         address token0;
         address token1;
@@ -137,6 +223,108 @@ interface INonfungiblePositionManager is IERC721Metadata {
         payable
         returns (uint256 amountIn, uint256 amountOut, uint256 rewards);
 
+    struct BurnByIdParams {
+        uint256 tokenId;
+        address recipient;
+        uint256 deadline;
+    }
+
+    /// @notice Burns an existing position, settling on pool via external payer, with pool read from the stored position
+    /// @dev If a contract, `msg.sender` must implement a `receive()` function to receive any refunded excess debt payment in the native (gas) token from the manager.
+    /// @param params The parameters necessary for settling the position, encoded as `BurnByIdParams` in calldata
+    /// @return amountIn The amount of debt token in used to settle position
+    /// @return amountOut The amount of margin token received after settling position
+    /// @return rewards The amount of escrowed liquidation rewards in native (gas) token released by pool after settling position
+    function burnById(
+        BurnByIdParams calldata params
+    )
+        external
+        payable
+        returns (uint256 amountIn, uint256 amountOut, uint256 rewards);
+
+    /// @notice Burns multiple existing positions, settling on pools via external payer with debts netted per debt token
+    /// @dev Pulls the total debt owed in each debt token from `msg.sender` once then settles each position from the manager balance.
+    /// If a contract, `msg.sender` must implement a `receive()` function to receive any refunded excess debt payment in the native (gas) token from the manager.
+    /// @param params The parameters necessary for settling each position, encoded as `BurnParams[]` in calldata
+    /// @return amountsIn The amounts of debt token in used to settle each position
+    /// @return amountsOut The amounts of margin token received after settling each position
+    /// @return rewards The amounts of escrowed liquidation rewards in native (gas) token released by pools after settling each position
+    function burnMany(
+        BurnParams[] calldata params
+    )
+        external
+        payable
+        returns (
+            uint256[] memory amountsIn,
+            uint256[] memory amountsOut,
+            uint256[] memory rewards
+        );
+
+    /// @notice Mints a new position, opening on pool, with params tightly packed in calldata
+    /// @dev Params follow the function selector packed as token0 (20 bytes) | token1 (20) | maintenance (3) | oracle (20) | zeroForOne (1) | sizeDesired (16) | sizeMinimum (16) | debtMaximum (16) | amountInMaximum (16) | sqrtPriceLimitX96 (20) | margin (16) | recipient (20) | deadline (4).
+    /// See `mint` for return values.
+    function mintPacked()
+        external
+        payable
+        returns (
+            uint256 tokenId,
+            uint256 size,
+            uint256 debt,
+            uint256 margin,
+            uint256 fees,
+            uint256 rewards
+        );
+
+    /// @notice Adds margin to an existing position, with params tightly packed in calldata
+    /// @dev Params follow the function selector packed as tokenId (12 bytes) | marginIn (16) | deadline (4). See `lockById` for return values.
+    function lockPacked() external payable returns (uint256 margin);
+
+    /// @notice Removes margin from an existing position, with params tightly packed in calldata
+    /// @dev Params follow the function selector packed as tokenId (12 bytes) | marginOut (16) | recipient (20) | deadline (4). See `freeById` for return values.
+    function freePacked() external returns (uint256 margin);
+
+    /// @notice Burns an existing position, settling on pool via external payer, with params tightly packed in calldata
+    /// @dev Params follow the function selector packed as tokenId (12 bytes) | recipient (20) | deadline (4). See `burnById` for return values.
+    function burnPacked()
+        external
+        payable
+        returns (uint256 amountIn, uint256 amountOut, uint256 rewards);
+
+    struct RollParams {
+        uint256 tokenId;
+        uint128 sizeDesired;
+        uint128 sizeMinimum;
+        uint128 debtMaximum;
+        uint256 amountInMaximum;
+        uint160 sqrtPriceLimitX96;
+        uint128 margin;
+        address recipient;
+        uint256 deadline;
+    }
+
+    /// @notice Rolls an existing position, settling on pool then reopening on the same pool and direction with a new size and margin
+    /// @dev Debt is repaid in full by `msg.sender` on settle. Size and margin released on settle are spent first on the margin and fees for the
+    /// new position, so only the difference in the margin token is pulled from `msg.sender` or sent to `recipient`. The pool still receives
+    /// and releases the full amounts. Liquidation rewards released are escrowed for the new position with any excess refunded. If a contract, `msg.sender` must implement a `receive()` function to receive any refunded excess liquidation rewards in the native (gas) token from the manager.
+    /// @param params The parameters necessary for rolling the position, encoded as `RollParams` in calldata
+    /// @return size The new position size on the pool in the margin token
+    /// @return debt The new position debt owed to the pool in the non-margin token
+    /// @return margin The amount of margin token backing the new position
+    /// @return fees The amount of fees in margin token paid to open the new position
+    /// @return rewards The amount of liquidation rewards in native (gas) token escrowed in the new position
+    function roll(
+        RollParams calldata params
+    )
+        external
+        payable
+        returns (
+            uint256 size,
+            uint256 debt,
+            uint256 margin,
+            uint256 fees,
+            uint256 rewards
+        );
+
     struct IgniteParams {
         address token0;
         address token1;
@@ -156,4 +344,40 @@ interface INonfungiblePositionManager is IERC721Metadata {
     function ignite(
         IgniteParams calldata params
     ) external returns (uint256 amountOut, uint256 rewards);
+
+    struct IgniteByIdParams {
+        uint256 tokenId;
+        uint256 amountOutMinimum;
+        address recipient;
+        uint256 deadline;
+    }
+
+    /// @notice Burns an existing position, settling on pool via swap through spot, with pool read from the stored position
+    /// @dev If a contract, `recipient` must implement a `receive()` function to receive any excess liquidation rewards unused by the spot swap in the native (gas) token from the manager.
+    /// @param params The parameters necessary for settling the position, encoded as `IgniteByIdParams` in calldata
+    /// @return amountOut The amount of margin token received after settling position
+    /// @return rewards The amount of escrowed liquidation rewards in native (gas) token released by pool after settling position
+    function igniteById(
+        IgniteByIdParams calldata params
+    ) external returns (uint256 amountOut, uint256 rewards);
+
+    struct IgniteManyParams {
+        address token0;
+        address token1;
+        uint24 maintenance;
+        address oracle;
+        uint256[] tokenIds;
+        uint256 amountOutMinimum;
+        address recipient;
+        uint256 deadline;
+    }
+
+    /// @notice Burns multiple existing positions on the same pool and direction, settling on pool via a single swap through spot for the total debt
+    /// @dev If a contract, `recipient` must implement a `receive()` function to receive any excess liquidation rewards unused by the spot swap in the native (gas) token from the manager.
+    /// @param params The parameters necessary for settling the positions, encoded as `IgniteManyParams` in calldata
+    /// @return amountOut The total amount of margin token received after settling positions
+    /// @return rewards The total amount of escrowed liquidation rewards in native (gas) token released by pool after settling positions
+    function igniteMany(
+        IgniteManyParams calldata params
+    ) external returns (uint256 amountOut, uint256 rewards);
 }
@@ -7,6 +7,82 @@ import {IRouter} from "./IRouter.sol";
 /// @title The interface of the quoter for Marginal v1 pools
 /// @notice Quotes the result of leverage trades and swaps on Marginal v1 pools
 interface IQuoter {
+    enum ActionType {
+        Mint,
+        ExactInputSingle,
+        ExactOutputSingle,
+        AddLiquidity,
+        RemoveLiquidity,
+        Burn
+    }
+
+    struct Action {
+        ActionType actionType;
+        bytes data;
+    }
+
+    struct PoolState {
+        uint160 sqrtPriceX96;
+        uint128 liquidity;
+        uint128 liquidityLocked;
+        uint256 totalSupply;
+        uint8 feeProtocol;
+        int56 oracleTickCumulativeDelta;
+    }
+
+    struct PoolTier {
+        uint24 maintenance;
+        address oracle;
+    }
+
+    struct TierQuote {
+        address pool;
+        bool success;
+        uint256 amount;
+        uint128 liquidityAfter;
+        uint160 sqrtPriceX96After;
+    }
+
+    struct QuoteMintResult {
+        uint256 size;
+        uint256 debt;
+        uint256 margin;
+        uint256 safeMarginMinimum;
+        uint256 fees;
+        bool safe;
+        uint256 health;
+        uint128 liquidityAfter;
+        uint160 sqrtPriceX96After;
+        uint128 liquidityLockedAfter;
+    }
+
+    struct QuoteBurnResult {
+        uint256 amountIn;
+        uint256 amountOut;
+        uint256 rewards;
+        uint128 liquidityAfter;
+        uint160 sqrtPriceX96After;
+        uint128 liquidityLockedAfter;
+    }
+
+    struct QuoteBurnProjection {
+        uint32 blockTimestamp;
+        uint128 debt;
+        uint128 margin;
+        uint256 amountIn;
+        uint256 amountOut;
+        bool safe;
+        uint256 health;
+    }
+
+    struct QuoteIgniteResult {
+        uint256 amountOut;
+        uint256 rewards;
+        uint128 liquidityAfter;
+        uint160 sqrtPriceX96After;
+        uint128 liquidityLockedAfter;
+    }
+
     /// @notice Quotes the position result of NonfungiblePositionManager::mint
     /// @param params Param inputs to NonfungiblePositionManager::mint
     /// @dev Reverts if mint would revert
@@ -38,6 +114,52 @@ interface IQuoter {
             uint128 liquidityLockedAfter
         );
 
+    /// @notice Quotes the position result of NonfungiblePositionManager::mint given pool state
+    /// @dev Does not read from the pool nor check the deadline. Oracle tick cumulative delta is over
+    /// pool constant `secondsAgo`. Reverts if mint would revert for the given pool state
+    /// @param params Param inputs to NonfungiblePositionManager::mint
+    /// @param state The pool state to quote against
+    /// @return result The quoted mint result
+    function quoteMintWithState(
+        INonfungiblePositionManager.MintParams calldata params,
+        PoolState calldata state
+    ) external pure returns (QuoteMintResult memory result);
+
+    /// @notice Quotes the position results of multiple calls to NonfungiblePositionManager::mint
+    /// @dev Each mint is quoted independently against the current pool state, with pool state, locked liquidity
+    /// and oracle observations fetched only once per distinct pool. Reverts if any mint would revert
+    /// @param params Param inputs to NonfungiblePositionManager::mint for each position
+    /// @return results The quoted mint results in the same order as params
+    function quoteMintBatch(
+        INonfungiblePositionManager.MintParams[] calldata params
+    ) external view returns (QuoteMintResult[] memory results);
+
+    /// @notice Quotes the position results of NonfungiblePositionManager::mint for a ladder of desired sizes
+    /// @dev Each rung is quoted independently against a single snapshot of pool and oracle state,
+    /// using the template params with sizeDesired replaced. Reverts if mint would revert for any rung
+    /// @param params Template param inputs to NonfungiblePositionManager::mint
+    /// @param sizesDesired The desired position sizes for each rung of the ladder
+    /// @return results The quoted mint results in the same order as sizesDesired
+    function quoteMintLadder(
+        INonfungiblePositionManager.MintParams calldata params,
+        uint128[] calldata sizesDesired
+    ) external view returns (QuoteMintResult[] memory results);
+
+    /// @notice Quotes the position result of NonfungiblePositionManager::mint for a target leverage given margin
+    /// @dev Solves for sizeDesired = margin * (leverage - 1) with leverage = (size + margin) / margin,
+    /// ignoring params.sizeDesired. Reverts if mint would revert for the solved size
+    /// @param params Param inputs to NonfungiblePositionManager::mint with margin to back the position
+    /// @param leverage The target leverage of the position multiplied by 1e6
+    /// @return sizeDesired The desired position size solved for given margin and target leverage
+    /// @return result The quoted mint result for the solved size
+    function quoteMintForLeverage(
+        INonfungiblePositionManager.MintParams calldata params,
+        uint256 leverage
+    )
+        external
+        view
+        returns (uint128 sizeDesired, QuoteMintResult memory result);
+
     /// @notice Quotes the result of calling NonfungiblePositionManager::burn
     /// @param params Param inputs to NonfungiblePositionManager::burn
     /// @dev Reverts if burn would revert
@@ -61,6 +183,26 @@ interface IQuoter {
             uint128 liquidityLockedAfter
         );
 
+    /// @notice Quotes the results of multiple calls to NonfungiblePositionManager::burn
+    /// @dev Positions are grouped by pool, with pool state, locked liquidity and oracle observations
+    /// fetched only once per distinct pool. Reverts if any burn would revert
+    /// @param params Param inputs to NonfungiblePositionManager::burn for each position
+    /// @return results The quoted burn results in the same order as params
+    function quoteBurnBatch(
+        INonfungiblePositionManager.BurnParams[] calldata params
+    ) external view returns (QuoteBurnResult[] memory results);
+
+    /// @notice Quotes the result of calling NonfungiblePositionManager::burn at future times given funding accrued
+    /// @dev Extrapolates pool and oracle tick cumulatives assuming the current pool tick and oracle tick remain unchanged.
+    /// Safety and health are assessed at the current oracle TWAP. Reverts if position is not open
+    /// @param params Param inputs to NonfungiblePositionManager::burn
+    /// @param secondsAhead The seconds from now to quote the burn at for each projection
+    /// @return projections The debt, margin, amounts in and out, safety and health of the position at each time
+    function quoteBurnProjected(
+        INonfungiblePositionManager.BurnParams calldata params,
+        uint32[] calldata secondsAhead
+    ) external view returns (QuoteBurnProjection[] memory projections);
+
     /// @notice Quotes the result of calling NonfungiblePositionManager::ignite
     /// @param params Param inputs to NonfungiblePositionManager::ignite
     /// @dev Reverts if ignite would revert
@@ -82,6 +224,15 @@ interface IQuoter {
             uint128 liquidityLockedAfter
         );
 
+    /// @notice Quotes the results of multiple calls to NonfungiblePositionManager::ignite
+    /// @dev Positions are grouped by pool, with pool state, locked liquidity and oracle observations
+    /// fetched only once per distinct pool. Reverts if any ignite would revert
+    /// @param params Param inputs to NonfungiblePositionManager::ignite for each position
+    /// @return results The quoted ignite results in the same order as params
+    function quoteIgniteBatch(
+        INonfungiblePositionManager.IgniteParams[] calldata params
+    ) external view returns (QuoteIgniteResult[] memory results);
+
     /// @notice Quotes the amountOut result of Router::exactInputSingle
     /// @param params Param inputs to Router::exactInputSingle
     /// @dev Reverts if exactInputSingle would revert
@@ -99,6 +250,26 @@ interface IQuoter {
             uint160 sqrtPriceX96After
         );
 
+    /// @notice Quotes the amountOut result of Router::exactInputSingle given pool state
+    /// @dev Does not read from the pool nor check the deadline. Reverts if exactInputSingle would revert
+    /// for the given pool state
+    /// @param params Param inputs to Router::exactInputSingle
+    /// @param state The pool state to quote against
+    /// @return amountOut Amount of token received from pool after swap
+    /// @return liquidityAfter Pool liquidity after swap
+    /// @return sqrtPriceX96After Pool sqrt price after swap
+    function quoteExactInputSingleWithState(
+        IRouter.ExactInputSingleParams calldata params,
+        PoolState calldata state
+    )
+        external
+        pure
+        returns (
+            uint256 amountOut,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After
+        );
+
     /// @notice Quotes the amountOut result of Router::exactInput
     /// @param params Param inputs to Router::exactInput
     /// @dev Reverts if exactInput would revert
@@ -116,6 +287,46 @@ interface IQuoter {
             uint160[] memory sqrtPricesX96After
         );
 
+    /// @notice Quotes an exact input swap on each candidate pool tier of the token pair and returns the best
+    /// @dev Pools that have not been created, are not initialized or for which the swap would revert are skipped.
+    /// Reverts if no candidate pool can be quoted
+    /// @param tokenIn The token sent to the pool
+    /// @param tokenOut The token received from the pool
+    /// @param tiers The candidate maintenance and oracle keys of the pools
+    /// @param amountIn Amount of token sent to the pool for the swap
+    /// @return bestIndex The index in tiers of the pool giving the most amount out
+    /// @return quotes The pool and swap quote for each tier, with amount as the amount of token received from pool
+    function quoteExactInputBestTier(
+        address tokenIn,
+        address tokenOut,
+        PoolTier[] calldata tiers,
+        uint256 amountIn
+    ) external view returns (uint256 bestIndex, TierQuote[] memory quotes);
+
+    /// @notice Quotes the split of an exact input amount across candidate pool tiers of the token pair that maximizes the total amount out
+    /// @dev Split is computed in closed form by equalizing pool sqrt prices after the swap. Pools that have not been created or
+    /// are not initialized receive no input. Reverts if no candidate pool is initialized or a swap on a pool receiving input would revert
+    /// @param tokenIn The token sent to the pools
+    /// @param tokenOut The token received from the pools
+    /// @param tiers The candidate maintenance and oracle keys of the pools
+    /// @param amountIn Amount of token sent to the pools for the swaps in total
+    /// @return amountOut Amount of token received from the pools in total
+    /// @return amountsIn Amount of token to send to the pool for each tier
+    /// @return quotes The pool and swap quote for each tier, with amount as the amount of token received from pool
+    function quoteExactInputSplit(
+        address tokenIn,
+        address tokenOut,
+        PoolTier[] calldata tiers,
+        uint256 amountIn
+    )
+        external
+        view
+        returns (
+            uint256 amountOut,
+            uint256[] memory amountsIn,
+            TierQuote[] memory quotes
+        );
+
     /// @notice Quotes the amountIn result of Router::exactOutputSingle
     /// @param params Param inputs to Router::exactOutputSingle
     /// @dev Reverts if exactOutputSingle would revert
@@ -133,6 +344,26 @@ interface IQuoter {
             uint160 sqrtPriceX96After
         );
 
+    /// @notice Quotes the amountIn result of Router::exactOutputSingle given pool state
+    /// @dev Does not read from the pool nor check the deadline. Reverts if exactOutputSingle would revert
+    /// for the given pool state
+    /// @param params Param inputs to Router::exactOutputSingle
+    /// @param state The pool state to quote against
+    /// @return amountIn Amount of token sent to pool for swap
+    /// @return liquidityAfter Pool liquidity after swap
+    /// @return sqrtPriceX96After Pool sqrt price after swap
+    function quoteExactOutputSingleWithState(
+        IRouter.ExactOutputSingleParams calldata params,
+        PoolState calldata state
+    )
+        external
+        pure
+        returns (
+            uint256 amountIn,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After
+        );
+
     /// @notice Quotes the amountIn result of Router::exactOutput
     /// @param params Param inputs to Router::exactOutput
     /// @dev Reverts if exactOutput would revert
@@ -150,6 +381,22 @@ interface IQuoter {
             uint160[] memory sqrtPricesX96After
         );
 
+    /// @notice Quotes an exact output swap on each candidate pool tier of the token pair and returns the best
+    /// @dev Pools that have not been created, are not initialized or for which the swap would revert are skipped.
+    /// Reverts if no candidate pool can be quoted
+    /// @param tokenIn The token sent to the pool
+    /// @param tokenOut The token received from the pool
+    /// @param tiers The candidate maintenance and oracle keys of the pools
+    /// @param amountOut Amount of token received from the pool for the swap
+    /// @return bestIndex The index in tiers of the pool requiring the least amount in
+    /// @return quotes The pool and swap quote for each tier, with amount as the amount of token sent to pool
+    function quoteExactOutputBestTier(
+        address tokenIn,
+        address tokenOut,
+        PoolTier[] calldata tiers,
+        uint256 amountOut
+    ) external view returns (uint256 bestIndex, TierQuote[] memory quotes);
+
     /// @notice Quotes the amounts in result of Router::addLiquidity
     /// @param params Param inputs to Router::addLiquidity
     /// @dev Reverts if addLiquidity would revert
@@ -169,6 +416,28 @@ interface IQuoter {
             uint128 liquidityAfter
         );
 
+    /// @notice Quotes the amounts in result of Router::addLiquidity given pool state
+    /// @dev Does not read from the pool nor check the deadline. Reverts if addLiquidity would revert
+    /// for the given pool state
+    /// @param params Param inputs to Router::addLiquidity
+    /// @param state The pool state to quote against
+    /// @return shares Amount of lp token minted by pool
+    /// @return amount0 Amount of token0 sent to pool for adding liquidity
+    /// @return amount1 Amount of token1 sent to pool for adding liquidity
+    /// @return liquidityAfter Pool liquidity after adding liquidity
+    function quoteAddLiquidityWithState(
+        IRouter.AddLiquidityParams calldata params,
+        PoolState calldata state
+    )
+        external
+        pure
+        returns (
+            uint256 shares,
+            uint256 amount0,
+            uint256 amount1,
+            uint128 liquidityAfter
+        );
+
     /// @notice Quotes the amounts in result of Router::removeLiquidity
     /// @param params Param inputs to Router::removeLiquidity
     /// @dev Reverts if removeLiquidity would revert
@@ -187,4 +456,36 @@ interface IQuoter {
             uint256 amount1,
             uint128 liquidityAfter
         );
+
+    /// @notice Quotes the amounts in result of Router::removeLiquidity given pool state
+    /// @dev Does not read from the pool nor check the deadline. Reverts if removeLiquidity would revert
+    /// for the given pool state
+    /// @param params Param inputs to Router::removeLiquidity
+    /// @param state The pool state to quote against
+    /// @return liquidityDelta Amount of liquidity removed from pool
+    /// @return amount0 Amount of token0 received from pool for removing liquidity
+    /// @return amount1 Amount of token1 received from pool for removing liquidity
+    /// @return liquidityAfter Pool liquidity after removing liquidity
+    function quoteRemoveLiquidityWithState(
+        IRouter.RemoveLiquidityParams calldata params,
+        PoolState calldata state
+    )
+        external
+        pure
+        returns (
+            uint128 liquidityDelta,
+            uint256 amount0,
+            uint256 amount1,
+            uint128 liquidityAfter
+        );
+
+    /// @notice Quotes the results of an ordered list of actions, applying each result to the pool state before quoting the next
+    /// @dev Action data is the abi encoded param inputs to the associated NonfungiblePositionManager or Router function.
+    /// Results are abi encoded in the same order as returned by the associated quote function. Only positions existing
+    /// on the pool prior to the simulation can be burned. Reverts if any action would revert
+    /// @param actions The actions to simulate in order
+    /// @return results The abi encoded quoted results for each action
+    function quoteActions(
+        Action[] calldata actions
+    ) external view returns (bytes[] memory results);
 }
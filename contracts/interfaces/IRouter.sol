@@ -52,6 +52,45 @@ interface IRouter {
         ExactInputParams calldata params
     ) external payable returns (uint256 amountOut);
 
+    struct ExactInputSplitLeg {
+        bytes path;
+        uint256 amountIn;
+    }
+
+    struct ExactInputSplitParams {
+        address tokenIn;
+        address tokenOut;
+        ExactInputSplitLeg[] legs;
+        address recipient;
+        uint256 deadline;
+        uint256 amountIn;
+        uint256 amountOutMinimum;
+    }
+
+    /// @notice Swaps `amountIn` of one token for as much as possible of another split across multiple paths
+    /// @dev Input is pulled from the payer once, or wrapped once from ETH sent if token in is WETH9, then each leg
+    /// is paid from this contract. Leg amounts in must be nonzero and sum to `amountIn`. Any input left unspent by a leg
+    /// filled only partially is returned to `msg.sender`, as is any ETH sent in excess of `amountIn`. If a contract,
+    /// `msg.sender` must implement a `receive()` function to receive the refunded ETH
+    /// @param params The parameters necessary for the split swap, encoded as `ExactInputSplitParams` in calldata
+    /// @return amountOut The total amount of the received token across all legs
+    function exactInputSplit(
+        ExactInputSplitParams calldata params
+    ) external payable returns (uint256 amountOut);
+
+    /// @notice Swaps `amountIn` of one token for as much as possible of another token, with params tightly packed in calldata
+    /// @dev Params follow the function selector packed as tokenIn (20 bytes) | tokenOut (20) | maintenance (3) | oracle (20) | recipient (20) | deadline (4) | amountIn (16) | amountOutMinimum (16) | sqrtPriceLimitX96 (20)
+    /// @return amountOut The amount of the received token
+    function exactInputSinglePacked()
+        external
+        payable
+        returns (uint256 amountOut);
+
+    /// @notice Swaps `amountIn` of one token for as much as possible of another along the specified path, with params tightly packed in calldata
+    /// @dev Params follow the function selector packed as recipient (20 bytes) | deadline (4) | amountIn (16) | amountOutMinimum (16) | path (remaining)
+    /// @return amountOut The amount of the received token
+    function exactInputPacked() external payable returns (uint256 amountOut);
+
     struct ExactOutputSingleParams {
         address tokenIn;
         address tokenOut;
@@ -114,6 +153,33 @@ interface IRouter {
         uint256 deadline;
     }
 
+    /// @notice Adds liquidity from a single token, swapping the portion needed for the remainder to match the pool
+    /// reserve ratio before minting on pool
+    /// @dev Any dust left from rounding is returned to the sender, and any ETH sent in excess of `amountIn` is refunded.
+    /// Reverts if `amountIn` is too small to leave a non-trivial amount of both tokens after the swap
+    /// @param params The parameters necessary for adding liquidity, encoded as `AddLiquiditySingleParams` in calldata
+    /// @return shares The amount of shares minted
+    /// @return amount0 The amount of token0 added to pool reserves on mint
+    /// @return amount1 The amount of token1 added to pool reserves on mint
+    function addLiquiditySingle(
+        AddLiquiditySingleParams calldata params
+    )
+        external
+        payable
+        returns (uint256 shares, uint256 amount0, uint256 amount1);
+
+    struct AddLiquiditySingleParams {
+        address token0;
+        address token1;
+        uint24 maintenance;
+        address oracle;
+        address recipient;
+        bool zeroForOne; // single token in is token0 if true, otherwise token1
+        uint256 amountIn;
+        uint256 sharesMinimum;
+        uint256 deadline;
+    }
+
     /// @notice Removes liquidity, burning on pool
     /// @param params The parameters necessary for removing liquidity, encoded as `RemoveLiquidityParams` in calldata
     /// @return liquidityDelta The amount of liquidity removed
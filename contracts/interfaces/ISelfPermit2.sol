@@ -0,0 +1,20 @@
+// SPDX-License-Identifier: GPL-2.0-or-later
+pragma solidity >=0.7.5;
+pragma abicoder v2;
+
+import {ISignatureTransfer} from "./ISignatureTransfer.sol";
+
+/// @title Self permit2
+/// @notice Functionality to pull tokens into the contract with a Permit2 signature transfer
+interface ISelfPermit2 {
+    /// @notice Transfers the permitted token amount from `msg.sender` to this contract using a Permit2 signature
+    /// @dev Tokens pulled are credited to `msg.sender` and used first to pay pools on their behalf in subsequent calls
+    /// within the same multicall. Any amount left unused should be returned with `sweepToken` in the same multicall,
+    /// which also clears the credit
+    /// @param permit The permit data signed over by `msg.sender`, with this contract as spender
+    /// @param signature The signature of `msg.sender` over the permit data
+    function selfPermit2TransferFrom(
+        ISignatureTransfer.PermitTransferFrom calldata permit,
+        bytes calldata signature
+    ) external payable;
+}
@@ -5,13 +5,17 @@ import {Math} from "@openzeppelin/contracts/utils/math/Math.sol";
 
 import {Multicall} from "@uniswap/v3-periphery/contracts/base/Multicall.sol";
 import {PeripheryValidation} from "@uniswap/v3-periphery/contracts/base/PeripheryValidation.sol";
+import {SwapMath as UniswapV3SwapMath} from "@uniswap/v3-core/contracts/libraries/SwapMath.sol";
 import {TickMath} from "@uniswap/v3-core/contracts/libraries/TickMath.sol";
+import {IUniswapV3Pool} from "@uniswap/v3-core/contracts/interfaces/IUniswapV3Pool.sol";
 
+import {FixedPoint96} from "@marginal/v1-core/contracts/libraries/FixedPoint96.sol";
 import {LiquidityMath} from "@marginal/v1-core/contracts/libraries/LiquidityMath.sol";
 import {Position as PositionLibrary} from "@marginal/v1-core/contracts/libraries/Position.sol";
 import {OracleLibrary} from "@marginal/v1-core/contracts/libraries/OracleLibrary.sol";
 import {SwapMath} from "@marginal/v1-core/contracts/libraries/SwapMath.sol";
 import {SqrtPriceMath} from "@marginal/v1-core/contracts/libraries/SqrtPriceMath.sol";
+import {IMarginalV1Factory} from "@marginal/v1-core/contracts/interfaces/IMarginalV1Factory.sol";
 import {IMarginalV1Pool} from "@marginal/v1-core/contracts/interfaces/IMarginalV1Pool.sol";
 
 import {LiquidityAmounts} from "../libraries/LiquidityAmounts.sol";
@@ -40,6 +44,7 @@ contract Quoter is
     using Path for bytes;
 
     INonfungiblePositionManager public immutable manager;
+    /// @dev Optional fallback for oracle swap quotes crossing a tick boundary. Zero address if not set
     IUniswapV3StaticQuoter public immutable uniswapV3Quoter;
 
     constructor(
@@ -59,6 +64,30 @@ contract Quoter is
         return IMarginalV1Pool(PoolAddress.getAddress(factory, poolKey));
     }
 
+    /// @dev Pool state cached across quotes on the same pool
+    struct PoolSnapshot {
+        address pool;
+        uint160 sqrtPriceX96;
+        uint128 liquidity;
+        int24 tick;
+        uint32 blockTimestamp;
+        int56 tickCumulative;
+        uint8 feeProtocol;
+        bool initialized;
+        uint128 liquidityLocked;
+        uint256 totalSupply;
+        bool totalSupplySynced;
+        int56 oracleTickCumulative;
+        int56 oracleTickCumulativeDelta;
+    }
+
+    /// @dev Pool state snapshots cached by pool key hash
+    struct PoolSnapshotCache {
+        bytes32[] keys;
+        PoolSnapshot[] snapshots;
+        uint256 length;
+    }
+
     /// @inheritdoc IQuoter
     function quoteMint(
         INonfungiblePositionManager.MintParams calldata params
@@ -87,29 +116,217 @@ contract Quoter is
                 oracle: params.oracle
             })
         );
+        QuoteMintResult memory result = _quoteMint(
+            params,
+            _getPoolSnapshot(pool)
+        );
+
+        size = result.size;
+        debt = result.debt;
+        margin = result.margin;
+        safeMarginMinimum = result.safeMarginMinimum;
+        fees = result.fees;
+        safe = result.safe;
+        health = result.health;
+        liquidityAfter = result.liquidityAfter;
+        sqrtPriceX96After = result.sqrtPriceX96After;
+        liquidityLockedAfter = result.liquidityLockedAfter;
+    }
+
+    /// @inheritdoc IQuoter
+    function quoteMintBatch(
+        INonfungiblePositionManager.MintParams[] calldata params
+    ) external view returns (QuoteMintResult[] memory results) {
+        results = new QuoteMintResult[](params.length);
+
+        // cache pool snapshots by pool key so each distinct pool is only read once
+        PoolSnapshotCache memory cache = _createPoolSnapshotCache(
+            params.length
+        );
+
+        for (uint256 i = 0; i < params.length; i++) {
+            if (_blockTimestamp() > params[i].deadline)
+                revert("Transaction too old");
+
+            PoolSnapshot memory snapshot = _getPoolSnapshotCached(
+                PoolAddress.PoolKey({
+                    token0: params[i].token0,
+                    token1: params[i].token1,
+                    maintenance: params[i].maintenance,
+                    oracle: params[i].oracle
+                }),
+                cache
+            );
+
+            results[i] = _quoteMint(params[i], snapshot);
+        }
+    }
+
+    /// @inheritdoc IQuoter
+    function quoteMintLadder(
+        INonfungiblePositionManager.MintParams calldata params,
+        uint128[] calldata sizesDesired
+    )
+        external
+        view
+        checkDeadline(params.deadline)
+        returns (QuoteMintResult[] memory results)
+    {
+        PoolSnapshot memory snapshot = _getPoolSnapshot(
+            getPool(
+                PoolAddress.PoolKey({
+                    token0: params.token0,
+                    token1: params.token1,
+                    maintenance: params.maintenance,
+                    oracle: params.oracle
+                })
+            )
+        );
+
+        results = new QuoteMintResult[](sizesDesired.length);
+        INonfungiblePositionManager.MintParams memory _params = params;
+        for (uint256 i = 0; i < sizesDesired.length; i++) {
+            _params.sizeDesired = sizesDesired[i];
+            results[i] = _quoteMint(_params, snapshot);
+        }
+    }
+
+    /// @inheritdoc IQuoter
+    function quoteMintForLeverage(
+        INonfungiblePositionManager.MintParams calldata params,
+        uint256 leverage
+    )
+        external
+        view
+        checkDeadline(params.deadline)
+        returns (uint128 sizeDesired, QuoteMintResult memory result)
+    {
+        // leverage = (size + margin) / margin
+        if (leverage <= 1e6) revert("Invalid leverage");
+        uint256 _sizeDesired = Math.mulDiv(
+            params.margin,
+            leverage - 1e6,
+            1e6
+        );
+        if (_sizeDesired > type(uint128).max) revert("Invalid leverage");
+        sizeDesired = uint128(_sizeDesired);
+
+        INonfungiblePositionManager.MintParams memory _params = params;
+        _params.sizeDesired = sizeDesired;
+
+        IMarginalV1Pool pool = getPool(
+            PoolAddress.PoolKey({
+                token0: params.token0,
+                token1: params.token1,
+                maintenance: params.maintenance,
+                oracle: params.oracle
+            })
+        );
+        result = _quoteMint(_params, _getPoolSnapshot(pool));
+    }
+
+    /// @inheritdoc IQuoter
+    function quoteMintWithState(
+        INonfungiblePositionManager.MintParams calldata params,
+        PoolState calldata state
+    ) external pure returns (QuoteMintResult memory result) {
+        result = _quoteMint(params, _toPoolSnapshot(state));
+    }
 
+    /// @notice Gets the pool state synced for oracle updates needed to quote positions on the pool
+    /// @param pool The pool to snapshot
+    /// @return snapshot The pool state snapshot
+    function _getPoolSnapshot(
+        IMarginalV1Pool pool
+    ) internal view returns (PoolSnapshot memory snapshot) {
+        snapshot.pool = address(pool);
         (
-            uint160 sqrtPriceX96,
-            ,
-            uint128 liquidity,
-            int24 tick,
-            ,
+            snapshot.sqrtPriceX96,
             ,
-            uint8 feeProtocol,
-            bool initialized
-        ) = pool.state();
-        if (!initialized) revert("Not initialized");
+            snapshot.liquidity,
+            snapshot.tick,
+            snapshot.blockTimestamp,
+            snapshot.tickCumulative,
+            snapshot.feeProtocol,
+            snapshot.initialized
+        ) = getStateSynced(address(pool));
+        if (!snapshot.initialized) return snapshot;
+
+        snapshot.liquidityLocked = pool.liquidityLocked();
+
+        int56[] memory oracleTickCumulativesLast = getOracleSynced(
+            address(pool)
+        );
+        snapshot.oracleTickCumulative = oracleTickCumulativesLast[1]; // zero seconds ago
+        snapshot.oracleTickCumulativeDelta = OracleLibrary
+            .oracleTickCumulativeDelta(
+                oracleTickCumulativesLast[0],
+                oracleTickCumulativesLast[1]
+            );
+    }
+
+    /// @notice Fetches the pool total supply into the pool state snapshot if not already fetched
+    /// @dev Total supply is only needed to quote liquidity changes so is not fetched with the rest of the snapshot
+    /// @param snapshot The pool state snapshot to sync
+    function _syncPoolSnapshotTotalSupply(
+        PoolSnapshot memory snapshot
+    ) internal view {
+        if (!snapshot.initialized || snapshot.totalSupplySynced) return;
+        snapshot.totalSupply = IMarginalV1Pool(snapshot.pool).totalSupply();
+        snapshot.totalSupplySynced = true;
+    }
+
+    /// @notice Creates an empty cache of pool state snapshots
+    /// @param size The maximum number of distinct pools to cache
+    /// @return cache The empty pool state snapshot cache
+    function _createPoolSnapshotCache(
+        uint256 size
+    ) internal pure returns (PoolSnapshotCache memory cache) {
+        cache.keys = new bytes32[](size);
+        cache.snapshots = new PoolSnapshot[](size);
+    }
+
+    /// @notice Gets the pool state snapshot for the pool key, fetching from the pool only if not already cached
+    /// @dev Returned snapshot references the cached snapshot so updates to it persist in the cache
+    /// @param poolKey The pool key of the pool to snapshot
+    /// @param cache The pool state snapshots already cached
+    /// @return snapshot The pool state snapshot
+    function _getPoolSnapshotCached(
+        PoolAddress.PoolKey memory poolKey,
+        PoolSnapshotCache memory cache
+    ) internal view returns (PoolSnapshot memory snapshot) {
+        bytes32 key = keccak256(abi.encode(poolKey));
+        for (uint256 i = 0; i < cache.length; i++) {
+            if (cache.keys[i] == key) return cache.snapshots[i];
+        }
+
+        snapshot = _getPoolSnapshot(getPool(poolKey));
+        cache.keys[cache.length] = key;
+        cache.snapshots[cache.length] = snapshot;
+        cache.length++;
+    }
+
+    /// @notice Quotes the position result of NonfungiblePositionManager::mint given a pool state snapshot
+    /// @param params Param inputs to NonfungiblePositionManager::mint
+    /// @param snapshot The state of the pool to open the position on
+    /// @return result The quoted mint result
+    function _quoteMint(
+        INonfungiblePositionManager.MintParams memory params,
+        PoolSnapshot memory snapshot
+    ) internal pure returns (QuoteMintResult memory result) {
+        if (!snapshot.initialized) revert("Not initialized");
 
         uint128 liquidityDelta = PositionAmounts.getLiquidityForSize(
-            liquidity,
-            sqrtPriceX96,
+            snapshot.liquidity,
+            snapshot.sqrtPriceX96,
             params.maintenance,
             params.zeroForOne,
             params.sizeDesired
         );
         if (
             liquidityDelta == 0 ||
-            liquidityDelta + PoolConstants.MINIMUM_LIQUIDITY >= liquidity
+            liquidityDelta + PoolConstants.MINIMUM_LIQUIDITY >=
+            snapshot.liquidity
         ) revert("Invalid liquidityDelta");
 
         uint160 sqrtPriceLimitX96 = params.sqrtPriceLimitX96 == 0
@@ -121,9 +338,9 @@ contract Quoter is
             : params.sqrtPriceLimitX96;
         if (
             params.zeroForOne
-                ? !(sqrtPriceLimitX96 < sqrtPriceX96 &&
+                ? !(sqrtPriceLimitX96 < snapshot.sqrtPriceX96 &&
                     sqrtPriceLimitX96 > SqrtPriceMath.MIN_SQRT_RATIO)
-                : !(sqrtPriceLimitX96 > sqrtPriceX96 &&
+                : !(sqrtPriceLimitX96 > snapshot.sqrtPriceX96 &&
                     sqrtPriceLimitX96 < SqrtPriceMath.MAX_SQRT_RATIO)
         ) revert("Invalid sqrtPriceLimitX96");
 
@@ -136,8 +353,8 @@ contract Quoter is
             : params.amountInMaximum;
 
         uint160 sqrtPriceX96Next = SqrtPriceMath.sqrtPriceX96NextOpen(
-            liquidity,
-            sqrtPriceX96,
+            snapshot.liquidity,
+            snapshot.sqrtPriceX96,
             liquidityDelta,
             params.zeroForOne,
             params.maintenance
@@ -150,12 +367,12 @@ contract Quoter is
 
         // @dev ignore tick cumulatives and timestamps on position assemble
         PositionLibrary.Info memory position = PositionLibrary.assemble(
-            liquidity,
-            sqrtPriceX96,
+            snapshot.liquidity,
+            snapshot.sqrtPriceX96,
             sqrtPriceX96Next,
             liquidityDelta,
             params.zeroForOne,
-            tick,
+            snapshot.tick,
             0,
             0,
             0
@@ -176,128 +393,59 @@ contract Quoter is
             revert("Margin less than min");
         position.margin = params.margin;
 
-        size = position.size;
-        if (size < params.sizeMinimum) revert("Size less than min");
+        result.size = position.size;
+        if (result.size < params.sizeMinimum) revert("Size less than min");
 
-        debt = params.zeroForOne ? position.debt0 : position.debt1;
-        if (debt > debtMaximum) revert("Debt greater than max");
+        result.debt = params.zeroForOne ? position.debt0 : position.debt1;
+        if (result.debt > debtMaximum) revert("Debt greater than max");
 
-        margin = params.margin;
-        fees = PositionLibrary.fees(position.size, PoolConstants.fee);
+        result.margin = params.margin;
+        result.fees = PositionLibrary.fees(position.size, PoolConstants.fee);
 
-        uint256 amountIn = margin + fees;
+        uint256 amountIn = result.margin + result.fees;
         if (amountIn > amountInMaximum) revert("amountIn greater than max");
 
         // account for protocol fees *after* since taken from fees once transferred to pool
-        uint256 _fees = fees;
-        if (feeProtocol > 0) _fees -= uint256(_fees / feeProtocol);
+        uint256 _fees = result.fees;
+        if (snapshot.feeProtocol > 0)
+            _fees -= uint256(_fees / snapshot.feeProtocol);
 
-        (liquidityAfter, sqrtPriceX96After) = LiquidityMath
+        (result.liquidityAfter, result.sqrtPriceX96After) = LiquidityMath
             .liquiditySqrtPriceX96Next(
-                liquidity - liquidityDelta,
+                snapshot.liquidity - liquidityDelta,
                 sqrtPriceX96Next,
                 !params.zeroForOne ? int256(_fees) : int256(0),
                 !params.zeroForOne ? int256(0) : int256(_fees)
             );
 
-        uint128 liquidityLocked = pool.liquidityLocked();
-        liquidityLockedAfter = liquidityLocked + liquidityDelta;
+        result.liquidityLockedAfter = snapshot.liquidityLocked + liquidityDelta;
 
         // check whether position would be safe after open given twap oracle lag
-        {
-            int56[] memory oracleTickCumulativesLast = getOracleSynced(
-                address(pool)
-            );
-            int56 oracleTickCumulativeDelta = OracleLibrary
-                .oracleTickCumulativeDelta(
-                    oracleTickCumulativesLast[0],
-                    oracleTickCumulativesLast[1]
-                );
-            uint160 oracleSqrtPriceX96 = OracleLibrary.oracleSqrtPriceX96(
-                oracleTickCumulativeDelta,
-                PoolConstants.secondsAgo
-            );
-
-            safe = PositionLibrary.safe(
-                position,
-                oracleSqrtPriceX96,
-                params.maintenance
-            );
-            safeMarginMinimum = _safeMarginMinimum(
-                position,
-                marginMinimum,
-                params.maintenance,
-                oracleTickCumulativeDelta,
-                PoolConstants.secondsAgo
-            );
-            health = PositionHealth.getHealthForPosition(
-                params.zeroForOne,
-                uint128(size),
-                uint128(debt),
-                uint128(margin),
-                params.maintenance,
-                oracleSqrtPriceX96
-            );
-        }
-    }
+        uint160 oracleSqrtPriceX96 = OracleLibrary.oracleSqrtPriceX96(
+            snapshot.oracleTickCumulativeDelta,
+            PoolConstants.secondsAgo
+        );
 
-    /// @notice Gets the pool position info synced for funding
-    /// @param pool The address of the pool position is on
-    /// @param positionId The ID of the pool position
-    /// @param blockTimestampLast The last synced Marginal v1 pool timestamp
-    /// @param tickCumulativeLast The last synced Marginal v1 pool tick cumulative
-    /// @param oracleTickCumulativeLast The last synced Uniswap v3 oracle pool tick cumulative
-    /// @return position The synced pool position info
-    function _getPositionInfoSynced(
-        address pool,
-        uint96 positionId,
-        uint32 blockTimestampLast,
-        int56 tickCumulativeLast,
-        int56 oracleTickCumulativeLast
-    ) internal view returns (PositionLibrary.Info memory position) {
-        bytes32 key = keccak256(abi.encodePacked(address(manager), positionId));
-        (
-            uint128 _size,
-            uint128 _debt0,
-            uint128 _debt1,
-            uint128 _insurance0,
-            uint128 _insurance1,
-            bool _zeroForOne,
-            bool _liquidated,
-            int24 _tick,
-            uint32 _blockTimestamp,
-            int56 _tickCumulativeDelta,
-            uint128 _margin,
-            uint128 _liquidityLocked,
-            uint256 _rewards
-        ) = IMarginalV1Pool(pool).positions(key);
-
-        position = PositionLibrary.Info({
-            size: _size,
-            debt0: _debt0,
-            debt1: _debt1,
-            insurance0: _insurance0,
-            insurance1: _insurance1,
-            zeroForOne: _zeroForOne,
-            liquidated: _liquidated,
-            tick: _tick,
-            blockTimestamp: _blockTimestamp,
-            tickCumulativeDelta: _tickCumulativeDelta,
-            margin: _margin,
-            liquidityLocked: _liquidityLocked,
-            rewards: _rewards
-        });
-
-        if (position.size > 0) {
-            PositionLibrary.sync(
-                position,
-                blockTimestampLast,
-                tickCumulativeLast,
-                oracleTickCumulativeLast,
-                PoolConstants.tickCumulativeRateMax,
-                PoolConstants.fundingPeriod
-            );
-        }
+        result.safe = PositionLibrary.safe(
+            position,
+            oracleSqrtPriceX96,
+            params.maintenance
+        );
+        result.safeMarginMinimum = _safeMarginMinimum(
+            position,
+            marginMinimum,
+            params.maintenance,
+            snapshot.oracleTickCumulativeDelta,
+            PoolConstants.secondsAgo
+        );
+        result.health = PositionHealth.getHealthForPosition(
+            params.zeroForOne,
+            uint128(result.size),
+            uint128(result.debt),
+            uint128(result.margin),
+            params.maintenance,
+            oracleSqrtPriceX96
+        );
     }
 
     /// @inheritdoc IQuoter
@@ -316,9 +464,6 @@ contract Quoter is
             uint128 liquidityLockedAfter
         )
     {
-        (, uint96 positionId, , , , , , , , , ) = manager.positions(
-            params.tokenId
-        );
         IMarginalV1Pool pool = getPool(
             PoolAddress.PoolKey({
                 token0: params.token0,
@@ -327,80 +472,136 @@ contract Quoter is
                 oracle: params.oracle
             })
         );
+        QuoteBurnResult memory result = _quoteBurn(
+            params.tokenId,
+            _getPoolSnapshot(pool)
+        );
 
-        (
-            uint160 sqrtPriceX96,
-            ,
-            uint128 liquidity,
-            int24 tick,
-            uint32 blockTimestampLast,
-            int56 tickCumulativeLast,
-            ,
+        amountIn = result.amountIn;
+        amountOut = result.amountOut;
+        rewards = result.rewards;
+        liquidityAfter = result.liquidityAfter;
+        sqrtPriceX96After = result.sqrtPriceX96After;
+        liquidityLockedAfter = result.liquidityLockedAfter;
+    }
 
-        ) = getStateSynced(address(pool));
-        int56[] memory oracleTickCumulativesLast = getOracleSynced(
-            address(pool)
+    /// @inheritdoc IQuoter
+    function quoteBurnBatch(
+        INonfungiblePositionManager.BurnParams[] calldata params
+    ) external view returns (QuoteBurnResult[] memory results) {
+        results = new QuoteBurnResult[](params.length);
+
+        // group positions by pool so each distinct pool is only synced once
+        PoolSnapshotCache memory cache = _createPoolSnapshotCache(
+            params.length
         );
-        PositionLibrary.Info memory position = _getPositionInfoSynced(
-            address(pool),
-            positionId,
-            blockTimestampLast,
-            tickCumulativeLast,
-            oracleTickCumulativesLast[1] // zero seconds ago
+
+        for (uint256 i = 0; i < params.length; i++) {
+            if (_blockTimestamp() > params[i].deadline)
+                revert("Transaction too old");
+
+            PoolSnapshot memory snapshot = _getPoolSnapshotCached(
+                PoolAddress.PoolKey({
+                    token0: params[i].token0,
+                    token1: params[i].token1,
+                    maintenance: params[i].maintenance,
+                    oracle: params[i].oracle
+                }),
+                cache
+            );
+
+            results[i] = _quoteBurn(params[i].tokenId, snapshot);
+        }
+    }
+
+    /// @inheritdoc IQuoter
+    function quoteBurnProjected(
+        INonfungiblePositionManager.BurnParams calldata params,
+        uint32[] calldata secondsAhead
+    )
+        external
+        view
+        checkDeadline(params.deadline)
+        returns (QuoteBurnProjection[] memory projections)
+    {
+        PoolSnapshot memory snapshot = _getPoolSnapshot(
+            getPool(
+                PoolAddress.PoolKey({
+                    token0: params.token0,
+                    token1: params.token1,
+                    maintenance: params.maintenance,
+                    oracle: params.oracle
+                })
+            )
         );
-        if (position.size == 0) revert("Invalid position");
+        if (!snapshot.initialized) revert("Not initialized");
 
-        uint128 liquidityLocked = pool.liquidityLocked();
-        liquidityLockedAfter = liquidityLocked - position.liquidityLocked;
-        (uint256 amount0Unlocked, uint256 amount1Unlocked) = PositionLibrary
-            .amountsLocked(position);
+        (, uint96 positionId, , , , , , , , , ) = manager.positions(
+            params.tokenId
+        );
+        (, int24 oracleTick, , , , , ) = IUniswapV3Pool(params.oracle).slot0();
+        uint160 oracleSqrtPriceX96 = OracleLibrary.oracleSqrtPriceX96(
+            snapshot.oracleTickCumulativeDelta,
+            PoolConstants.secondsAgo
+        );
 
-        rewards = position.rewards;
+        projections = new QuoteBurnProjection[](secondsAhead.length);
+        for (uint256 i = 0; i < secondsAhead.length; i++) {
+            QuoteBurnProjection memory projection = projections[i];
+
+            // oracle updates assuming ticks unchanged through time ahead
+            int56 tickCumulative;
+            int56 oracleTickCumulative;
+            unchecked {
+                projection.blockTimestamp =
+                    snapshot.blockTimestamp +
+                    secondsAhead[i]; // overflow desired
+                tickCumulative =
+                    snapshot.tickCumulative +
+                    int56(snapshot.tick) *
+                    int56(uint56(secondsAhead[i])); // overflow desired
+                oracleTickCumulative =
+                    snapshot.oracleTickCumulative +
+                    int56(oracleTick) *
+                    int56(uint56(secondsAhead[i])); // overflow desired
+            }
 
-        int256 amount0;
-        int256 amount1;
-        if (!position.zeroForOne) {
-            amount0 = -int256(
-                uint256(position.size) + uint256(position.margin)
-            ); // size + margin out
-            amount1 = int256(uint256(position.debt1)); // debt in
+            PositionLibrary.Info memory position = getPositionInfoSynced(
+                snapshot.pool,
+                address(manager),
+                positionId,
+                projection.blockTimestamp,
+                tickCumulative,
+                oracleTickCumulative
+            );
+            if (position.size == 0) revert("Invalid position");
 
-            (liquidityAfter, sqrtPriceX96After) = LiquidityMath
-                .liquiditySqrtPriceX96Next(
-                    liquidity,
-                    sqrtPriceX96,
-                    int256(
-                        amount0Unlocked -
-                            uint256(position.size) -
-                            uint256(position.margin)
-                    ), // insurance0 + debt0
-                    int256(amount1Unlocked) + amount1 // insurance1 + debt1
-                );
-        } else {
-            amount0 = int256(uint256(position.debt0)); // debt in
-            amount1 = -int256(
-                uint256(position.size) + uint256(position.margin)
-            ); // size + margin out
+            projection.margin = position.margin;
+            if (position.zeroForOne) {
+                projection.debt = position.debt0;
+                projection.amountIn = uint256(position.debt0);
+            } else {
+                projection.debt = position.debt1;
+                projection.amountIn = uint256(position.debt1);
+            }
+            projection.amountOut =
+                uint256(position.size) +
+                uint256(position.margin);
 
-            (liquidityAfter, sqrtPriceX96After) = LiquidityMath
-                .liquiditySqrtPriceX96Next(
-                    liquidity,
-                    sqrtPriceX96,
-                    int256(amount0Unlocked) + amount0, // insurance0 + debt0
-                    int256(
-                        amount1Unlocked -
-                            uint256(position.size) -
-                            uint256(position.margin)
-                    ) // insurance1 + debt1
-                );
+            projection.safe = PositionLibrary.safe(
+                position,
+                oracleSqrtPriceX96,
+                params.maintenance
+            );
+            projection.health = PositionHealth.getHealthForPosition(
+                position.zeroForOne,
+                position.size,
+                projection.debt,
+                position.margin,
+                params.maintenance,
+                oracleSqrtPriceX96
+            );
         }
-
-        amountIn = amount0 > 0
-            ? uint256(amount0)
-            : (amount1 > 0 ? uint256(amount1) : 0);
-        amountOut = amount0 < 0
-            ? uint256(-amount0)
-            : (amount1 < 0 ? uint256(-amount1) : 0);
     }
 
     /// @inheritdoc IQuoter
@@ -418,9 +619,6 @@ contract Quoter is
             uint128 liquidityLockedAfter
         )
     {
-        (, uint96 positionId, , , , , , , , , ) = manager.positions(
-            params.tokenId
-        );
         IMarginalV1Pool pool = getPool(
             PoolAddress.PoolKey({
                 token0: params.token0,
@@ -429,38 +627,88 @@ contract Quoter is
                 oracle: params.oracle
             })
         );
+        QuoteIgniteResult memory result = _quoteIgnite(
+            params,
+            _getPoolSnapshot(pool)
+        );
 
-        (
-            uint160 sqrtPriceX96,
-            ,
-            uint128 liquidity,
-            int24 tick,
-            uint32 blockTimestampLast,
-            int56 tickCumulativeLast,
-            ,
+        amountOut = result.amountOut;
+        rewards = result.rewards;
+        liquidityAfter = result.liquidityAfter;
+        sqrtPriceX96After = result.sqrtPriceX96After;
+        liquidityLockedAfter = result.liquidityLockedAfter;
+    }
 
-        ) = getStateSynced(address(pool));
-        int56[] memory oracleTickCumulativesLast = getOracleSynced(
-            address(pool)
+    /// @inheritdoc IQuoter
+    function quoteIgniteBatch(
+        INonfungiblePositionManager.IgniteParams[] calldata params
+    ) external view returns (QuoteIgniteResult[] memory results) {
+        results = new QuoteIgniteResult[](params.length);
+
+        // group positions by pool so each distinct pool is only synced once
+        PoolSnapshotCache memory cache = _createPoolSnapshotCache(
+            params.length
         );
-        PositionLibrary.Info memory position = _getPositionInfoSynced(
-            address(pool),
+
+        for (uint256 i = 0; i < params.length; i++) {
+            if (_blockTimestamp() > params[i].deadline)
+                revert("Transaction too old");
+
+            PoolSnapshot memory snapshot = _getPoolSnapshotCached(
+                PoolAddress.PoolKey({
+                    token0: params[i].token0,
+                    token1: params[i].token1,
+                    maintenance: params[i].maintenance,
+                    oracle: params[i].oracle
+                }),
+                cache
+            );
+
+            results[i] = _quoteIgnite(params[i], snapshot);
+        }
+    }
+
+    /// @notice Quotes the pool amounts result of settling the position given a pool state snapshot
+    /// @param tokenId The NFT token id associated with the position
+    /// @param snapshot The state of the pool the position is on
+    /// @return position The pool position info synced for funding
+    /// @return amount0 The amount of token0 sent to (> 0) or received from (< 0) the pool on settle
+    /// @return amount1 The amount of token1 sent to (> 0) or received from (< 0) the pool on settle
+    /// @return liquidityAfter Pool liquidity after settle
+    /// @return sqrtPriceX96After Pool sqrt price after settle
+    /// @return liquidityLockedAfter Pool locked liquidity after settle
+    function _quoteSettle(
+        uint256 tokenId,
+        PoolSnapshot memory snapshot
+    )
+        internal
+        view
+        returns (
+            PositionLibrary.Info memory position,
+            int256 amount0,
+            int256 amount1,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After,
+            uint128 liquidityLockedAfter
+        )
+    {
+        (, uint96 positionId, , , , , , , , , ) = manager.positions(tokenId);
+        position = getPositionInfoSynced(
+            snapshot.pool,
+            address(manager),
             positionId,
-            blockTimestampLast,
-            tickCumulativeLast,
-            oracleTickCumulativesLast[1] // zero seconds ago
+            snapshot.blockTimestamp,
+            snapshot.tickCumulative,
+            snapshot.oracleTickCumulative
         );
         if (position.size == 0) revert("Invalid position");
 
-        uint128 liquidityLocked = pool.liquidityLocked();
-        liquidityLockedAfter = liquidityLocked - position.liquidityLocked;
+        liquidityLockedAfter =
+            snapshot.liquidityLocked -
+            position.liquidityLocked;
         (uint256 amount0Unlocked, uint256 amount1Unlocked) = PositionLibrary
             .amountsLocked(position);
 
-        rewards = position.rewards;
-
-        int256 amount0;
-        int256 amount1;
         if (!position.zeroForOne) {
             amount0 = -int256(
                 uint256(position.size) + uint256(position.margin)
@@ -469,8 +717,8 @@ contract Quoter is
 
             (liquidityAfter, sqrtPriceX96After) = LiquidityMath
                 .liquiditySqrtPriceX96Next(
-                    liquidity,
-                    sqrtPriceX96,
+                    snapshot.liquidity,
+                    snapshot.sqrtPriceX96,
                     int256(
                         amount0Unlocked -
                             uint256(position.size) -
@@ -486,8 +734,8 @@ contract Quoter is
 
             (liquidityAfter, sqrtPriceX96After) = LiquidityMath
                 .liquiditySqrtPriceX96Next(
-                    liquidity,
-                    sqrtPriceX96,
+                    snapshot.liquidity,
+                    snapshot.sqrtPriceX96,
                     int256(amount0Unlocked) + amount0, // insurance0 + debt0
                     int256(
                         amount1Unlocked -
@@ -496,9 +744,61 @@ contract Quoter is
                     ) // insurance1 + debt1
                 );
         }
+    }
+
+    /// @notice Quotes the result of NonfungiblePositionManager::burn given a pool state snapshot
+    /// @param tokenId The NFT token id associated with the position
+    /// @param snapshot The state of the pool the position is on
+    /// @return result The quoted burn result
+    function _quoteBurn(
+        uint256 tokenId,
+        PoolSnapshot memory snapshot
+    ) internal view returns (QuoteBurnResult memory result) {
+        PositionLibrary.Info memory position;
+        int256 amount0;
+        int256 amount1;
+        (
+            position,
+            amount0,
+            amount1,
+            result.liquidityAfter,
+            result.sqrtPriceX96After,
+            result.liquidityLockedAfter
+        ) = _quoteSettle(tokenId, snapshot);
+
+        result.rewards = position.rewards;
+        result.amountIn = amount0 > 0
+            ? uint256(amount0)
+            : (amount1 > 0 ? uint256(amount1) : 0);
+        result.amountOut = amount0 < 0
+            ? uint256(-amount0)
+            : (amount1 < 0 ? uint256(-amount1) : 0);
+    }
+
+    /// @notice Quotes the result of NonfungiblePositionManager::ignite given a pool state snapshot
+    /// @param params Param inputs to NonfungiblePositionManager::ignite
+    /// @param snapshot The state of the pool the position is on
+    /// @return result The quoted ignite result
+    function _quoteIgnite(
+        INonfungiblePositionManager.IgniteParams memory params,
+        PoolSnapshot memory snapshot
+    ) internal view returns (QuoteIgniteResult memory result) {
+        PositionLibrary.Info memory position;
+        int256 amount0;
+        int256 amount1;
+        (
+            position,
+            amount0,
+            amount1,
+            result.liquidityAfter,
+            result.sqrtPriceX96After,
+            result.liquidityLockedAfter
+        ) = _quoteSettle(params.tokenId, snapshot);
+
+        result.rewards = position.rewards;
 
         // unadjusted for swap on oracle pool to repay debt to Marginal v1 pool
-        amountOut = amount0 < 0
+        uint256 amountOut = amount0 < 0
             ? uint256(-amount0)
             : (amount1 < 0 ? uint256(-amount1) : 0);
 
@@ -508,37 +808,92 @@ contract Quoter is
 
         // amount in is debt repaid pulled from oracle Uniswap v3 pool in exact output swap
         bool oracleZeroForOne = amount1 > 0;
-        (int256 oracleAmount0, int256 oracleAmount1) = uniswapV3Quoter.quote(
+        uint256 oracleAmountIn = _quoteOracleExactOutput(
             params.oracle,
             oracleZeroForOne,
-            (oracleZeroForOne ? -amount1 : -amount0),
-            (
-                oracleZeroForOne
-                    ? TickMath.MIN_SQRT_RATIO + 1
-                    : TickMath.MAX_SQRT_RATIO - 1
-            )
-        );
-
-        uint256 oracleAmountIn = (
-            oracleZeroForOne ? uint256(oracleAmount0) : uint256(oracleAmount1)
+            uint256(oracleZeroForOne ? amount1 : amount0)
         );
         if (amountOut < oracleAmountIn) revert("IIA"); // Uniswap v3 pool error for not enough balance in on swap
 
         amountOut -= oracleAmountIn;
         if (amountOut < params.amountOutMinimum)
             revert("Amount out less than min");
+
+        result.amountOut = amountOut;
     }
 
-    /// @inheritdoc IQuoter
-    function quoteExactInputSingle(
-        IRouter.ExactInputSingleParams memory params
-    )
-        public
-        view
-        checkDeadline(params.deadline)
-        returns (
-            uint256 amountOut,
-            uint128 liquidityAfter,
+    /// @notice Quotes the amount in for an exact output swap on the oracle Uniswap v3 pool
+    /// @dev Quotes locally when the swap stays within the current tick spacing range of the oracle pool,
+    /// as liquidity only changes when crossing an initialized tick. Otherwise falls back to the static quoter,
+    /// reverting if no static quoter set
+    /// @param oracle The address of the oracle Uniswap v3 pool
+    /// @param zeroForOne Whether the swap is token0 in and token1 out
+    /// @param amountOut The amount to receive from the oracle pool
+    /// @return amountIn The amount to send to the oracle pool, including fees
+    function _quoteOracleExactOutput(
+        address oracle,
+        bool zeroForOne,
+        uint256 amountOut
+    ) internal view returns (uint256 amountIn) {
+        (uint160 sqrtPriceX96, int24 tick, , , , , ) = IUniswapV3Pool(oracle)
+            .slot0();
+        int24 tickSpacing = IUniswapV3Pool(oracle).tickSpacing();
+
+        // bounds of current tick spacing range
+        int24 compressed = tick / tickSpacing;
+        if (tick < 0 && tick % tickSpacing != 0) compressed--; // round towards negative infinity
+        int24 tickLower = compressed * tickSpacing;
+        int24 tickUpper = tickLower + tickSpacing;
+        uint160 sqrtPriceX96Lower = TickMath.getSqrtRatioAtTick(
+            tickLower < TickMath.MIN_TICK ? TickMath.MIN_TICK : tickLower
+        );
+        uint160 sqrtPriceX96Upper = TickMath.getSqrtRatioAtTick(
+            tickUpper > TickMath.MAX_TICK ? TickMath.MAX_TICK : tickUpper
+        );
+
+        if (
+            sqrtPriceX96 >= sqrtPriceX96Lower &&
+            sqrtPriceX96 <= sqrtPriceX96Upper
+        ) {
+            (
+                ,
+                uint256 amountInStep,
+                uint256 amountOutStep,
+                uint256 feeAmount
+            ) = UniswapV3SwapMath.computeSwapStep(
+                    sqrtPriceX96,
+                    zeroForOne ? sqrtPriceX96Lower : sqrtPriceX96Upper,
+                    IUniswapV3Pool(oracle).liquidity(),
+                    -int256(amountOut),
+                    IUniswapV3Pool(oracle).fee()
+                );
+            if (amountOutStep >= amountOut) return amountInStep + feeAmount;
+        }
+
+        // crosses tick boundary so liquidity may change
+        if (address(uniswapV3Quoter) == address(0))
+            revert("Tick boundary crossed");
+        (int256 amount0, int256 amount1) = uniswapV3Quoter.quote(
+            oracle,
+            zeroForOne,
+            -int256(amountOut),
+            zeroForOne
+                ? TickMath.MIN_SQRT_RATIO + 1
+                : TickMath.MAX_SQRT_RATIO - 1
+        );
+        amountIn = zeroForOne ? uint256(amount0) : uint256(amount1);
+    }
+
+    /// @inheritdoc IQuoter
+    function quoteExactInputSingle(
+        IRouter.ExactInputSingleParams memory params
+    )
+        public
+        view
+        checkDeadline(params.deadline)
+        returns (
+            uint256 amountOut,
+            uint128 liquidityAfter,
             uint160 sqrtPriceX96After
         )
     {
@@ -552,17 +907,65 @@ contract Quoter is
             })
         );
 
+        PoolSnapshot memory snapshot;
         (
-            uint160 sqrtPriceX96,
+            snapshot.sqrtPriceX96,
             ,
-            uint128 liquidity,
+            snapshot.liquidity,
             ,
             ,
             ,
-            uint8 feeProtocol,
-            bool initialized
+            snapshot.feeProtocol,
+            snapshot.initialized
         ) = pool.state();
-        if (!initialized) revert("Not initialized");
+
+        (
+            amountOut,
+            liquidityAfter,
+            sqrtPriceX96After
+        ) = _quoteExactInputSingle(params, snapshot);
+    }
+
+    /// @inheritdoc IQuoter
+    function quoteExactInputSingleWithState(
+        IRouter.ExactInputSingleParams calldata params,
+        PoolState calldata state
+    )
+        external
+        pure
+        returns (
+            uint256 amountOut,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After
+        )
+    {
+        (
+            amountOut,
+            liquidityAfter,
+            sqrtPriceX96After
+        ) = _quoteExactInputSingle(params, _toPoolSnapshot(state));
+    }
+
+    /// @notice Quotes the amountOut result of Router::exactInputSingle given a pool state snapshot
+    /// @param params Param inputs to Router::exactInputSingle
+    /// @param snapshot The state of the pool to swap through
+    /// @return amountOut Amount of token received from pool after swap
+    /// @return liquidityAfter Pool liquidity after swap
+    /// @return sqrtPriceX96After Pool sqrt price after swap
+    function _quoteExactInputSingle(
+        IRouter.ExactInputSingleParams memory params,
+        PoolSnapshot memory snapshot
+    )
+        internal
+        pure
+        returns (
+            uint256 amountOut,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After
+        )
+    {
+        if (!snapshot.initialized) revert("Not initialized");
+        bool zeroForOne = params.tokenIn < params.tokenOut;
 
         uint160 sqrtPriceLimitX96 = params.sqrtPriceLimitX96 == 0
             ? (
@@ -579,9 +982,9 @@ contract Quoter is
 
         if (
             zeroForOne
-                ? !(sqrtPriceLimitX96 < sqrtPriceX96 &&
+                ? !(sqrtPriceLimitX96 < snapshot.sqrtPriceX96 &&
                     sqrtPriceLimitX96 > SqrtPriceMath.MIN_SQRT_RATIO)
-                : !(sqrtPriceLimitX96 > sqrtPriceX96 &&
+                : !(sqrtPriceLimitX96 > snapshot.sqrtPriceX96 &&
                     sqrtPriceLimitX96 < SqrtPriceMath.MAX_SQRT_RATIO)
         ) revert("Invalid sqrtPriceLimitX96");
 
@@ -594,8 +997,8 @@ contract Quoter is
                 )
             );
         uint160 sqrtPriceX96Next = SqrtPriceMath.sqrtPriceX96NextSwap(
-            liquidity,
-            sqrtPriceX96,
+            snapshot.liquidity,
+            snapshot.sqrtPriceX96,
             zeroForOne,
             amountSpecifiedLessFee
         );
@@ -607,8 +1010,8 @@ contract Quoter is
 
         // amounts without fees
         (int256 amount0, int256 amount1) = SwapMath.swapAmounts(
-            liquidity,
-            sqrtPriceX96,
+            snapshot.liquidity,
+            snapshot.sqrtPriceX96,
             sqrtPriceX96Next
         );
         amountOut = uint256(-(zeroForOne ? amount1 : amount0));
@@ -618,13 +1021,14 @@ contract Quoter is
         uint256 amountInLessFee = uint256(zeroForOne ? amount0 : amount1);
         uint256 fees = params.amountIn - amountInLessFee;
         uint256 amountIn = amountInLessFee + fees;
-        if (feeProtocol > 0) amountIn -= uint256(fees / feeProtocol);
+        if (snapshot.feeProtocol > 0)
+            amountIn -= uint256(fees / snapshot.feeProtocol);
 
         // calculate liquidity, sqrtP after
         (liquidityAfter, sqrtPriceX96After) = LiquidityMath
             .liquiditySqrtPriceX96Next(
-                liquidity,
-                sqrtPriceX96,
+                snapshot.liquidity,
+                snapshot.sqrtPriceX96,
                 zeroForOne ? int256(amountIn) : -int256(amountOut),
                 zeroForOne ? -int256(amountOut) : int256(amountIn)
             );
@@ -632,7 +1036,7 @@ contract Quoter is
 
     /// @inheritdoc IQuoter
     function quoteExactInput(
-        IRouter.ExactInputParams memory params
+        IRouter.ExactInputParams calldata params
     )
         external
         view
@@ -642,21 +1046,24 @@ contract Quoter is
             uint160[] memory sqrtPricesX96After
         )
     {
-        uint256 numPools = params.path.numPools();
+        bytes calldata path = params.path;
+        uint256 numPools = path.numPoolsAt(0);
         liquiditiesAfter = new uint128[](numPools);
         sqrtPricesX96After = new uint160[](numPools);
 
+        uint256 amountIn = params.amountIn;
+        uint256 offset;
         uint256 i;
         while (true) {
-            bool hasMultiplePools = params.path.hasMultiplePools();
+            bool hasMultiplePools = path.hasMultiplePoolsAt(offset);
             (
                 address tokenIn,
                 address tokenOut,
                 uint24 maintenance,
                 address oracle
-            ) = params.path.decodeFirstPool();
+            ) = path.decodePoolAt(offset);
             (
-                params.amountIn,
+                amountIn,
                 liquiditiesAfter[i],
                 sqrtPricesX96After[i]
             ) = quoteExactInputSingle(
@@ -667,7 +1074,7 @@ contract Quoter is
                     oracle: oracle,
                     recipient: params.recipient, // irrelevant
                     deadline: params.deadline,
-                    amountIn: params.amountIn,
+                    amountIn: amountIn,
                     amountOutMinimum: 0,
                     sqrtPriceLimitX96: 0
                 })
@@ -676,9 +1083,9 @@ contract Quoter is
 
             // exit out if reached end of path
             if (hasMultiplePools) {
-                params.path = params.path.skipToken();
+                offset = Path.skipTokenAt(offset);
             } else {
-                amountOut = params.amountIn;
+                amountOut = amountIn;
                 break;
             }
         }
@@ -686,6 +1093,236 @@ contract Quoter is
         if (amountOut < params.amountOutMinimum) revert("Too little received");
     }
 
+    /// @inheritdoc IQuoter
+    function quoteExactInputBestTier(
+        address tokenIn,
+        address tokenOut,
+        PoolTier[] calldata tiers,
+        uint256 amountIn
+    ) external view returns (uint256 bestIndex, TierQuote[] memory quotes) {
+        quotes = new TierQuote[](tiers.length);
+        bool found;
+        for (uint256 i = 0; i < tiers.length; i++) {
+            (address pool, PoolState memory state) = _getPoolStateForTier(
+                tokenIn,
+                tokenOut,
+                tiers[i]
+            );
+            quotes[i].pool = pool;
+            if (state.sqrtPriceX96 == 0) continue;
+
+            try
+                this.quoteExactInputSingleWithState(
+                    IRouter.ExactInputSingleParams({
+                        tokenIn: tokenIn,
+                        tokenOut: tokenOut,
+                        maintenance: tiers[i].maintenance,
+                        oracle: tiers[i].oracle,
+                        recipient: address(0), // irrelevant
+                        deadline: type(uint256).max, // irrelevant
+                        amountIn: amountIn,
+                        amountOutMinimum: 0,
+                        sqrtPriceLimitX96: 0
+                    }),
+                    state
+                )
+            returns (
+                uint256 amountOut,
+                uint128 liquidityAfter,
+                uint160 sqrtPriceX96After
+            ) {
+                quotes[i].success = true;
+                quotes[i].amount = amountOut;
+                quotes[i].liquidityAfter = liquidityAfter;
+                quotes[i].sqrtPriceX96After = sqrtPriceX96After;
+
+                if (!found || amountOut > quotes[bestIndex].amount) {
+                    bestIndex = i;
+                    found = true;
+                }
+            } catch {}
+        }
+        if (!found) revert("No valid pool");
+    }
+
+    /// @inheritdoc IQuoter
+    function quoteExactInputSplit(
+        address tokenIn,
+        address tokenOut,
+        PoolTier[] calldata tiers,
+        uint256 amountIn
+    )
+        external
+        view
+        returns (
+            uint256 amountOut,
+            uint256[] memory amountsIn,
+            TierQuote[] memory quotes
+        )
+    {
+        if (amountIn == 0 || amountIn >= uint256(type(int256).max))
+            revert("Invalid amountIn");
+
+        PoolState[] memory states = new PoolState[](tiers.length);
+        quotes = new TierQuote[](tiers.length);
+        for (uint256 i = 0; i < tiers.length; i++)
+            (quotes[i].pool, states[i]) = _getPoolStateForTier(
+                tokenIn,
+                tokenOut,
+                tiers[i]
+            );
+
+        amountsIn = _splitExactInput(states, tokenIn < tokenOut, amountIn);
+
+        for (uint256 i = 0; i < tiers.length; i++) {
+            if (amountsIn[i] == 0) continue;
+            (
+                quotes[i].amount,
+                quotes[i].liquidityAfter,
+                quotes[i].sqrtPriceX96After
+            ) = _quoteExactInputSingle(
+                IRouter.ExactInputSingleParams({
+                    tokenIn: tokenIn,
+                    tokenOut: tokenOut,
+                    maintenance: tiers[i].maintenance,
+                    oracle: tiers[i].oracle,
+                    recipient: address(0), // irrelevant
+                    deadline: type(uint256).max, // irrelevant
+                    amountIn: amountsIn[i],
+                    amountOutMinimum: 0,
+                    sqrtPriceLimitX96: 0
+                }),
+                _toPoolSnapshot(states[i])
+            );
+            quotes[i].success = true;
+            amountOut += quotes[i].amount;
+        }
+    }
+
+    /// @notice Splits an exact input amount across pools of the same pair to maximize the total amount out
+    /// @dev Pools swap along x * y = L^2 with the same fee, so output is maximized when all pools
+    /// receiving input end at the same sqrt price. Pools are filled in order of best price until the
+    /// common sqrt price after reaches the price of the next pool.
+    /// @param states The swap state of each pool, with zero sqrt price for pools to skip
+    /// @param zeroForOne Whether token0 is sent to the pools
+    /// @param amountIn Amount of token sent to the pools in total, including fees
+    /// @return amountsIn Amount of token to send to each pool, including fees
+    function _splitExactInput(
+        PoolState[] memory states,
+        bool zeroForOne,
+        uint256 amountIn
+    ) internal pure returns (uint256[] memory amountsIn) {
+        amountsIn = new uint256[](states.length);
+
+        // sort pools with best price first
+        uint256[] memory order = new uint256[](states.length);
+        uint256 count;
+        for (uint256 i = 0; i < states.length; i++) {
+            if (states[i].sqrtPriceX96 == 0 || states[i].liquidity == 0)
+                continue;
+            uint256 j = count;
+            while (
+                j > 0 &&
+                (
+                    zeroForOne
+                        ? states[order[j - 1]].sqrtPriceX96 <
+                            states[i].sqrtPriceX96
+                        : states[order[j - 1]].sqrtPriceX96 >
+                            states[i].sqrtPriceX96
+                )
+            ) {
+                order[j] = order[j - 1];
+                j--;
+            }
+            order[j] = i;
+            count++;
+        }
+        if (count == 0) revert("No valid pool");
+
+        // fee is the same across pools so split amounts less fee then scale back up
+        uint256 amountInLessFee = amountIn -
+            SwapMath.swapFees(amountIn, PoolConstants.fee, false);
+
+        // common sqrt price after swap given pools filled
+        uint256 liquidityTotal;
+        uint256 reserveTotal;
+        uint256 sqrtPriceX96Next;
+        uint256 filled;
+        for (; filled < count; filled++) {
+            PoolState memory state = states[order[filled]];
+            if (
+                filled > 0 &&
+                (
+                    zeroForOne
+                        ? state.sqrtPriceX96 <= sqrtPriceX96Next
+                        : state.sqrtPriceX96 >= sqrtPriceX96Next
+                )
+            ) break;
+
+            (uint256 reserve0, uint256 reserve1) = LiquidityMath.toAmounts(
+                state.liquidity,
+                state.sqrtPriceX96
+            );
+            liquidityTotal += state.liquidity;
+            reserveTotal += zeroForOne ? reserve0 : reserve1;
+
+            // 1 / sqrtP' = (dx + sum(x)) / sum(L) or sqrtP' = (dy + sum(y)) / sum(L)
+            sqrtPriceX96Next = zeroForOne
+                ? Math.mulDiv(
+                    liquidityTotal,
+                    FixedPoint96.Q96,
+                    amountInLessFee + reserveTotal
+                )
+                : Math.mulDiv(
+                    amountInLessFee + reserveTotal,
+                    FixedPoint96.Q96,
+                    liquidityTotal
+                );
+        }
+
+        // amounts in less fee to each pool filled to reach common sqrt price after
+        uint256[] memory amountsInLessFee = new uint256[](filled);
+        uint256 amountInLessFeeTotal;
+        for (uint256 k = 0; k < filled; k++) {
+            PoolState memory state = states[order[k]];
+            (uint256 reserve0, uint256 reserve1) = LiquidityMath.toAmounts(
+                state.liquidity,
+                state.sqrtPriceX96
+            );
+            uint256 reserveNext = zeroForOne
+                ? Math.mulDiv(
+                    state.liquidity,
+                    FixedPoint96.Q96,
+                    sqrtPriceX96Next
+                )
+                : Math.mulDiv(
+                    state.liquidity,
+                    sqrtPriceX96Next,
+                    FixedPoint96.Q96
+                );
+            uint256 reserve = zeroForOne ? reserve0 : reserve1;
+            if (reserveNext > reserve) {
+                amountsInLessFee[k] = reserveNext - reserve;
+                amountInLessFeeTotal += amountsInLessFee[k];
+            }
+        }
+
+        // scale up to amounts in with fees, giving any rounding remainder to best priced pool
+        uint256 amountInRemaining = amountIn;
+        if (amountInLessFeeTotal > 0) {
+            for (uint256 k = 0; k < filled; k++) {
+                uint256 amount = Math.mulDiv(
+                    amountIn,
+                    amountsInLessFee[k],
+                    amountInLessFeeTotal
+                );
+                amountsIn[order[k]] = amount;
+                amountInRemaining -= amount;
+            }
+        }
+        amountsIn[order[0]] += amountInRemaining;
+    }
+
     /// @inheritdoc IQuoter
     function quoteExactOutputSingle(
         IRouter.ExactOutputSingleParams memory params
@@ -709,17 +1346,65 @@ contract Quoter is
             })
         );
 
+        PoolSnapshot memory snapshot;
         (
-            uint160 sqrtPriceX96,
+            snapshot.sqrtPriceX96,
             ,
-            uint128 liquidity,
+            snapshot.liquidity,
             ,
             ,
             ,
-            uint8 feeProtocol,
-            bool initialized
+            snapshot.feeProtocol,
+            snapshot.initialized
         ) = pool.state();
-        if (!initialized) revert("Not initialized");
+
+        (
+            amountIn,
+            liquidityAfter,
+            sqrtPriceX96After
+        ) = _quoteExactOutputSingle(params, snapshot);
+    }
+
+    /// @inheritdoc IQuoter
+    function quoteExactOutputSingleWithState(
+        IRouter.ExactOutputSingleParams calldata params,
+        PoolState calldata state
+    )
+        external
+        pure
+        returns (
+            uint256 amountIn,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After
+        )
+    {
+        (
+            amountIn,
+            liquidityAfter,
+            sqrtPriceX96After
+        ) = _quoteExactOutputSingle(params, _toPoolSnapshot(state));
+    }
+
+    /// @notice Quotes the amountIn result of Router::exactOutputSingle given a pool state snapshot
+    /// @param params Param inputs to Router::exactOutputSingle
+    /// @param snapshot The state of the pool to swap through
+    /// @return amountIn Amount of token sent to pool for swap
+    /// @return liquidityAfter Pool liquidity after swap
+    /// @return sqrtPriceX96After Pool sqrt price after swap
+    function _quoteExactOutputSingle(
+        IRouter.ExactOutputSingleParams memory params,
+        PoolSnapshot memory snapshot
+    )
+        internal
+        pure
+        returns (
+            uint256 amountIn,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After
+        )
+    {
+        if (!snapshot.initialized) revert("Not initialized");
+        bool zeroForOne = params.tokenIn < params.tokenOut;
 
         uint160 sqrtPriceLimitX96 = params.sqrtPriceLimitX96 == 0
             ? (
@@ -737,15 +1422,15 @@ contract Quoter is
 
         if (
             zeroForOne
-                ? !(sqrtPriceLimitX96 < sqrtPriceX96 &&
+                ? !(sqrtPriceLimitX96 < snapshot.sqrtPriceX96 &&
                     sqrtPriceLimitX96 > SqrtPriceMath.MIN_SQRT_RATIO)
-                : !(sqrtPriceLimitX96 > sqrtPriceX96 &&
+                : !(sqrtPriceLimitX96 > snapshot.sqrtPriceX96 &&
                     sqrtPriceLimitX96 < SqrtPriceMath.MAX_SQRT_RATIO)
         ) revert("Invalid sqrtPriceLimitX96");
 
         uint160 sqrtPriceX96Next = SqrtPriceMath.sqrtPriceX96NextSwap(
-            liquidity,
-            sqrtPriceX96,
+            snapshot.liquidity,
+            snapshot.sqrtPriceX96,
             zeroForOne,
             amountSpecified
         );
@@ -757,8 +1442,8 @@ contract Quoter is
 
         // amounts without fees
         (int256 amount0, int256 amount1) = SwapMath.swapAmounts(
-            liquidity,
-            sqrtPriceX96,
+            snapshot.liquidity,
+            snapshot.sqrtPriceX96,
             sqrtPriceX96Next
         );
         uint256 amountOut = uint256(-amountSpecified);
@@ -775,13 +1460,14 @@ contract Quoter is
 
         // account for protocol fees if turned on for amount in to pool
         uint256 amountInToPool = amountIn;
-        if (feeProtocol > 0) amountInToPool -= uint256(fees / feeProtocol);
+        if (snapshot.feeProtocol > 0)
+            amountInToPool -= uint256(fees / snapshot.feeProtocol);
 
         // calculate liquidity, sqrtP after
         (liquidityAfter, sqrtPriceX96After) = LiquidityMath
             .liquiditySqrtPriceX96Next(
-                liquidity,
-                sqrtPriceX96,
+                snapshot.liquidity,
+                snapshot.sqrtPriceX96,
                 zeroForOne ? int256(amountInToPool) : -int256(amountOut),
                 zeroForOne ? -int256(amountOut) : int256(amountInToPool)
             );
@@ -789,7 +1475,7 @@ contract Quoter is
 
     /// @inheritdoc IQuoter
     function quoteExactOutput(
-        IRouter.ExactOutputParams memory params
+        IRouter.ExactOutputParams calldata params
     )
         external
         view
@@ -799,21 +1485,24 @@ contract Quoter is
             uint160[] memory sqrtPricesX96After
         )
     {
-        uint256 numPools = params.path.numPools();
+        bytes calldata path = params.path;
+        uint256 numPools = path.numPoolsAt(0);
         liquiditiesAfter = new uint128[](numPools);
         sqrtPricesX96After = new uint160[](numPools);
 
+        uint256 amountOut = params.amountOut;
+        uint256 offset;
         uint256 i;
         while (true) {
-            bool hasMultiplePools = params.path.hasMultiplePools();
+            bool hasMultiplePools = path.hasMultiplePoolsAt(offset);
             (
                 address tokenOut,
                 address tokenIn,
                 uint24 maintenance,
                 address oracle
-            ) = params.path.decodeFirstPool();
+            ) = path.decodePoolAt(offset);
             (
-                params.amountOut,
+                amountOut,
                 liquiditiesAfter[i],
                 sqrtPricesX96After[i]
             ) = quoteExactOutputSingle(
@@ -824,7 +1513,7 @@ contract Quoter is
                     oracle: oracle,
                     recipient: params.recipient, // irrelevant
                     deadline: params.deadline,
-                    amountOut: params.amountOut,
+                    amountOut: amountOut,
                     amountInMaximum: type(uint256).max,
                     sqrtPriceLimitX96: 0
                 })
@@ -833,9 +1522,9 @@ contract Quoter is
 
             // exit out if reached end of path
             if (hasMultiplePools) {
-                params.path = params.path.skipToken();
+                offset = Path.skipTokenAt(offset);
             } else {
-                amountIn = params.amountOut;
+                amountIn = amountOut;
                 break;
             }
         }
@@ -843,6 +1532,101 @@ contract Quoter is
         if (amountIn > params.amountInMaximum) revert("Too much requested");
     }
 
+    /// @inheritdoc IQuoter
+    function quoteExactOutputBestTier(
+        address tokenIn,
+        address tokenOut,
+        PoolTier[] calldata tiers,
+        uint256 amountOut
+    ) external view returns (uint256 bestIndex, TierQuote[] memory quotes) {
+        quotes = new TierQuote[](tiers.length);
+        bool found;
+        for (uint256 i = 0; i < tiers.length; i++) {
+            (address pool, PoolState memory state) = _getPoolStateForTier(
+                tokenIn,
+                tokenOut,
+                tiers[i]
+            );
+            quotes[i].pool = pool;
+            if (state.sqrtPriceX96 == 0) continue;
+
+            try
+                this.quoteExactOutputSingleWithState(
+                    IRouter.ExactOutputSingleParams({
+                        tokenIn: tokenIn,
+                        tokenOut: tokenOut,
+                        maintenance: tiers[i].maintenance,
+                        oracle: tiers[i].oracle,
+                        recipient: address(0), // irrelevant
+                        deadline: type(uint256).max, // irrelevant
+                        amountOut: amountOut,
+                        amountInMaximum: type(uint256).max,
+                        sqrtPriceLimitX96: 0
+                    }),
+                    state
+                )
+            returns (
+                uint256 amountIn,
+                uint128 liquidityAfter,
+                uint160 sqrtPriceX96After
+            ) {
+                quotes[i].success = true;
+                quotes[i].amount = amountIn;
+                quotes[i].liquidityAfter = liquidityAfter;
+                quotes[i].sqrtPriceX96After = sqrtPriceX96After;
+
+                if (!found || amountIn < quotes[bestIndex].amount) {
+                    bestIndex = i;
+                    found = true;
+                }
+            } catch {}
+        }
+        if (!found) revert("No valid pool");
+    }
+
+    /// @notice Gets the pool and its swap state for the token pair and candidate tier
+    /// @dev Returns zero pool address and empty state if the pool has not been created or initialized
+    /// @param tokenA The first token of the pool, unsorted
+    /// @param tokenB The second token of the pool, unsorted
+    /// @param tier The candidate maintenance and oracle of the pool
+    /// @return pool The pool address
+    /// @return state The pool state needed to quote swaps on the pool
+    function _getPoolStateForTier(
+        address tokenA,
+        address tokenB,
+        PoolTier memory tier
+    ) internal view returns (address pool, PoolState memory state) {
+        PoolAddress.PoolKey memory poolKey = PoolAddress.getPoolKey(
+            tokenA,
+            tokenB,
+            tier.maintenance,
+            tier.oracle
+        );
+        pool = IMarginalV1Factory(factory).getPool(
+            poolKey.token0,
+            poolKey.token1,
+            poolKey.maintenance,
+            poolKey.oracle
+        );
+        if (pool == address(0)) return (pool, state);
+
+        (
+            uint160 sqrtPriceX96,
+            ,
+            uint128 liquidity,
+            ,
+            ,
+            ,
+            uint8 feeProtocol,
+            bool initialized
+        ) = IMarginalV1Pool(pool).state();
+        if (!initialized) return (pool, state);
+
+        state.sqrtPriceX96 = sqrtPriceX96;
+        state.liquidity = liquidity;
+        state.feeProtocol = feeProtocol;
+    }
+
     /// @inheritdoc IQuoter
     function quoteAddLiquidity(
         IRouter.AddLiquidityParams memory params
@@ -865,33 +1649,64 @@ contract Quoter is
                 oracle: params.oracle
             })
         );
+        (shares, amount0, amount1, liquidityAfter) = _quoteAddLiquidity(
+            params,
+            _getPoolSnapshotLiquidity(pool)
+        );
+    }
 
-        (
-            uint160 sqrtPriceX96,
-            ,
-            uint128 liquidity,
-            ,
-            ,
-            ,
-            ,
-            bool initialized
-        ) = pool.state();
-        if (!initialized) revert("Pool not initialized");
+    /// @inheritdoc IQuoter
+    function quoteAddLiquidityWithState(
+        IRouter.AddLiquidityParams calldata params,
+        PoolState calldata state
+    )
+        external
+        pure
+        returns (
+            uint256 shares,
+            uint256 amount0,
+            uint256 amount1,
+            uint128 liquidityAfter
+        )
+    {
+        (shares, amount0, amount1, liquidityAfter) = _quoteAddLiquidity(
+            params,
+            _toPoolSnapshot(state)
+        );
+    }
+
+    /// @notice Quotes the amounts in result of Router::addLiquidity given a pool state snapshot
+    /// @param params Param inputs to Router::addLiquidity
+    /// @param snapshot The state of the pool to add liquidity to
+    /// @return shares Amount of lp token minted by pool
+    /// @return amount0 Amount of token0 sent to pool for adding liquidity
+    /// @return amount1 Amount of token1 sent to pool for adding liquidity
+    /// @return liquidityAfter Pool liquidity after adding liquidity
+    function _quoteAddLiquidity(
+        IRouter.AddLiquidityParams memory params,
+        PoolSnapshot memory snapshot
+    )
+        internal
+        pure
+        returns (
+            uint256 shares,
+            uint256 amount0,
+            uint256 amount1,
+            uint128 liquidityAfter
+        )
+    {
+        if (!snapshot.initialized) revert("Pool not initialized");
 
         uint128 liquidityDelta = LiquidityAmounts.getLiquidityForAmounts(
-            sqrtPriceX96,
+            snapshot.sqrtPriceX96,
             params.amount0Desired,
             params.amount1Desired
         );
         if (liquidityDelta == 0) revert("Invalid liquidityDelta");
 
-        // cache needed pool state
-        uint256 totalSupply = pool.totalSupply();
-        uint128 liquidityLocked = pool.liquidityLocked();
-
         (amount0, amount1) = LiquidityMath.toAmounts(
             liquidityDelta,
-            sqrtPriceX96
+            snapshot.sqrtPriceX96
         );
         amount0 += 1;
         amount1 += 1;
@@ -899,18 +1714,18 @@ contract Quoter is
         if (amount0 < params.amount0Min) revert("amount0 less than min");
         if (amount1 < params.amount1Min) revert("amount1 less than min");
 
-        uint128 totalLiquidityAfter = liquidity +
-            liquidityLocked +
+        uint128 totalLiquidityAfter = snapshot.liquidity +
+            snapshot.liquidityLocked +
             liquidityDelta;
-        shares = totalSupply == 0
+        shares = snapshot.totalSupply == 0
             ? totalLiquidityAfter
             : Math.mulDiv(
-                totalSupply,
+                snapshot.totalSupply,
                 liquidityDelta,
                 totalLiquidityAfter - liquidityDelta
             );
 
-        liquidityAfter = liquidity + liquidityDelta;
+        liquidityAfter = snapshot.liquidity + liquidityDelta;
     }
 
     /// @inheritdoc IQuoter
@@ -935,39 +1750,383 @@ contract Quoter is
                 oracle: params.oracle
             })
         );
+        (
+            liquidityDelta,
+            amount0,
+            amount1,
+            liquidityAfter
+        ) = _quoteRemoveLiquidity(params, _getPoolSnapshotLiquidity(pool));
+    }
 
+    /// @inheritdoc IQuoter
+    function quoteRemoveLiquidityWithState(
+        IRouter.RemoveLiquidityParams calldata params,
+        PoolState calldata state
+    )
+        external
+        pure
+        returns (
+            uint128 liquidityDelta,
+            uint256 amount0,
+            uint256 amount1,
+            uint128 liquidityAfter
+        )
+    {
         (
-            uint160 sqrtPriceX96,
-            ,
-            uint128 liquidity,
-            ,
-            ,
-            ,
-            ,
-            bool initialized
-        ) = pool.state();
-        if (!initialized) revert("Not initialized");
+            liquidityDelta,
+            amount0,
+            amount1,
+            liquidityAfter
+        ) = _quoteRemoveLiquidity(params, _toPoolSnapshot(state));
+    }
 
-        // cache needed pool state
-        uint256 totalSupply = pool.totalSupply();
-        uint128 liquidityLocked = pool.liquidityLocked();
+    /// @notice Quotes the amounts out result of Router::removeLiquidity given a pool state snapshot
+    /// @param params Param inputs to Router::removeLiquidity
+    /// @param snapshot The state of the pool to remove liquidity from
+    /// @return liquidityDelta Amount of liquidity removed from pool
+    /// @return amount0 Amount of token0 received from pool for removing liquidity
+    /// @return amount1 Amount of token1 received from pool for removing liquidity
+    /// @return liquidityAfter Pool liquidity after removing liquidity
+    function _quoteRemoveLiquidity(
+        IRouter.RemoveLiquidityParams memory params,
+        PoolSnapshot memory snapshot
+    )
+        internal
+        pure
+        returns (
+            uint128 liquidityDelta,
+            uint256 amount0,
+            uint256 amount1,
+            uint128 liquidityAfter
+        )
+    {
+        if (!snapshot.initialized) revert("Not initialized");
 
-        if (params.shares == 0 || params.shares > totalSupply)
+        if (params.shares == 0 || params.shares > snapshot.totalSupply)
             revert("Invalid shares");
 
-        uint128 totalLiquidityBefore = liquidity + liquidityLocked;
+        uint128 totalLiquidityBefore = snapshot.liquidity +
+            snapshot.liquidityLocked;
         liquidityDelta = uint128(
-            Math.mulDiv(totalLiquidityBefore, params.shares, totalSupply)
+            Math.mulDiv(
+                totalLiquidityBefore,
+                params.shares,
+                snapshot.totalSupply
+            )
         );
-        if (liquidityDelta > liquidity) revert("Invalid liquidityDelta");
+        if (liquidityDelta > snapshot.liquidity)
+            revert("Invalid liquidityDelta");
 
         (amount0, amount1) = LiquidityMath.toAmounts(
             liquidityDelta,
-            sqrtPriceX96
+            snapshot.sqrtPriceX96
         );
         if (amount0 < params.amount0Min) revert("amount0 less than min");
         if (amount1 < params.amount1Min) revert("amount1 less than min");
 
-        liquidityAfter = liquidity - liquidityDelta;
+        liquidityAfter = snapshot.liquidity - liquidityDelta;
+    }
+
+    /// @inheritdoc IQuoter
+    function quoteActions(
+        Action[] calldata actions
+    ) external view returns (bytes[] memory results) {
+        results = new bytes[](actions.length);
+
+        // pool state snapshots updated in memory after each action
+        PoolSnapshotCache memory cache = _createPoolSnapshotCache(
+            actions.length
+        );
+
+        for (uint256 i = 0; i < actions.length; i++) {
+            ActionType actionType = actions[i].actionType;
+            if (actionType == ActionType.Mint) {
+                results[i] = _simulateMint(actions[i].data, cache);
+            } else if (actionType == ActionType.ExactInputSingle) {
+                results[i] = _simulateExactInputSingle(actions[i].data, cache);
+            } else if (actionType == ActionType.ExactOutputSingle) {
+                results[i] = _simulateExactOutputSingle(
+                    actions[i].data,
+                    cache
+                );
+            } else if (actionType == ActionType.AddLiquidity) {
+                results[i] = _simulateAddLiquidity(actions[i].data, cache);
+            } else if (actionType == ActionType.RemoveLiquidity) {
+                results[i] = _simulateRemoveLiquidity(actions[i].data, cache);
+            } else {
+                results[i] = _simulateBurn(actions[i].data, cache);
+            }
+        }
+    }
+
+    /// @notice Quotes a mint action against the cached pool state then applies the result to the cached state
+    /// @param data The abi encoded param inputs to NonfungiblePositionManager::mint
+    /// @param cache The pool state snapshots cached
+    /// @return The abi encoded quoted mint result
+    function _simulateMint(
+        bytes memory data,
+        PoolSnapshotCache memory cache
+    ) internal view returns (bytes memory) {
+        INonfungiblePositionManager.MintParams memory params = abi.decode(
+            data,
+            (INonfungiblePositionManager.MintParams)
+        );
+        if (_blockTimestamp() > params.deadline) revert("Transaction too old");
+
+        PoolSnapshot memory snapshot = _getPoolSnapshotCached(
+            PoolAddress.PoolKey({
+                token0: params.token0,
+                token1: params.token1,
+                maintenance: params.maintenance,
+                oracle: params.oracle
+            }),
+            cache
+        );
+        QuoteMintResult memory result = _quoteMint(params, snapshot);
+
+        _updatePoolSnapshot(
+            snapshot,
+            result.liquidityAfter,
+            result.sqrtPriceX96After
+        );
+        snapshot.liquidityLocked = result.liquidityLockedAfter;
+
+        return abi.encode(result);
+    }
+
+    /// @notice Quotes an exact input swap action against the cached pool state then applies the result to the cached state
+    /// @param data The abi encoded param inputs to Router::exactInputSingle
+    /// @param cache The pool state snapshots cached
+    /// @return The abi encoded quoted amountOut, liquidityAfter and sqrtPriceX96After
+    function _simulateExactInputSingle(
+        bytes memory data,
+        PoolSnapshotCache memory cache
+    ) internal view returns (bytes memory) {
+        IRouter.ExactInputSingleParams memory params = abi.decode(
+            data,
+            (IRouter.ExactInputSingleParams)
+        );
+        if (_blockTimestamp() > params.deadline) revert("Transaction too old");
+
+        bool zeroForOne = params.tokenIn < params.tokenOut;
+        PoolSnapshot memory snapshot = _getPoolSnapshotCached(
+            PoolAddress.PoolKey({
+                token0: zeroForOne ? params.tokenIn : params.tokenOut,
+                token1: zeroForOne ? params.tokenOut : params.tokenIn,
+                maintenance: params.maintenance,
+                oracle: params.oracle
+            }),
+            cache
+        );
+        (
+            uint256 amountOut,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After
+        ) = _quoteExactInputSingle(params, snapshot);
+
+        _updatePoolSnapshot(snapshot, liquidityAfter, sqrtPriceX96After);
+
+        return abi.encode(amountOut, liquidityAfter, sqrtPriceX96After);
+    }
+
+    /// @notice Quotes an exact output swap action against the cached pool state then applies the result to the cached state
+    /// @param data The abi encoded param inputs to Router::exactOutputSingle
+    /// @param cache The pool state snapshots cached
+    /// @return The abi encoded quoted amountIn, liquidityAfter and sqrtPriceX96After
+    function _simulateExactOutputSingle(
+        bytes memory data,
+        PoolSnapshotCache memory cache
+    ) internal view returns (bytes memory) {
+        IRouter.ExactOutputSingleParams memory params = abi.decode(
+            data,
+            (IRouter.ExactOutputSingleParams)
+        );
+        if (_blockTimestamp() > params.deadline) revert("Transaction too old");
+
+        bool zeroForOne = params.tokenIn < params.tokenOut;
+        PoolSnapshot memory snapshot = _getPoolSnapshotCached(
+            PoolAddress.PoolKey({
+                token0: zeroForOne ? params.tokenIn : params.tokenOut,
+                token1: zeroForOne ? params.tokenOut : params.tokenIn,
+                maintenance: params.maintenance,
+                oracle: params.oracle
+            }),
+            cache
+        );
+        (
+            uint256 amountIn,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After
+        ) = _quoteExactOutputSingle(params, snapshot);
+
+        _updatePoolSnapshot(snapshot, liquidityAfter, sqrtPriceX96After);
+
+        return abi.encode(amountIn, liquidityAfter, sqrtPriceX96After);
+    }
+
+    /// @notice Quotes an add liquidity action against the cached pool state then applies the result to the cached state
+    /// @param data The abi encoded param inputs to Router::addLiquidity
+    /// @param cache The pool state snapshots cached
+    /// @return The abi encoded quoted shares, amount0, amount1 and liquidityAfter
+    function _simulateAddLiquidity(
+        bytes memory data,
+        PoolSnapshotCache memory cache
+    ) internal view returns (bytes memory) {
+        IRouter.AddLiquidityParams memory params = abi.decode(
+            data,
+            (IRouter.AddLiquidityParams)
+        );
+        if (_blockTimestamp() > params.deadline) revert("Transaction too old");
+
+        PoolSnapshot memory snapshot = _getPoolSnapshotCached(
+            PoolAddress.PoolKey({
+                token0: params.token0,
+                token1: params.token1,
+                maintenance: params.maintenance,
+                oracle: params.oracle
+            }),
+            cache
+        );
+        _syncPoolSnapshotTotalSupply(snapshot);
+        (
+            uint256 shares,
+            uint256 amount0,
+            uint256 amount1,
+            uint128 liquidityAfter
+        ) = _quoteAddLiquidity(params, snapshot);
+
+        snapshot.liquidity = liquidityAfter;
+        snapshot.totalSupply += shares;
+
+        return abi.encode(shares, amount0, amount1, liquidityAfter);
+    }
+
+    /// @notice Quotes a remove liquidity action against the cached pool state then applies the result to the cached state
+    /// @param data The abi encoded param inputs to Router::removeLiquidity
+    /// @param cache The pool state snapshots cached
+    /// @return The abi encoded quoted liquidityDelta, amount0, amount1 and liquidityAfter
+    function _simulateRemoveLiquidity(
+        bytes memory data,
+        PoolSnapshotCache memory cache
+    ) internal view returns (bytes memory) {
+        IRouter.RemoveLiquidityParams memory params = abi.decode(
+            data,
+            (IRouter.RemoveLiquidityParams)
+        );
+        if (_blockTimestamp() > params.deadline) revert("Transaction too old");
+
+        PoolSnapshot memory snapshot = _getPoolSnapshotCached(
+            PoolAddress.PoolKey({
+                token0: params.token0,
+                token1: params.token1,
+                maintenance: params.maintenance,
+                oracle: params.oracle
+            }),
+            cache
+        );
+        _syncPoolSnapshotTotalSupply(snapshot);
+        (
+            uint128 liquidityDelta,
+            uint256 amount0,
+            uint256 amount1,
+            uint128 liquidityAfter
+        ) = _quoteRemoveLiquidity(params, snapshot);
+
+        snapshot.liquidity = liquidityAfter;
+        snapshot.totalSupply -= params.shares;
+
+        return abi.encode(liquidityDelta, amount0, amount1, liquidityAfter);
+    }
+
+    /// @notice Quotes a burn action against the cached pool state then applies the result to the cached state
+    /// @dev Only positions existing on the pool prior to the simulation can be burned
+    /// @param data The abi encoded param inputs to NonfungiblePositionManager::burn
+    /// @param cache The pool state snapshots cached
+    /// @return The abi encoded quoted burn result
+    function _simulateBurn(
+        bytes memory data,
+        PoolSnapshotCache memory cache
+    ) internal view returns (bytes memory) {
+        INonfungiblePositionManager.BurnParams memory params = abi.decode(
+            data,
+            (INonfungiblePositionManager.BurnParams)
+        );
+        if (_blockTimestamp() > params.deadline) revert("Transaction too old");
+
+        PoolSnapshot memory snapshot = _getPoolSnapshotCached(
+            PoolAddress.PoolKey({
+                token0: params.token0,
+                token1: params.token1,
+                maintenance: params.maintenance,
+                oracle: params.oracle
+            }),
+            cache
+        );
+        QuoteBurnResult memory result = _quoteBurn(params.tokenId, snapshot);
+
+        _updatePoolSnapshot(
+            snapshot,
+            result.liquidityAfter,
+            result.sqrtPriceX96After
+        );
+        snapshot.liquidityLocked = result.liquidityLockedAfter;
+
+        return abi.encode(result);
+    }
+
+    /// @notice Updates the pool state snapshot for a change in pool liquidity and sqrt price
+    /// @param snapshot The pool state snapshot to update
+    /// @param liquidity The pool liquidity after the change
+    /// @param sqrtPriceX96 The pool sqrt price after the change
+    function _updatePoolSnapshot(
+        PoolSnapshot memory snapshot,
+        uint128 liquidity,
+        uint160 sqrtPriceX96
+    ) internal pure {
+        snapshot.liquidity = liquidity;
+        snapshot.sqrtPriceX96 = sqrtPriceX96;
+        snapshot.tick = TickMath.getTickAtSqrtRatio(sqrtPriceX96);
+    }
+
+    /// @notice Gets the pool state needed to quote adding or removing liquidity on the pool
+    /// @param pool The pool to snapshot
+    /// @return snapshot The pool state snapshot
+    function _getPoolSnapshotLiquidity(
+        IMarginalV1Pool pool
+    ) internal view returns (PoolSnapshot memory snapshot) {
+        snapshot.pool = address(pool);
+        (
+            snapshot.sqrtPriceX96,
+            ,
+            snapshot.liquidity,
+            ,
+            ,
+            ,
+            ,
+            snapshot.initialized
+        ) = pool.state();
+        if (!snapshot.initialized) return snapshot;
+
+        snapshot.totalSupply = pool.totalSupply();
+        snapshot.totalSupplySynced = true;
+        snapshot.liquidityLocked = pool.liquidityLocked();
+    }
+
+    /// @notice Converts injected pool state into a pool state snapshot to quote against
+    /// @param state The injected pool state
+    /// @return snapshot The pool state snapshot
+    function _toPoolSnapshot(
+        PoolState memory state
+    ) internal pure returns (PoolSnapshot memory snapshot) {
+        snapshot.sqrtPriceX96 = state.sqrtPriceX96;
+        snapshot.liquidity = state.liquidity;
+        snapshot.feeProtocol = state.feeProtocol;
+        snapshot.initialized = state.sqrtPriceX96 > 0;
+        snapshot.liquidityLocked = state.liquidityLocked;
+        snapshot.totalSupply = state.totalSupply;
+        snapshot.totalSupplySynced = true;
+        snapshot.oracleTickCumulativeDelta = state.oracleTickCumulativeDelta;
+        if (snapshot.initialized)
+            snapshot.tick = TickMath.getTickAtSqrtRatio(state.sqrtPriceX96);
     }
 }
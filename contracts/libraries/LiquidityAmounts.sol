@@ -51,4 +51,38 @@ library LiquidityAmounts {
 
         liquidity = liquidity0 < liquidity1 ? liquidity0 : liquidity1;
     }
+
+    /// @notice Gets the amount of a single token to swap through the pool so the remainder and swap output
+    /// match the pool reserve ratio after the swap
+    /// @dev Closed form for x * y = L^2 with swap fees added to reserves. Solves
+    /// (amountIn - s) / out = (r + s) / (r' - out) for s, where r is the reserve of the token in and out is the swap
+    /// output after fees. Gives s = 2 * amountIn * r / (sqrt(r^2 * (1 + g)^2 + 4 * g * r * amountIn) + r * (1 + g))
+    /// with g = 1 - fee
+    /// @param liquidity The liquidity of the pool
+    /// @param sqrtPriceX96 The sqrt price of the pool
+    /// @param zeroForOne Whether the single token in is token0
+    /// @param amountIn The total amount of the single token in
+    /// @param fee The swap fee of the pool in hundredths of a bip
+    /// @return amountSwap The amount of the token in to swap for the other token
+    function getAmountSwapForSingle(
+        uint128 liquidity,
+        uint160 sqrtPriceX96,
+        bool zeroForOne,
+        uint256 amountIn,
+        uint24 fee
+    ) internal pure returns (uint256 amountSwap) {
+        uint256 reserve = zeroForOne
+            ? (uint256(liquidity) << FixedPoint96.RESOLUTION) / sqrtPriceX96
+            : Math.mulDiv(liquidity, sqrtPriceX96, FixedPoint96.Q96);
+        uint256 g = 1e6 - uint256(fee);
+        uint256 b = reserve * (1e6 + g); // r * (1 + g) scaled by 1e6
+
+        // sqrt(r^2 * (1 + g)^2 + 4 * g * r * amountIn) scaled by 1e6, avoiding overflow for large reserves
+        uint256 c = reserve * (1e6 + g) ** 2 + 4 * g * 1e6 * amountIn;
+        uint256 sqrtD = reserve <= type(uint256).max / c
+            ? Math.sqrt(reserve * c)
+            : Math.sqrt(reserve) * Math.sqrt(c);
+
+        amountSwap = Math.mulDiv(2 * 1e6 * amountIn, reserve, sqrtD + b);
+    }
 }
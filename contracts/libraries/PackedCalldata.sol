@@ -0,0 +1,202 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.0;
+
+import {IRouter} from "../interfaces/IRouter.sol";
+import {INonfungiblePositionManager} from "../interfaces/INonfungiblePositionManager.sol";
+
+/// @title Packed calldata library
+/// @notice Decodes tightly packed calldata into router and manager params to reduce calldata posted on rollups
+/// @dev Addresses are packed as 20 bytes, maintenance as 3 bytes, token ids as 12 bytes, amounts as 16 bytes,
+/// sqrt price limits as 20 bytes and deadlines as 4 byte timestamps
+library PackedCalldata {
+    /// @dev The length of the bytes encoded address
+    uint256 private constant ADDR_SIZE = 20;
+    /// @dev The length of the bytes encoded maintenance
+    uint256 private constant MAINTENANCE_SIZE = 3;
+    /// @dev The length of the bytes encoded token id
+    uint256 private constant TOKEN_ID_SIZE = 12;
+    /// @dev The length of the bytes encoded amount
+    uint256 private constant AMOUNT_SIZE = 16;
+    /// @dev The length of the bytes encoded sqrt price limit
+    uint256 private constant SQRT_PRICE_SIZE = 20;
+    /// @dev The length of the bytes encoded deadline
+    uint256 private constant DEADLINE_SIZE = 4;
+
+    /// @dev The length of the bytes encoded pool key: token0 + token1 + maintenance + oracle
+    uint256 private constant POOL_KEY_SIZE =
+        ADDR_SIZE + ADDR_SIZE + MAINTENANCE_SIZE + ADDR_SIZE;
+
+    /// @notice Reads the packed address at `start` in `data`
+    function toAddress(
+        bytes calldata data,
+        uint256 start
+    ) internal pure returns (address) {
+        return address(bytes20(data[start:start + ADDR_SIZE]));
+    }
+
+    /// @notice Reads the packed maintenance at `start` in `data`
+    function toUint24(
+        bytes calldata data,
+        uint256 start
+    ) internal pure returns (uint24) {
+        return uint24(bytes3(data[start:start + MAINTENANCE_SIZE]));
+    }
+
+    /// @notice Reads the packed deadline at `start` in `data`
+    function toUint32(
+        bytes calldata data,
+        uint256 start
+    ) internal pure returns (uint32) {
+        return uint32(bytes4(data[start:start + DEADLINE_SIZE]));
+    }
+
+    /// @notice Reads the packed token id at `start` in `data`
+    function toUint96(
+        bytes calldata data,
+        uint256 start
+    ) internal pure returns (uint96) {
+        return uint96(bytes12(data[start:start + TOKEN_ID_SIZE]));
+    }
+
+    /// @notice Reads the packed amount at `start` in `data`
+    function toUint128(
+        bytes calldata data,
+        uint256 start
+    ) internal pure returns (uint128) {
+        return uint128(bytes16(data[start:start + AMOUNT_SIZE]));
+    }
+
+    /// @notice Reads the packed sqrt price limit at `start` in `data`
+    function toUint160(
+        bytes calldata data,
+        uint256 start
+    ) internal pure returns (uint160) {
+        return uint160(bytes20(data[start:start + SQRT_PRICE_SIZE]));
+    }
+
+    /// @notice Decodes packed exact input single params
+    /// @dev Layout: tokenIn (20) | tokenOut (20) | maintenance (3) | oracle (20) | recipient (20) | deadline (4) | amountIn (16) | amountOutMinimum (16) | sqrtPriceLimitX96 (20)
+    /// @param data The packed params
+    /// @return params The decoded params
+    function decodeExactInputSingleParams(
+        bytes calldata data
+    )
+        internal
+        pure
+        returns (IRouter.ExactInputSingleParams memory params)
+    {
+        params.tokenIn = toAddress(data, 0);
+        params.tokenOut = toAddress(data, 20);
+        params.maintenance = toUint24(data, 40);
+        params.oracle = toAddress(data, 43);
+        params.recipient = toAddress(data, 63);
+        params.deadline = toUint32(data, 83);
+        params.amountIn = toUint128(data, 87);
+        params.amountOutMinimum = toUint128(data, 103);
+        params.sqrtPriceLimitX96 = toUint160(data, 119);
+    }
+
+    /// @notice Decodes packed exact input params
+    /// @dev Layout: recipient (20) | deadline (4) | amountIn (16) | amountOutMinimum (16) | path (remaining).
+    /// Path is returned as a calldata slice to avoid copying to memory
+    /// @param data The packed params
+    /// @return recipient The recipient of the swap output
+    /// @return deadline The deadline timestamp for the swap
+    /// @return amountIn The amount of the input token to swap
+    /// @return amountOutMinimum The minimum amount of the output token to receive
+    /// @return path The encoded swap path
+    function decodeExactInputParams(
+        bytes calldata data
+    )
+        internal
+        pure
+        returns (
+            address recipient,
+            uint256 deadline,
+            uint256 amountIn,
+            uint256 amountOutMinimum,
+            bytes calldata path
+        )
+    {
+        recipient = toAddress(data, 0);
+        deadline = toUint32(data, 20);
+        amountIn = toUint128(data, 24);
+        amountOutMinimum = toUint128(data, 40);
+        path = data[56:];
+    }
+
+    /// @notice Decodes packed mint params
+    /// @dev Layout: pool key (63) | zeroForOne (1) | sizeDesired (16) | sizeMinimum (16) | debtMaximum (16) | amountInMaximum (16) | sqrtPriceLimitX96 (20) | margin (16) | recipient (20) | deadline (4)
+    /// @param data The packed params
+    /// @return params The decoded params
+    function decodeMintParams(
+        bytes calldata data
+    )
+        internal
+        pure
+        returns (INonfungiblePositionManager.MintParams memory params)
+    {
+        params.token0 = toAddress(data, 0);
+        params.token1 = toAddress(data, 20);
+        params.maintenance = toUint24(data, 40);
+        params.oracle = toAddress(data, 43);
+        params.zeroForOne = data[POOL_KEY_SIZE] != 0;
+        params.sizeDesired = toUint128(data, 64);
+        params.sizeMinimum = toUint128(data, 80);
+        params.debtMaximum = toUint128(data, 96);
+        params.amountInMaximum = toUint128(data, 112);
+        params.sqrtPriceLimitX96 = toUint160(data, 128);
+        params.margin = toUint128(data, 148);
+        params.recipient = toAddress(data, 164);
+        params.deadline = toUint32(data, 184);
+    }
+
+    /// @notice Decodes packed lock by id params
+    /// @dev Layout: tokenId (12) | marginIn (16) | deadline (4)
+    /// @param data The packed params
+    /// @return params The decoded params
+    function decodeLockByIdParams(
+        bytes calldata data
+    )
+        internal
+        pure
+        returns (INonfungiblePositionManager.LockByIdParams memory params)
+    {
+        params.tokenId = toUint96(data, 0);
+        params.marginIn = toUint128(data, 12);
+        params.deadline = toUint32(data, 28);
+    }
+
+    /// @notice Decodes packed free by id params
+    /// @dev Layout: tokenId (12) | marginOut (16) | recipient (20) | deadline (4)
+    /// @param data The packed params
+    /// @return params The decoded params
+    function decodeFreeByIdParams(
+        bytes calldata data
+    )
+        internal
+        pure
+        returns (INonfungiblePositionManager.FreeByIdParams memory params)
+    {
+        params.tokenId = toUint96(data, 0);
+        params.marginOut = toUint128(data, 12);
+        params.recipient = toAddress(data, 28);
+        params.deadline = toUint32(data, 48);
+    }
+
+    /// @notice Decodes packed burn by id params
+    /// @dev Layout: tokenId (12) | recipient (20) | deadline (4)
+    /// @param data The packed params
+    /// @return params The decoded params
+    function decodeBurnByIdParams(
+        bytes calldata data
+    )
+        internal
+        pure
+        returns (INonfungiblePositionManager.BurnByIdParams memory params)
+    {
+        params.tokenId = toUint96(data, 0);
+        params.recipient = toAddress(data, 12);
+        params.deadline = toUint32(data, 32);
+    }
+}
@@ -1,5 +1,5 @@
 // SPDX-License-Identifier: GPL-2.0-or-later
-pragma solidity >=0.6.0;
+pragma solidity >=0.8.13;
 
 import "@uniswap/v3-periphery/contracts/libraries/BytesLib.sol";
 
@@ -76,4 +76,96 @@ library Path {
     function skipToken(bytes memory path) internal pure returns (bytes memory) {
         return path.slice(NEXT_OFFSET, path.length - NEXT_OFFSET);
     }
+
+    /// @notice Returns true iff the path from the cursor offset onward contains two or more pools
+    /// @dev Calldata path functions walk the path with an offset cursor instead of copying the remainder on each hop
+    /// @param path The calldata encoded swap path
+    /// @param offset The cursor offset in path of the current pool
+    /// @return True if path from offset contains two or more pools, otherwise false
+    function hasMultiplePoolsAt(
+        bytes calldata path,
+        uint256 offset
+    ) internal pure returns (bool) {
+        return path.length - offset >= MULTIPLE_POOLS_MIN_LENGTH;
+    }
+
+    /// @notice Returns the number of pools in the path from the cursor offset onward
+    /// @param path The calldata encoded swap path
+    /// @param offset The cursor offset in path of the current pool
+    /// @return The number of pools in the path from offset
+    function numPoolsAt(
+        bytes calldata path,
+        uint256 offset
+    ) internal pure returns (uint256) {
+        return ((path.length - offset - ADDR_SIZE) / NEXT_OFFSET);
+    }
+
+    /// @notice Decodes the pool at the cursor offset in path
+    /// @param path The calldata encoded swap path
+    /// @param offset The cursor offset in path of the pool
+    /// @return tokenA The first token of the given pool
+    /// @return tokenB The second token of the given pool
+    /// @return maintenance The maintenance level of the pool
+    /// @return oracle The oracle referenced by the given pool
+    function decodePoolAt(
+        bytes calldata path,
+        uint256 offset
+    )
+        internal
+        pure
+        returns (
+            address tokenA,
+            address tokenB,
+            uint24 maintenance,
+            address oracle
+        )
+    {
+        bytes calldata pool = path[offset:offset + POP_OFFSET];
+        tokenA = address(bytes20(pool[:ADDR_SIZE]));
+        maintenance = uint24(bytes3(pool[ADDR_SIZE:]));
+        oracle = address(bytes20(pool[ADDR_SIZE + MAINTENANCE_SIZE:]));
+        tokenB = address(bytes20(pool[NEXT_OFFSET:]));
+    }
+
+    /// @notice Decodes the last token in path
+    /// @param path The calldata encoded swap path
+    /// @return token The last token in the path
+    function decodeLastToken(
+        bytes calldata path
+    ) internal pure returns (address token) {
+        token = address(bytes20(path[path.length - ADDR_SIZE:]));
+    }
+
+    /// @notice Gets the segment corresponding to the pool at the cursor offset in path without copying
+    /// @param path The calldata encoded swap path
+    /// @param offset The cursor offset in path of the pool
+    /// @return The segment containing all data necessary to target the pool at offset in the path
+    function getPoolAt(
+        bytes calldata path,
+        uint256 offset
+    ) internal pure returns (bytes calldata) {
+        return path[offset:offset + POP_OFFSET];
+    }
+
+    /// @notice Advances the cursor offset past a token + maintenance + oracle element
+    /// @param offset The cursor offset in path of the current pool
+    /// @return The cursor offset in path of the next pool
+    function skipTokenAt(uint256 offset) internal pure returns (uint256) {
+        return offset + NEXT_OFFSET;
+    }
+
+    /// @notice Skips a token + maintenance + oracle element from the buffer in place, reusing the path memory
+    /// @dev Overwrites the skipped element with the length of the remainder, so `path` must not be used after
+    /// @param path The swap path
+    /// @return rest The remaining token + maintenance + oracle elements in the path
+    function skipTokenInPlace(
+        bytes memory path
+    ) internal pure returns (bytes memory rest) {
+        require(path.length >= NEXT_OFFSET, "skipToken_outOfBounds");
+        uint256 length = path.length - NEXT_OFFSET;
+        assembly ("memory-safe") {
+            rest := add(path, NEXT_OFFSET)
+            mstore(rest, length)
+        }
+    }
 }
@@ -38,7 +38,8 @@ library PoolAddress {
     }
 
     /// @notice Gets the pool address from factory given pool key
-    /// @dev Reverts if pool not created yet
+    /// @dev Reverts if pool not created yet. Unlike Uniswap v3, pool address can not be derived from a constant
+    /// init code hash as the pool deployer passes the pool key as constructor args included in the init code
     /// @param factory The factory contract address
     /// @param key The pool key
     /// @return pool The contract address of the pool
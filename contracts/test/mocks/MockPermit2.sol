@@ -0,0 +1,32 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.17;
+
+import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+
+import {ISignatureTransfer} from "../../interfaces/ISignatureTransfer.sol";
+
+/// @dev Permit2 signature transfer without signature verification for local tests
+contract MockPermit2 is ISignatureTransfer {
+    mapping(address => mapping(uint256 => bool)) public nonceUsed;
+
+    function permitTransferFrom(
+        PermitTransferFrom memory permit,
+        SignatureTransferDetails calldata transferDetails,
+        address owner,
+        bytes calldata
+    ) external {
+        require(block.timestamp <= permit.deadline, "signature expired");
+        require(
+            transferDetails.requestedAmount <= permit.permitted.amount,
+            "invalid amount"
+        );
+        require(!nonceUsed[owner][permit.nonce], "invalid nonce");
+        nonceUsed[owner][permit.nonce] = true;
+
+        IERC20(permit.permitted.token).transferFrom(
+            owner,
+            transferDetails.to,
+            transferDetails.requestedAmount
+        );
+    }
+}
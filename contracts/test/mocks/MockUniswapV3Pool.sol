@@ -15,6 +15,7 @@ contract MockUniswapV3Pool {
     address public immutable token0;
     address public immutable token1;
     uint24 public immutable fee;
+    int24 public tickSpacing;
 
     struct Observation {
         uint32 blockTimestamp;
@@ -70,6 +71,17 @@ contract MockUniswapV3Pool {
         token0 = _token0;
         token1 = _token1;
         fee = _fee;
+        tickSpacing = _fee == 100
+            ? int24(1)
+            : (
+                _fee == 500
+                    ? int24(10)
+                    : (_fee == 3000 ? int24(60) : int24(200))
+            );
+    }
+
+    function setTickSpacing(int24 _tickSpacing) external {
+        tickSpacing = _tickSpacing;
     }
 
     function setSlot0(Slot0 memory _slot0) external {
@@ -30,4 +30,21 @@ contract MockLiquidityAmounts {
                 amount1
             );
     }
+
+    function getAmountSwapForSingle(
+        uint128 liquidity,
+        uint160 sqrtPriceX96,
+        bool zeroForOne,
+        uint256 amountIn,
+        uint24 fee
+    ) external pure returns (uint256) {
+        return
+            LiquidityAmounts.getAmountSwapForSingle(
+                liquidity,
+                sqrtPriceX96,
+                zeroForOne,
+                amountIn,
+                fee
+            );
+    }
 }
@@ -36,4 +36,57 @@ contract MockPath {
     function skipToken(bytes memory path) external pure returns (bytes memory) {
         return Path.skipToken(path);
     }
+
+    function hasMultiplePoolsAt(
+        bytes calldata path,
+        uint256 offset
+    ) external pure returns (bool) {
+        return Path.hasMultiplePoolsAt(path, offset);
+    }
+
+    function numPoolsAt(
+        bytes calldata path,
+        uint256 offset
+    ) external pure returns (uint256) {
+        return Path.numPoolsAt(path, offset);
+    }
+
+    function decodePoolAt(
+        bytes calldata path,
+        uint256 offset
+    )
+        external
+        pure
+        returns (
+            address tokenA,
+            address tokenB,
+            uint24 maintenance,
+            address oracle
+        )
+    {
+        return Path.decodePoolAt(path, offset);
+    }
+
+    function decodeLastToken(
+        bytes calldata path
+    ) external pure returns (address) {
+        return Path.decodeLastToken(path);
+    }
+
+    function getPoolAt(
+        bytes calldata path,
+        uint256 offset
+    ) external pure returns (bytes memory) {
+        return Path.getPoolAt(path, offset);
+    }
+
+    function skipTokenAt(uint256 offset) external pure returns (uint256) {
+        return Path.skipTokenAt(offset);
+    }
+
+    function skipTokenInPlace(
+        bytes memory path
+    ) external pure returns (bytes memory) {
+        return Path.skipTokenInPlace(path);
+    }
 }
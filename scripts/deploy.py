@@ -1,6 +1,7 @@
 import click
 
 from ape import accounts, chain, project
+from ape.utils import ZERO_ADDRESS
 
 
 def main():
@@ -31,10 +32,17 @@ def main():
             f"Deployed Marginal v1 NFT position descriptor to {descriptor.address}"
         )
 
+        permit2_address = click.prompt(
+            "Permit2 address",
+            type=str,
+            default="0x000000000022D473030F116dDEE9F6B43aC78BA3",
+        )
+
         click.echo("Deploying Marginal v1 NFT position manager ...")
         manager = project.NonfungiblePositionManager.deploy(
             factory_address,
             weth9_address,
+            permit2_address,
             descriptor.address,
             sender=deployer,
             publish=publish,
@@ -59,7 +67,11 @@ def main():
             manager_address = click.prompt(
                 "Marginal v1 NFT position manager address", type=str
             )
-        quoter_address = click.prompt("Uniswap v3 static quoter address", type=str)
+        quoter_address = click.prompt(
+            "Uniswap v3 static quoter address (optional)",
+            type=str,
+            default=ZERO_ADDRESS,
+        )
 
         click.echo("Deploying Marginal v1 quoter ...")
         quoter = project.Quoter.deploy(
@@ -264,9 +264,18 @@ def descriptor(project, accounts):
 
 
 @pytest.fixture(scope="session")
-def manager(project, accounts, factory, WETH9, descriptor):
+def permit2(project, accounts):
+    return project.MockPermit2.deploy(sender=accounts[0])
+
+
+@pytest.fixture(scope="session")
+def manager(project, accounts, factory, WETH9, permit2, descriptor):
     return project.NonfungiblePositionManager.deploy(
-        factory.address, WETH9.address, descriptor.address, sender=accounts[0]
+        factory.address,
+        WETH9.address,
+        permit2.address,
+        descriptor.address,
+        sender=accounts[0],
     )
 
 
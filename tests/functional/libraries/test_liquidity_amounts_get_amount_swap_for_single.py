@@ -0,0 +1,59 @@
+import pytest
+
+from utils.constants import FEE, FEE_UNIT
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_liquidity_amounts_get_amount_swap_for_single__matches_reserve_ratio_after_swap(
+    liquidity_amounts_lib,
+    zero_for_one,
+):
+    state_liquidity = 29942224366269117
+    state_sqrt_price_x96 = 1897197579566573828015003434745856
+
+    (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+        state_liquidity, state_sqrt_price_x96
+    )
+    reserve_in = reserve0 if zero_for_one else reserve1
+    reserve_out = reserve1 if zero_for_one else reserve0
+    amount_in = reserve_in * 5 // 100  # 5% of reserves
+
+    amount_swap = liquidity_amounts_lib.getAmountSwapForSingle(
+        state_liquidity, state_sqrt_price_x96, zero_for_one, amount_in, FEE
+    )
+
+    # constant product with fees added to reserves after swap
+    amount_swap_less_fee = amount_swap - (amount_swap * FEE) // FEE_UNIT
+    amount_out = (reserve_out * amount_swap_less_fee) // (
+        reserve_in + amount_swap_less_fee
+    )
+    reserve_in_after = reserve_in + amount_swap
+    reserve_out_after = reserve_out - amount_out
+
+    assert pytest.approx((amount_in - amount_swap) / amount_out, rel=1e-9) == (
+        reserve_in_after / reserve_out_after
+    )
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_liquidity_amounts_get_amount_swap_for_single__approx_half_when_small(
+    liquidity_amounts_lib,
+    zero_for_one,
+):
+    state_liquidity = 29942224366269117
+    state_sqrt_price_x96 = 1897197579566573828015003434745856
+
+    (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+        state_liquidity, state_sqrt_price_x96
+    )
+    reserve_in = reserve0 if zero_for_one else reserve1
+    amount_in = reserve_in // 1000000  # small relative to reserves
+
+    amount_swap = liquidity_amounts_lib.getAmountSwapForSingle(
+        state_liquidity, state_sqrt_price_x96, zero_for_one, amount_in, FEE
+    )
+
+    # swap fraction -> 1 / (2 - fee) for amounts small relative to reserves
+    fraction = 1 / (2 - FEE / FEE_UNIT)
+    assert pytest.approx(amount_swap / amount_in, rel=1e-4) == fraction
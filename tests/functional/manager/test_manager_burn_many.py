@@ -0,0 +1,386 @@
+import pytest
+
+from ape import reverts
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+    FUNDING_PERIOD,
+    TICK_CUMULATIVE_RATE_MAX,
+    BASE_FEE_MIN,
+    GAS_LIQUIDATE,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96, get_position_key
+
+
+@pytest.fixture
+def mint_position(
+    pool_initialized_with_liquidity, position_lib, chain, manager, sender
+):
+    def mint(zero_for_one: bool) -> int:
+        state = pool_initialized_with_liquidity.state()
+        maintenance = pool_initialized_with_liquidity.maintenance()
+        oracle = pool_initialized_with_liquidity.oracle()
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = reserve * 1 // 100  # 1% of reserves
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        size_min = (size * 80) // 100
+        debt_max = 2**128 - 1
+        amount_in_max = 2**256 - 1
+        deadline = chain.pending_timestamp + 3600
+
+        mint_params = (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            maintenance,
+            oracle,
+            zero_for_one,
+            size,
+            size_min,
+            debt_max,
+            amount_in_max,
+            sqrt_price_limit_x96,
+            margin,
+            sender.address,
+            deadline,
+        )
+
+        premium = pool_initialized_with_liquidity.rewardPremium()
+        base_fee = chain.blocks[-1].base_fee
+        rewards = position_lib.liquidationRewards(
+            base_fee,
+            BASE_FEE_MIN,
+            GAS_LIQUIDATE,
+            premium,
+        )
+
+        tx = manager.mint(mint_params, sender=sender, value=rewards)
+        token_id = tx.decode_logs(manager.Mint)[0].tokenId
+        return int(token_id)
+
+    yield mint
+
+
+@pytest.fixture
+def mint_position_with_WETH9(
+    pool_with_WETH9_initialized_with_liquidity, chain, position_lib, manager, sender
+):
+    def mint(zero_for_one: bool) -> int:
+        state = pool_with_WETH9_initialized_with_liquidity.state()
+        maintenance = pool_with_WETH9_initialized_with_liquidity.maintenance()
+        oracle = pool_with_WETH9_initialized_with_liquidity.oracle()
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = reserve * 1 // 100  # 1% of reserves
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        size_min = (size * 80) // 100
+        debt_max = 2**128 - 1
+        amount_in_max = 2**256 - 1
+        deadline = chain.pending_timestamp + 3600
+
+        mint_params = (
+            pool_with_WETH9_initialized_with_liquidity.token0(),
+            pool_with_WETH9_initialized_with_liquidity.token1(),
+            maintenance,
+            oracle,
+            zero_for_one,
+            size,
+            size_min,
+            debt_max,
+            amount_in_max,
+            sqrt_price_limit_x96,
+            margin,
+            sender.address,
+            deadline,
+        )
+
+        premium = pool_with_WETH9_initialized_with_liquidity.rewardPremium()
+        base_fee = chain.blocks[-1].base_fee
+        rewards = position_lib.liquidationRewards(
+            base_fee,
+            BASE_FEE_MIN,
+            GAS_LIQUIDATE,
+            premium,
+        )
+
+        tx = manager.mint(mint_params, sender=sender, value=rewards)
+        token_id = tx.decode_logs(manager.Mint)[0].tokenId
+        return int(token_id)
+
+    yield mint
+
+
+def test_manager_burn_many__settles_positions(
+    pool_initialized_with_liquidity,
+    manager,
+    sender,
+    alice,
+    chain,
+    mock_univ3_pool,
+    position_lib,
+    token0,
+    token1,
+    mint_position,
+):
+    zero_for_ones = [True, False, True]
+    token_ids = [mint_position(zero_for_one) for zero_for_one in zero_for_ones]
+
+    total_positions = pool_initialized_with_liquidity.state().totalPositions
+    position_ids = [total_positions - len(token_ids) + i for i in range(len(token_ids))]
+    keys = [get_position_key(manager.address, id) for id in position_ids]
+    positions = [pool_initialized_with_liquidity.positions(key) for key in keys]
+
+    balance0_sender = token0.balanceOf(sender.address)
+    balance1_sender = token1.balanceOf(sender.address)
+
+    block_timestamp_next = chain.pending_timestamp
+    deadline = chain.pending_timestamp + 3600
+    burn_params = [
+        (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            pool_initialized_with_liquidity.maintenance(),
+            pool_initialized_with_liquidity.oracle(),
+            token_id,
+            alice.address,
+            deadline,
+        )
+        for token_id in token_ids
+    ]
+    tx = manager.burnMany(burn_params, sender=sender)
+
+    state = pool_initialized_with_liquidity.state()
+    tick_cumulative_last = state.tickCumulative
+    oracle_tick_cumulatives, _ = mock_univ3_pool.observe([0])
+
+    debts0 = 0
+    debts1 = 0
+    events = tx.decode_logs(manager.Burn)
+    assert len(events) == len(token_ids)
+
+    for i, zero_for_one in enumerate(zero_for_ones):
+        # sync then settle position
+        position = position_lib.sync(
+            positions[i],
+            block_timestamp_next,
+            tick_cumulative_last,
+            oracle_tick_cumulatives[0],
+            TICK_CUMULATIVE_RATE_MAX,
+            FUNDING_PERIOD,
+        )
+        debt = position.debt0 if zero_for_one else position.debt1
+        amount_out = position.size + position.margin
+        rewards = position.rewards
+
+        if zero_for_one:
+            debts0 += debt
+        else:
+            debts1 += debt
+
+        position = position_lib.settle(position)
+        assert pool_initialized_with_liquidity.positions(keys[i]) == position
+
+        # manager position deleted
+        with reverts():
+            manager.positions(token_ids[i])
+
+        event = events[i]
+        assert event.tokenId == token_ids[i]
+        assert event.sender == sender.address
+        assert event.recipient == alice.address
+        assert event.amountIn == debt
+        assert event.amountOut == amount_out
+        assert event.rewards == rewards
+
+    # tokens burned
+    assert manager.balanceOf(sender.address) == 0
+
+    # debts netted per token pulled from sender once each
+    assert token0.balanceOf(sender.address) == balance0_sender - debts0
+    assert token1.balanceOf(sender.address) == balance1_sender - debts1
+
+    transfers0 = [
+        log
+        for log in tx.decode_logs(token0.Transfer)
+        if log.contract_address == token0.address
+        and log.event_arguments["from"] == sender.address
+    ]
+    transfers1 = [
+        log
+        for log in tx.decode_logs(token1.Transfer)
+        if log.contract_address == token1.address
+        and log.event_arguments["from"] == sender.address
+    ]
+    assert len(transfers0) == 1
+    assert len(transfers1) == 1
+
+    # no tokens left in manager
+    assert token0.balanceOf(manager.address) == 0
+    assert token1.balanceOf(manager.address) == 0
+
+
+def test_manager_burn_many__deposits_WETH9_with_excess_value(
+    pool_with_WETH9_initialized_with_liquidity,
+    manager,
+    sender,
+    alice,
+    chain,
+    WETH9,
+    token0_with_WETH9,
+    token1_with_WETH9,
+    mint_position_with_WETH9,
+):
+    zero_for_one = token0_with_WETH9.address == WETH9.address  # debt in WETH9 if true
+    token_ids = [mint_position_with_WETH9(zero_for_one) for _ in range(2)]
+
+    # set WETH9 allowance to zero to ensure all payment in ETH
+    WETH9.approve(manager.address, 0, sender=sender)
+
+    total_positions = pool_with_WETH9_initialized_with_liquidity.state().totalPositions
+    position_ids = [total_positions - len(token_ids) + i for i in range(len(token_ids))]
+    keys = [get_position_key(manager.address, id) for id in position_ids]
+    positions = [
+        pool_with_WETH9_initialized_with_liquidity.positions(key) for key in keys
+    ]
+    debts = sum(
+        position.debt0 if zero_for_one else position.debt1 for position in positions
+    )
+
+    balance_WETH9_sender = WETH9.balanceOf(sender.address)
+    balancee_sender = sender.balance
+    balancee_alice = alice.balance
+
+    deadline = chain.pending_timestamp + 3600
+    burn_params = [
+        (
+            pool_with_WETH9_initialized_with_liquidity.token0(),
+            pool_with_WETH9_initialized_with_liquidity.token1(),
+            pool_with_WETH9_initialized_with_liquidity.maintenance(),
+            pool_with_WETH9_initialized_with_liquidity.oracle(),
+            token_id,
+            alice.address,
+            deadline,
+        )
+        for token_id in token_ids
+    ]
+    value = debts * 3  # excess covers each debt again to check no re-wrap
+    tx = manager.burnMany(burn_params, sender=sender, value=value)
+
+    events = tx.decode_logs(manager.Burn)
+    amount_in = sum(event.amountIn for event in events)
+    rewards = sum(event.rewards for event in events)
+
+    assert (
+        sender.balance == balancee_sender - amount_in - tx.gas_used * tx.gas_price
+    )  # excess value refunded so only debt kept
+    assert WETH9.balanceOf(sender.address) == balance_WETH9_sender
+    assert alice.balance == balancee_alice + rewards
+
+    # nothing stranded in manager
+    assert WETH9.balanceOf(manager.address) == 0
+    assert manager.balance == 0
+
+
+def test_manager_burn_many__reverts_when_not_owner(
+    pool_initialized_with_liquidity,
+    manager,
+    sender,
+    alice,
+    chain,
+    mint_position,
+):
+    token_ids = [mint_position(True), mint_position(False)]
+
+    deadline = chain.pending_timestamp + 3600
+    burn_params = [
+        (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            pool_initialized_with_liquidity.maintenance(),
+            pool_initialized_with_liquidity.oracle(),
+            token_id,
+            alice.address,
+            deadline,
+        )
+        for token_id in token_ids
+    ]
+    with reverts(manager.Unauthorized):
+        manager.burnMany(burn_params, sender=alice)
+
+
+def test_manager_burn_many__reverts_when_invalid_pool_key(
+    pool_initialized_with_liquidity,
+    manager,
+    sender,
+    alice,
+    chain,
+    mint_position,
+):
+    token_ids = [mint_position(True), mint_position(False)]
+
+    deadline = chain.pending_timestamp + 3600
+    burn_params = [
+        (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            pool_initialized_with_liquidity.maintenance(),
+            pool_initialized_with_liquidity.oracle(),
+            token_ids[0],
+            alice.address,
+            deadline,
+        ),
+        (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            pool_initialized_with_liquidity.maintenance() + 1,
+            pool_initialized_with_liquidity.oracle(),
+            token_ids[1],
+            alice.address,
+            deadline,
+        ),
+    ]
+    with reverts(manager.InvalidPoolKey):
+        manager.burnMany(burn_params, sender=sender)
+
+
+def test_manager_burn_many__reverts_when_past_deadline(
+    pool_initialized_with_liquidity,
+    manager,
+    sender,
+    alice,
+    chain,
+    mint_position,
+):
+    token_ids = [mint_position(True), mint_position(False)]
+
+    deadline = chain.pending_timestamp + 3600
+    burn_params = [
+        (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            pool_initialized_with_liquidity.maintenance(),
+            pool_initialized_with_liquidity.oracle(),
+            token_id,
+            alice.address,
+            deadline if i == 0 else chain.pending_timestamp - 1,
+        )
+        for i, token_id in enumerate(token_ids)
+    ]
+    with reverts("Transaction too old"):
+        manager.burnMany(burn_params, sender=sender)
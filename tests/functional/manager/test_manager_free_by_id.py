@@ -0,0 +1,160 @@
+import pytest
+
+from ape import reverts
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+    BASE_FEE_MIN,
+    GAS_LIQUIDATE,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96, get_position_key
+
+
+@pytest.fixture
+def mint_position(
+    pool_initialized_with_liquidity, chain, position_lib, manager, sender
+):
+    def mint(zero_for_one: bool) -> int:
+        state = pool_initialized_with_liquidity.state()
+        maintenance = pool_initialized_with_liquidity.maintenance()
+        oracle = pool_initialized_with_liquidity.oracle()
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = reserve * 1 // 100  # 1% of reserves
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        size_min = (size * 80) // 100
+        debt_max = 2**128 - 1
+        amount_in_max = 2**256 - 1
+        deadline = chain.pending_timestamp + 3600
+
+        mint_params = (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            maintenance,
+            oracle,
+            zero_for_one,
+            size,
+            size_min,
+            debt_max,
+            amount_in_max,
+            sqrt_price_limit_x96,
+            margin,
+            sender.address,
+            deadline,
+        )
+
+        premium = pool_initialized_with_liquidity.rewardPremium()
+        base_fee = chain.blocks[-1].base_fee
+        rewards = position_lib.liquidationRewards(
+            base_fee,
+            BASE_FEE_MIN,
+            GAS_LIQUIDATE,
+            premium,
+        )
+
+        tx = manager.mint(mint_params, sender=sender, value=rewards)
+        token_id = tx.decode_logs(manager.Mint)[0].tokenId
+        return int(token_id)
+
+    yield mint
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_free_by_id__adjusts_position(
+    pool_initialized_with_liquidity,
+    manager,
+    zero_for_one,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    mint_position,
+):
+    token_id = mint_position(zero_for_one)
+
+    position_id = pool_initialized_with_liquidity.state().totalPositions - 1
+    key = get_position_key(manager.address, position_id)
+    position = pool_initialized_with_liquidity.positions(key)
+
+    token = token0 if not zero_for_one else token1
+    balance_alice = token.balanceOf(alice.address)
+    balance_pool = token.balanceOf(pool_initialized_with_liquidity.address)
+
+    deadline = chain.pending_timestamp + 3600
+    margin_out = (position.margin * 25) // 100
+    free_params = (token_id, margin_out, alice.address, deadline)
+    tx = manager.freeById(free_params, sender=sender)
+
+    position.margin -= margin_out
+    assert pool_initialized_with_liquidity.positions(key) == position
+
+    assert token.balanceOf(alice.address) == balance_alice + margin_out
+    assert (
+        token.balanceOf(pool_initialized_with_liquidity.address)
+        == balance_pool - margin_out
+    )
+
+    events = tx.decode_logs(manager.Free)
+    assert len(events) == 1
+
+    event = events[0]
+    assert event.tokenId == token_id
+    assert event.sender == sender.address
+    assert event.recipient == alice.address
+    assert event.marginAfter == position.margin
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_free_by_id__reverts_when_not_owner(
+    pool_initialized_with_liquidity,
+    manager,
+    zero_for_one,
+    sender,
+    alice,
+    chain,
+    mint_position,
+):
+    token_id = mint_position(zero_for_one)
+
+    position_id = pool_initialized_with_liquidity.state().totalPositions - 1
+    key = get_position_key(manager.address, position_id)
+    position = pool_initialized_with_liquidity.positions(key)
+
+    deadline = chain.pending_timestamp + 3600
+    margin_out = (position.margin * 25) // 100
+    free_params = (token_id, margin_out, alice.address, deadline)
+    with reverts(manager.Unauthorized):
+        manager.freeById(free_params, sender=alice)
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_free_by_id__reverts_when_past_deadline(
+    pool_initialized_with_liquidity,
+    manager,
+    zero_for_one,
+    sender,
+    alice,
+    chain,
+    mint_position,
+):
+    token_id = mint_position(zero_for_one)
+
+    position_id = pool_initialized_with_liquidity.state().totalPositions - 1
+    key = get_position_key(manager.address, position_id)
+    position = pool_initialized_with_liquidity.positions(key)
+
+    deadline = chain.pending_timestamp - 1
+    margin_out = (position.margin * 25) // 100
+    free_params = (token_id, margin_out, alice.address, deadline)
+    with reverts("Transaction too old"):
+        manager.freeById(free_params, sender=sender)
@@ -0,0 +1,237 @@
+import pytest
+
+from ape import reverts
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+    FUNDING_PERIOD,
+    TICK_CUMULATIVE_RATE_MAX,
+    BASE_FEE_MIN,
+    GAS_LIQUIDATE,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96, get_position_key
+
+
+@pytest.fixture
+def spot_pool_initialized_with_liquidity(
+    pool_initialized_with_liquidity,
+    mock_univ3_pool,
+    spot_liquidity,
+    sqrt_price_x96_initial,
+    token0,
+    token1,
+    sender,
+):
+    slot0 = mock_univ3_pool.slot0()
+    slot0.sqrtPriceX96 = (
+        pool_initialized_with_liquidity.state().sqrtPriceX96  # have prices coincide between spot and marginal
+    )
+    mock_univ3_pool.setSlot0(slot0, sender=sender)
+
+    (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+        spot_liquidity, slot0.sqrtPriceX96
+    )
+    token0.mint(mock_univ3_pool.address, reserve0, sender=sender)
+    token1.mint(mock_univ3_pool.address, reserve1, sender=sender)
+    mock_univ3_pool.setLiquidity(spot_liquidity, sender=sender)
+
+    return mock_univ3_pool
+
+
+@pytest.fixture
+def mint_position(
+    pool_initialized_with_liquidity,
+    spot_pool_initialized_with_liquidity,
+    position_lib,
+    chain,
+    manager,
+    sender,
+):
+    def mint(zero_for_one: bool) -> int:
+        state = pool_initialized_with_liquidity.state()
+        maintenance = pool_initialized_with_liquidity.maintenance()
+        oracle = pool_initialized_with_liquidity.oracle()
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = reserve * 1 // 100  # 1% of reserves
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        size_min = (size * 80) // 100
+        debt_max = 2**128 - 1
+        amount_in_max = 2**256 - 1
+        deadline = chain.pending_timestamp + 3600
+
+        mint_params = (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            maintenance,
+            oracle,
+            zero_for_one,
+            size,
+            size_min,
+            debt_max,
+            amount_in_max,
+            sqrt_price_limit_x96,
+            margin,
+            sender.address,
+            deadline,
+        )
+
+        premium = pool_initialized_with_liquidity.rewardPremium()
+        base_fee = chain.blocks[-1].base_fee
+        rewards = position_lib.liquidationRewards(
+            base_fee,
+            BASE_FEE_MIN,
+            GAS_LIQUIDATE,
+            premium,
+        )
+
+        tx = manager.mint(mint_params, sender=sender, value=rewards)
+        token_id = tx.decode_logs(manager.Mint)[0].tokenId
+        return int(token_id)
+
+    yield mint
+
+
+@pytest.fixture
+def ignite_params(pool_initialized_with_liquidity, alice, chain):
+    def params(token_ids: list, amount_out_min: int = 0) -> tuple:
+        deadline = chain.pending_timestamp + 3600
+        return (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            pool_initialized_with_liquidity.maintenance(),
+            pool_initialized_with_liquidity.oracle(),
+            token_ids,
+            amount_out_min,
+            alice.address,
+            deadline,
+        )
+
+    yield params
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_ignite_many__settles_positions(
+    pool_initialized_with_liquidity,
+    spot_pool_initialized_with_liquidity,
+    manager,
+    zero_for_one,
+    sender,
+    alice,
+    chain,
+    position_lib,
+    token0,
+    token1,
+    mint_position,
+    ignite_params,
+):
+    token_ids = [mint_position(zero_for_one) for _ in range(3)]
+
+    total_positions = pool_initialized_with_liquidity.state().totalPositions
+    position_ids = [total_positions - len(token_ids) + i for i in range(len(token_ids))]
+    keys = [get_position_key(manager.address, id) for id in position_ids]
+    positions = [pool_initialized_with_liquidity.positions(key) for key in keys]
+
+    token_out = token1 if zero_for_one else token0
+    balance_alice = token_out.balanceOf(alice.address)
+
+    block_timestamp_next = chain.pending_timestamp
+    tx = manager.igniteMany(ignite_params(token_ids), sender=sender)
+
+    state = pool_initialized_with_liquidity.state()
+    tick_cumulative_last = state.tickCumulative
+    oracle_tick_cumulatives, _ = spot_pool_initialized_with_liquidity.observe([0])
+
+    rewards = 0
+    for i, key in enumerate(keys):
+        # sync then settle position
+        position = position_lib.sync(
+            positions[i],
+            block_timestamp_next,
+            tick_cumulative_last,
+            oracle_tick_cumulatives[0],
+            TICK_CUMULATIVE_RATE_MAX,
+            FUNDING_PERIOD,
+        )
+        rewards += position.rewards
+
+        position = position_lib.settle(position)
+        assert pool_initialized_with_liquidity.positions(key) == position
+
+        # manager position deleted
+        with reverts():
+            manager.positions(token_ids[i])
+
+    # tokens burned
+    assert manager.balanceOf(sender.address) == 0
+
+    # single swap through spot
+    swaps = tx.decode_logs(spot_pool_initialized_with_liquidity.Swap)
+    assert len(swaps) == 1
+
+    events = tx.decode_logs(manager.IgniteMany)
+    assert len(events) == 1
+
+    event = events[0]
+    assert event.tokenIds == token_ids
+    assert event.sender == sender.address
+    assert event.recipient == alice.address
+    assert event.amountOut > 0
+    assert event.rewards == rewards
+
+    assert token_out.balanceOf(alice.address) == balance_alice + event.amountOut
+    assert token0.balanceOf(manager.address) == 0
+    assert token1.balanceOf(manager.address) == 0
+
+
+def test_manager_ignite_many__reverts_when_directions_differ(
+    pool_initialized_with_liquidity,
+    spot_pool_initialized_with_liquidity,
+    manager,
+    sender,
+    mint_position,
+    ignite_params,
+):
+    token_ids = [mint_position(True), mint_position(False)]
+    with reverts(manager.InvalidDirection):
+        manager.igniteMany(ignite_params(token_ids), sender=sender)
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_ignite_many__reverts_when_not_owner(
+    pool_initialized_with_liquidity,
+    spot_pool_initialized_with_liquidity,
+    manager,
+    zero_for_one,
+    alice,
+    mint_position,
+    ignite_params,
+):
+    token_ids = [mint_position(zero_for_one) for _ in range(2)]
+    with reverts(manager.Unauthorized):
+        manager.igniteMany(ignite_params(token_ids), sender=alice)
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_ignite_many__reverts_when_amount_less_than_min(
+    pool_initialized_with_liquidity,
+    spot_pool_initialized_with_liquidity,
+    manager,
+    zero_for_one,
+    sender,
+    mint_position,
+    ignite_params,
+):
+    token_ids = [mint_position(zero_for_one) for _ in range(2)]
+    amount_out_min = 2**256 - 1
+    with reverts():
+        manager.igniteMany(ignite_params(token_ids, amount_out_min), sender=sender)
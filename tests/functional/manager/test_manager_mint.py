@@ -352,6 +352,86 @@ def test_manager_mint__transfers_funds(
     assert pool_initialized_with_liquidity.balance == balancee_pool + position.rewards
 
 
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_mint__transfers_funds_when_manager_holds_balance(
+    pool_initialized_with_liquidity,
+    manager,
+    zero_for_one,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    position_lib,
+):
+    state = pool_initialized_with_liquidity.state()
+    maintenance = pool_initialized_with_liquidity.maintenance()
+    oracle = pool_initialized_with_liquidity.oracle()
+
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    reserve = reserve1 if zero_for_one else reserve0
+
+    size = reserve * 1 // 100  # 1% of reserves
+    margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+    size_min = (size * 80) // 100
+    debt_max = 2**128 - 1
+    amount_in_max = 2**256 - 1
+    deadline = chain.pending_timestamp + 3600
+
+    # stray tokens sent to manager outside of a deposit should not pay for sender
+    token = token1 if zero_for_one else token0
+    amount_held = margin * 2
+    token.mint(manager.address, amount_held, sender=alice)
+
+    balance_sender = token.balanceOf(sender.address)
+    balance_pool = token.balanceOf(pool_initialized_with_liquidity.address)
+
+    mint_params = (
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.token1(),
+        maintenance,
+        oracle,
+        zero_for_one,
+        size,
+        size_min,
+        debt_max,
+        amount_in_max,
+        sqrt_price_limit_x96,
+        margin,
+        sender.address,
+        deadline,
+    )
+
+    premium = pool_initialized_with_liquidity.rewardPremium()
+    base_fee = chain.blocks[-1].base_fee
+    rewards = position_lib.liquidationRewards(
+        base_fee,
+        BASE_FEE_MIN,
+        GAS_LIQUIDATE,
+        premium,
+    )
+
+    manager.mint(mint_params, sender=sender, value=rewards)
+
+    position_id = state.totalPositions
+    owner = manager.address
+    key = get_position_key(owner, position_id)
+    position = pool_initialized_with_liquidity.positions(key)
+
+    fees = position_lib.fees(position.size, FEE)
+    amount_in = position.margin + fees
+
+    assert token.balanceOf(sender.address) == balance_sender - amount_in
+    assert (
+        token.balanceOf(pool_initialized_with_liquidity.address)
+        == balance_pool + amount_in
+    )
+    assert token.balanceOf(manager.address) == amount_held
+
+
 @pytest.mark.parametrize("zero_for_one", [True, False])
 def test_manager_mint__refunds_eth(
     pool_initialized_with_liquidity,
@@ -0,0 +1,185 @@
+import pytest
+
+from ape import reverts
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+    BASE_FEE_MIN,
+    GAS_LIQUIDATE,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96, get_position_key
+
+
+@pytest.fixture
+def mint_params(pool_initialized_with_liquidity, sender):
+    def params(zero_for_one: bool, size_pct: int, deadline: int) -> tuple:
+        state = pool_initialized_with_liquidity.state()
+        maintenance = pool_initialized_with_liquidity.maintenance()
+        oracle = pool_initialized_with_liquidity.oracle()
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = reserve * size_pct // 1000
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        size_min = (size * 80) // 100
+        debt_max = 2**128 - 1
+        amount_in_max = 2**256 - 1
+
+        return (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            maintenance,
+            oracle,
+            zero_for_one,
+            size,
+            size_min,
+            debt_max,
+            amount_in_max,
+            sqrt_price_limit_x96,
+            margin,
+            sender.address,
+            deadline,
+        )
+
+    yield params
+
+
+@pytest.fixture
+def rewards(pool_initialized_with_liquidity, chain, position_lib):
+    premium = pool_initialized_with_liquidity.rewardPremium()
+    base_fee = chain.blocks[-1].base_fee
+    return position_lib.liquidationRewards(
+        base_fee,
+        BASE_FEE_MIN,
+        GAS_LIQUIDATE,
+        premium,
+    )
+
+
+def test_manager_mint_many__mints_tokens(
+    pool_initialized_with_liquidity,
+    manager,
+    sender,
+    chain,
+    mint_params,
+    rewards,
+):
+    deadline = chain.pending_timestamp + 3600
+    params = [
+        mint_params(True, 5, deadline),
+        mint_params(False, 5, deadline),
+        mint_params(True, 10, deadline),
+    ]
+    state = pool_initialized_with_liquidity.state()
+    manager.mintMany(params, sender=sender, value=rewards * len(params))
+
+    assert manager.balanceOf(sender.address) == len(params)
+    for i, param in enumerate(params):
+        token_id = i + 1  # starts at 1 for nft position manager
+        assert manager.ownerOf(token_id) == sender.address
+
+        result = manager.positions(token_id)
+        assert result.pool == pool_initialized_with_liquidity.address
+        assert result.positionId == state.totalPositions + i
+        assert result.zeroForOne == param[4]
+        assert result.margin == param[10]
+
+
+def test_manager_mint_many__refunds_eth(
+    pool_initialized_with_liquidity,
+    manager,
+    sender,
+    chain,
+    mint_params,
+    rewards,
+):
+    deadline = chain.pending_timestamp + 3600
+    params = [
+        mint_params(True, 5, deadline),
+        mint_params(False, 5, deadline),
+    ]
+    state = pool_initialized_with_liquidity.state()
+
+    balancee_sender = sender.balance
+    balancee_pool = pool_initialized_with_liquidity.balance
+
+    value = rewards * len(params) * 2
+    tx = manager.mintMany(params, sender=sender, value=value)
+
+    owner = manager.address
+    rewards_total = 0
+    for i in range(len(params)):
+        key = get_position_key(owner, state.totalPositions + i)
+        position = pool_initialized_with_liquidity.positions(key)
+        rewards_total += position.rewards
+
+    assert value > rewards_total
+    assert (
+        sender.balance == balancee_sender - rewards_total - tx.gas_used * tx.gas_price
+    )
+    assert pool_initialized_with_liquidity.balance == balancee_pool + rewards_total
+    assert manager.balance == 0
+
+
+def test_manager_mint_many__emits_mint(
+    pool_initialized_with_liquidity,
+    manager,
+    sender,
+    chain,
+    mint_params,
+    rewards,
+):
+    deadline = chain.pending_timestamp + 3600
+    params = [
+        mint_params(True, 5, deadline),
+        mint_params(False, 5, deadline),
+    ]
+    tx = manager.mintMany(params, sender=sender, value=rewards * len(params))
+
+    events = tx.decode_logs(manager.Mint)
+    assert len(events) == len(params)
+    for i, event in enumerate(events):
+        assert event.tokenId == i + 1
+        assert event.sender == sender.address
+        assert event.recipient == sender.address
+
+
+def test_manager_mint_many__reverts_when_liquidation_rewards_less_than_min(
+    pool_initialized_with_liquidity,
+    manager,
+    sender,
+    chain,
+    mint_params,
+    rewards,
+):
+    deadline = chain.pending_timestamp + 3600
+    params = [
+        mint_params(True, 5, deadline),
+        mint_params(False, 5, deadline),
+    ]
+    with reverts(manager.RewardsLessThanMin):
+        manager.mintMany(params, sender=sender, value=rewards)
+
+
+def test_manager_mint_many__reverts_when_past_deadline(
+    pool_initialized_with_liquidity,
+    manager,
+    sender,
+    chain,
+    mint_params,
+    rewards,
+):
+    params = [
+        mint_params(True, 5, chain.pending_timestamp + 3600),
+        mint_params(False, 5, chain.pending_timestamp - 1),
+    ]
+    with reverts("Transaction too old"):
+        manager.mintMany(params, sender=sender, value=rewards * len(params))
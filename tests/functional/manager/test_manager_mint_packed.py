@@ -0,0 +1,127 @@
+import pytest
+
+from ape import reverts
+from eth_abi.packed import encode_packed
+from eth_utils import keccak
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+    BASE_FEE_MIN,
+    GAS_LIQUIDATE,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.fixture
+def mint_params(pool_initialized_with_liquidity, sender):
+    def params(zero_for_one: bool, deadline: int) -> tuple:
+        state = pool_initialized_with_liquidity.state()
+        maintenance = pool_initialized_with_liquidity.maintenance()
+        oracle = pool_initialized_with_liquidity.oracle()
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = reserve * 1 // 100  # 1% of reserves
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        size_min = (size * 80) // 100
+        debt_max = 2**128 - 1
+        amount_in_max = 2**128 - 1
+
+        return (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            maintenance,
+            oracle,
+            zero_for_one,
+            size,
+            size_min,
+            debt_max,
+            amount_in_max,
+            sqrt_price_limit_x96,
+            margin,
+            sender.address,
+            deadline,
+        )
+
+    yield params
+
+
+def encode_mint_packed(params: tuple) -> bytes:
+    return keccak(text="mintPacked()")[:4] + encode_packed(
+        [
+            "address",  # token0
+            "address",  # token1
+            "uint24",  # maintenance
+            "address",  # oracle
+            "bool",  # zero for one
+            "uint128",  # size desired
+            "uint128",  # size min
+            "uint128",  # debt max
+            "uint128",  # amount in max
+            "uint160",  # sqrt price limit
+            "uint128",  # margin
+            "address",  # recipient
+            "uint32",  # deadline
+        ],
+        list(params),
+    )
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_mint_packed__mints_token(
+    pool_initialized_with_liquidity,
+    manager,
+    zero_for_one,
+    sender,
+    chain,
+    position_lib,
+    position_viewer,
+    mint_params,
+):
+    deadline = chain.pending_timestamp + 3600
+    params = mint_params(zero_for_one, deadline)
+
+    premium = pool_initialized_with_liquidity.rewardPremium()
+    base_fee = chain.blocks[-1].base_fee
+    rewards = position_lib.liquidationRewards(
+        base_fee,
+        BASE_FEE_MIN,
+        GAS_LIQUIDATE,
+        premium,
+    )
+
+    state = pool_initialized_with_liquidity.state()
+    sender.transfer(manager.address, rewards, data=encode_mint_packed(params))
+
+    next_id = 1  # starts at 1 for nft position manager
+    assert manager.ownerOf(next_id) == sender.address
+    assert manager.balanceOf(sender.address) == 1
+
+    result = manager.positions(next_id)
+    assert result.pool == pool_initialized_with_liquidity.address
+    assert result.positionId == state.totalPositions
+    assert result.zeroForOne == zero_for_one
+    assert result.margin == params[10]
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_mint_packed__reverts_when_past_deadline(
+    pool_initialized_with_liquidity,
+    manager,
+    zero_for_one,
+    sender,
+    chain,
+    mint_params,
+):
+    deadline = chain.pending_timestamp - 1
+    params = mint_params(zero_for_one, deadline)
+    with reverts("Transaction too old"):
+        sender.transfer(manager.address, 0, data=encode_mint_packed(params))
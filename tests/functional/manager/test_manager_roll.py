@@ -0,0 +1,216 @@
+import pytest
+
+from ape import reverts
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+    FUNDING_PERIOD,
+    TICK_CUMULATIVE_RATE_MAX,
+    BASE_FEE_MIN,
+    GAS_LIQUIDATE,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96, get_position_key
+
+
+@pytest.fixture
+def mint_position(
+    pool_initialized_with_liquidity, position_lib, chain, manager, sender
+):
+    def mint(zero_for_one: bool) -> int:
+        state = pool_initialized_with_liquidity.state()
+        maintenance = pool_initialized_with_liquidity.maintenance()
+        oracle = pool_initialized_with_liquidity.oracle()
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = reserve * 1 // 100  # 1% of reserves
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        size_min = (size * 80) // 100
+        debt_max = 2**128 - 1
+        amount_in_max = 2**256 - 1
+        deadline = chain.pending_timestamp + 3600
+
+        mint_params = (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            maintenance,
+            oracle,
+            zero_for_one,
+            size,
+            size_min,
+            debt_max,
+            amount_in_max,
+            sqrt_price_limit_x96,
+            margin,
+            sender.address,
+            deadline,
+        )
+
+        premium = pool_initialized_with_liquidity.rewardPremium()
+        base_fee = chain.blocks[-1].base_fee
+        rewards = position_lib.liquidationRewards(
+            base_fee,
+            BASE_FEE_MIN,
+            GAS_LIQUIDATE,
+            premium,
+        )
+
+        tx = manager.mint(mint_params, sender=sender, value=rewards)
+        token_id = tx.decode_logs(manager.Mint)[0].tokenId
+        return int(token_id)
+
+    yield mint
+
+
+@pytest.fixture
+def roll_params(pool_initialized_with_liquidity, alice, chain):
+    def params(token_id: int, zero_for_one: bool, size_multiplier: int) -> tuple:
+        state = pool_initialized_with_liquidity.state()
+        maintenance = pool_initialized_with_liquidity.maintenance()
+
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = (reserve * size_multiplier) // 200  # multiple of 0.5% of reserves
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        size_min = (size * 80) // 100
+        deadline = chain.pending_timestamp + 3600
+        return (
+            token_id,
+            size,
+            size_min,
+            0,
+            0,
+            0,
+            margin,
+            alice.address,
+            deadline,
+        )
+
+    yield params
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+@pytest.mark.parametrize("size_multiplier", [1, 4])
+def test_manager_roll__settles_and_opens_position(
+    pool_initialized_with_liquidity,
+    manager,
+    zero_for_one,
+    size_multiplier,
+    sender,
+    alice,
+    chain,
+    mock_univ3_pool,
+    position_lib,
+    token0,
+    token1,
+    mint_position,
+    roll_params,
+):
+    token_id = mint_position(zero_for_one)
+
+    position_id = pool_initialized_with_liquidity.state().totalPositions - 1
+    key = get_position_key(manager.address, position_id)
+    position = pool_initialized_with_liquidity.positions(key)
+
+    token_out = token1 if zero_for_one else token0
+    balance_alice = token_out.balanceOf(alice.address)
+
+    block_timestamp_next = chain.pending_timestamp
+    params = roll_params(token_id, zero_for_one, size_multiplier)
+    tx = manager.roll(
+        params, sender=sender, value=position.rewards
+    )  # extra in case base fee increases
+
+    state = pool_initialized_with_liquidity.state()
+    tick_cumulative_last = state.tickCumulative
+    oracle_tick_cumulatives, _ = mock_univ3_pool.observe([0])
+
+    # sync then settle prior position
+    position = position_lib.sync(
+        position,
+        block_timestamp_next,
+        tick_cumulative_last,
+        oracle_tick_cumulatives[0],
+        TICK_CUMULATIVE_RATE_MAX,
+        FUNDING_PERIOD,
+    )
+    amount_released = position.size + position.margin
+
+    position = position_lib.settle(position)
+    assert pool_initialized_with_liquidity.positions(key) == position
+
+    # token kept with position id updated to new position
+    position_id_next = state.totalPositions - 1
+    assert position_id_next == position_id + 1
+    assert manager.ownerOf(token_id) == sender.address
+    assert manager.positions(token_id).positionId == position_id_next
+
+    key_next = get_position_key(manager.address, position_id_next)
+    position_next = pool_initialized_with_liquidity.positions(key_next)
+    assert position_next.zeroForOne == zero_for_one
+    assert position_next.size >= params[2]
+    assert position_next.margin == params[6]
+
+    events = tx.decode_logs(manager.Roll)
+    assert len(events) == 1
+
+    event = events[0]
+    assert event.tokenId == token_id
+    assert event.sender == sender.address
+    assert event.recipient == alice.address
+    assert event.positionId == position_id_next
+    assert event.size == position_next.size
+    assert event.margin == position_next.margin
+    assert event.rewards == position_next.rewards
+
+    # only the difference between released and required margin token moved
+    amount_in = event.margin + event.fees
+    amount_out = amount_released - amount_in if amount_released > amount_in else 0
+    assert token_out.balanceOf(alice.address) == balance_alice + amount_out
+
+    assert token0.balanceOf(manager.address) == 0
+    assert token1.balanceOf(manager.address) == 0
+    assert manager.balance == 0
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_roll__reverts_when_not_owner(
+    pool_initialized_with_liquidity,
+    manager,
+    zero_for_one,
+    alice,
+    mint_position,
+    roll_params,
+):
+    token_id = mint_position(zero_for_one)
+    params = roll_params(token_id, zero_for_one, 4)
+    with reverts(manager.Unauthorized):
+        manager.roll(params, sender=alice)
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_roll__reverts_when_past_deadline(
+    pool_initialized_with_liquidity,
+    manager,
+    zero_for_one,
+    sender,
+    chain,
+    mint_position,
+    roll_params,
+):
+    token_id = mint_position(zero_for_one)
+    params = list(roll_params(token_id, zero_for_one, 4))
+    params[-1] = chain.pending_timestamp - 1
+    with reverts("Transaction too old"):
+        manager.roll(tuple(params), sender=sender)
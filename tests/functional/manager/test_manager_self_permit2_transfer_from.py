@@ -0,0 +1,165 @@
+import pytest
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+    BASE_FEE_MIN,
+    GAS_LIQUIDATE,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.fixture
+def mint_params(pool_initialized_with_liquidity, chain):
+    def params(zero_for_one: bool, recipient: str) -> tuple:
+        state = pool_initialized_with_liquidity.state()
+        maintenance = pool_initialized_with_liquidity.maintenance()
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = reserve * 1 // 100  # 1% of reserves
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        return (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            maintenance,
+            pool_initialized_with_liquidity.oracle(),
+            zero_for_one,
+            size,
+            (size * 80) // 100,
+            2**128 - 1,
+            2**256 - 1,
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1,
+            margin,
+            recipient,
+            chain.pending_timestamp + 3600,
+        )
+
+    yield params
+
+
+@pytest.fixture
+def rewards(pool_initialized_with_liquidity, position_lib, chain):
+    premium = pool_initialized_with_liquidity.rewardPremium()
+    base_fee = chain.blocks[-1].base_fee
+    return position_lib.liquidationRewards(
+        base_fee,
+        BASE_FEE_MIN,
+        GAS_LIQUIDATE,
+        premium,
+    )
+
+
+def test_manager_self_permit2_transfer_from__transfers_funds(
+    manager, permit2, alice, chain, token0
+):
+    amount = 10**18
+    token0.mint(alice.address, amount, sender=alice)
+    token0.approve(permit2.address, 2**256 - 1, sender=alice)
+
+    balance_alice = token0.balanceOf(alice.address)
+    balance_manager = token0.balanceOf(manager.address)
+
+    permit = ((token0.address, amount), 0, chain.pending_timestamp + 3600)
+    manager.selfPermit2TransferFrom(permit, b"", sender=alice)
+
+    assert token0.balanceOf(alice.address) == balance_alice - amount
+    assert token0.balanceOf(manager.address) == balance_manager + amount
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_self_permit2_transfer_from__mints_with_multicall(
+    pool_initialized_with_liquidity,
+    manager,
+    permit2,
+    alice,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    mint_params,
+    rewards,
+):
+    token = token1 if zero_for_one else token0
+    params = mint_params(zero_for_one, alice.address)
+    margin = params[10]
+
+    # alice only approves permit2, so the manager can only pay from held balance
+    amount_permitted = margin * 2  # covers margin plus fees
+    token.mint(alice.address, amount_permitted, sender=alice)
+    token.approve(permit2.address, 2**256 - 1, sender=alice)
+    assert token.allowance(alice.address, manager.address) == 0
+
+    balance_alice = token.balanceOf(alice.address)
+    balance_pool = token.balanceOf(pool_initialized_with_liquidity.address)
+
+    permit = ((token.address, amount_permitted), 0, chain.pending_timestamp + 3600)
+    calldata = [
+        manager.selfPermit2TransferFrom.as_transaction(permit, b"", sender=alice).data,
+        manager.mint.as_transaction(params, sender=alice).data,
+        manager.sweepToken.as_transaction(
+            token.address, 0, alice.address, sender=alice
+        ).data,
+    ]
+    tx = manager.multicall(calldata, sender=alice, value=rewards)
+
+    events = tx.decode_logs(manager.Mint)
+    assert len(events) == 1
+    event = events[0]
+    amount_in = event.margin + event.fees
+
+    assert manager.ownerOf(event.tokenId) == alice.address
+    assert token.balanceOf(alice.address) == balance_alice - amount_in
+    assert (
+        token.balanceOf(pool_initialized_with_liquidity.address)
+        == balance_pool + amount_in
+    )
+    assert token.balanceOf(manager.address) == 0
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_manager_self_permit2_transfer_from__locks_with_multicall(
+    pool_initialized_with_liquidity,
+    manager,
+    permit2,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    mint_params,
+    rewards,
+):
+    token = token1 if zero_for_one else token0
+    params = mint_params(zero_for_one, alice.address)
+    tx = manager.mint(params, sender=sender, value=rewards)
+    token_id = tx.decode_logs(manager.Mint)[0].tokenId
+
+    margin_in = params[10] // 2
+    token.mint(alice.address, margin_in, sender=alice)
+    token.approve(permit2.address, 2**256 - 1, sender=alice)
+    assert token.allowance(alice.address, manager.address) == 0
+
+    balance_alice = token.balanceOf(alice.address)
+    balance_pool = token.balanceOf(pool_initialized_with_liquidity.address)
+
+    deadline = chain.pending_timestamp + 3600
+    permit = ((token.address, margin_in), 1, deadline)
+    calldata = [
+        manager.selfPermit2TransferFrom.as_transaction(permit, b"", sender=alice).data,
+        manager.lockById.as_transaction(
+            (token_id, margin_in, deadline), sender=alice
+        ).data,
+    ]
+    manager.multicall(calldata, sender=alice)
+
+    assert token.balanceOf(alice.address) == balance_alice - margin_in
+    assert (
+        token.balanceOf(pool_initialized_with_liquidity.address)
+        == balance_pool + margin_in
+    )
+    assert token.balanceOf(manager.address) == 0
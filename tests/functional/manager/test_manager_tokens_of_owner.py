@@ -0,0 +1,121 @@
+import pytest
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+    BASE_FEE_MIN,
+    GAS_LIQUIDATE,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.fixture
+def mint_position(
+    pool_initialized_with_liquidity, position_lib, chain, manager, sender
+):
+    def mint(zero_for_one: bool) -> int:
+        state = pool_initialized_with_liquidity.state()
+        maintenance = pool_initialized_with_liquidity.maintenance()
+        oracle = pool_initialized_with_liquidity.oracle()
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = reserve * 1 // 100  # 1% of reserves
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        size_min = (size * 80) // 100
+        debt_max = 2**128 - 1
+        amount_in_max = 2**256 - 1
+        deadline = chain.pending_timestamp + 3600
+
+        mint_params = (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            maintenance,
+            oracle,
+            zero_for_one,
+            size,
+            size_min,
+            debt_max,
+            amount_in_max,
+            sqrt_price_limit_x96,
+            margin,
+            sender.address,
+            deadline,
+        )
+
+        premium = pool_initialized_with_liquidity.rewardPremium()
+        base_fee = chain.blocks[-1].base_fee
+        rewards = position_lib.liquidationRewards(
+            base_fee,
+            BASE_FEE_MIN,
+            GAS_LIQUIDATE,
+            premium,
+        )
+
+        tx = manager.mint(mint_params, sender=sender, value=rewards)
+        token_id = tx.decode_logs(manager.Mint)[0].tokenId
+        return int(token_id)
+
+    yield mint
+
+
+def test_manager_tokens_of_owner__returns_minted_tokens(
+    manager, sender, alice, mint_position
+):
+    token_ids = [mint_position(zero_for_one) for zero_for_one in [True, False, True]]
+
+    assert manager.tokensOfOwner(sender.address, 0, 10) == (token_ids, 3)
+    assert manager.tokensOfOwner(alice.address, 0, 10) == ([], 0)
+
+
+def test_manager_tokens_of_owner__returns_page(manager, sender, mint_position):
+    token_ids = [mint_position(zero_for_one) for zero_for_one in [True, False, True]]
+
+    assert manager.tokensOfOwner(sender.address, 0, 2) == (token_ids[:2], 2)
+    assert manager.tokensOfOwner(sender.address, 2, 2) == (token_ids[2:], 3)
+    assert manager.tokensOfOwner(sender.address, 3, 2) == ([], 3)
+    assert manager.tokensOfOwner(sender.address, 10, 2) == ([], 3)
+
+
+def test_manager_tokens_of_owner__updates_on_transfer(
+    manager, sender, alice, mint_position
+):
+    token_ids = [mint_position(zero_for_one) for zero_for_one in [True, False, True]]
+
+    manager.transferFrom(sender.address, alice.address, token_ids[0], sender=sender)
+
+    # last token id swapped into removed index
+    assert manager.tokensOfOwner(sender.address, 0, 10) == (
+        [token_ids[2], token_ids[1]],
+        2,
+    )
+    assert manager.tokensOfOwner(alice.address, 0, 10) == ([token_ids[0]], 1)
+
+    manager.transferFrom(alice.address, sender.address, token_ids[0], sender=alice)
+    assert manager.tokensOfOwner(sender.address, 0, 10) == (
+        [token_ids[2], token_ids[1], token_ids[0]],
+        3,
+    )
+    assert manager.tokensOfOwner(alice.address, 0, 10) == ([], 0)
+
+
+def test_manager_tokens_of_owner__updates_on_burn(
+    pool_initialized_with_liquidity, manager, sender, alice, chain, mint_position
+):
+    token_ids = [mint_position(zero_for_one) for zero_for_one in [True, False, True]]
+
+    deadline = chain.pending_timestamp + 3600
+    burn_params = (token_ids[1], alice.address, deadline)
+    manager.burnById(burn_params, sender=sender)
+
+    assert manager.tokensOfOwner(sender.address, 0, 10) == (
+        [token_ids[0], token_ids[2]],
+        2,
+    )
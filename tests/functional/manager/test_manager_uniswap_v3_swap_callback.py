@@ -24,8 +24,15 @@ def test_manager_uniswap_v3_swap_callback__reverts_when_not_oracle(
     maintenance = 250000
     oracle = pool.oracle()
     data = encode(
-        ["(address,address,uint24,address)"],
-        [(token0.address, token1.address, maintenance, oracle)],
+        ["((address,address,uint24,address),bool,address,uint96[])"],
+        [
+            (
+                (token0.address, token1.address, maintenance, oracle),
+                False,
+                pool.address,
+                [],
+            )
+        ],
     )
 
     # alice tries to steal from manager
@@ -83,3 +83,21 @@ def oracle_sqrt_price_initial_x96(
         seconds_ago,
     )
     return sqrt_price_x96
+
+
+@pytest.fixture
+def pool_state(pool_initialized_with_liquidity, mock_univ3_pool, oracle_lib):
+    state = pool_initialized_with_liquidity.state()
+    seconds_ago = pool_initialized_with_liquidity.secondsAgo()
+    oracle_tick_cumulatives, _ = mock_univ3_pool.observe([seconds_ago, 0])
+    oracle_tick_cumulative_delta = oracle_lib.oracleTickCumulativeDelta(
+        oracle_tick_cumulatives[0], oracle_tick_cumulatives[1]
+    )
+    return (
+        state.sqrtPriceX96,
+        state.liquidity,
+        pool_initialized_with_liquidity.liquidityLocked(),
+        pool_initialized_with_liquidity.totalSupply(),
+        state.feeProtocol,
+        oracle_tick_cumulative_delta,
+    )
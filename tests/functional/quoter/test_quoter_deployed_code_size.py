@@ -0,0 +1,6 @@
+MAX_CODE_SIZE = 24576  # EIP-170
+
+
+def test_quoter_deployed_code_size__within_limit(quoter, chain):
+    code = chain.provider.get_code(quoter.address)
+    assert len(code) <= MAX_CODE_SIZE
@@ -0,0 +1,429 @@
+import pytest
+
+from eth_abi import encode, decode
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+    BASE_FEE_MIN,
+    GAS_LIQUIDATE,
+    FUNDING_PERIOD,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+ACTION_TYPE_MINT = 0
+ACTION_TYPE_EXACT_INPUT_SINGLE = 1
+ACTION_TYPE_ADD_LIQUIDITY = 3
+ACTION_TYPE_REMOVE_LIQUIDITY = 4
+ACTION_TYPE_BURN = 5
+
+MINT_PARAMS_TYPE = "(address,address,uint24,address,bool,uint128,uint128,uint128,uint256,uint160,uint128,address,uint256)"
+EXACT_INPUT_SINGLE_PARAMS_TYPE = (
+    "(address,address,uint24,address,address,uint256,uint256,uint256,uint160)"
+)
+ADD_LIQUIDITY_PARAMS_TYPE = (
+    "(address,address,uint24,address,address,uint256,uint256,uint256,uint256,uint256)"
+)
+REMOVE_LIQUIDITY_PARAMS_TYPE = (
+    "(address,address,uint24,address,address,uint256,uint256,uint256,uint256)"
+)
+BURN_PARAMS_TYPE = "(address,address,uint24,address,uint256,address,uint256)"
+
+QUOTE_MINT_RESULT_TYPES = [
+    "uint256",  # size
+    "uint256",  # debt
+    "uint256",  # margin
+    "uint256",  # safe margin minimum
+    "uint256",  # fees
+    "bool",  # safe
+    "uint256",  # health
+    "uint128",  # liquidity after
+    "uint160",  # sqrt price after
+    "uint128",  # liquidity locked after
+]
+QUOTE_BURN_RESULT_TYPES = [
+    "uint256",  # amount in
+    "uint256",  # amount out
+    "uint256",  # rewards
+    "uint128",  # liquidity after
+    "uint160",  # sqrt price after
+    "uint128",  # liquidity locked after
+]
+
+
+@pytest.fixture
+def rewards(pool_initialized_with_liquidity, chain, position_lib):
+    premium = pool_initialized_with_liquidity.rewardPremium()
+    base_fee = chain.blocks[-1].base_fee
+    return position_lib.liquidationRewards(
+        base_fee,
+        BASE_FEE_MIN,
+        GAS_LIQUIDATE,
+        premium,
+    )
+
+
+@pytest.fixture
+def mint_params(pool_initialized_with_liquidity, sender):
+    def params(zero_for_one: bool, deadline: int) -> tuple:
+        state = pool_initialized_with_liquidity.state()
+        maintenance = pool_initialized_with_liquidity.maintenance()
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = reserve * 1 // 100  # 1% of reserves
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        return (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            maintenance,
+            pool_initialized_with_liquidity.oracle(),
+            zero_for_one,
+            size,
+            0,  # size min
+            2**128 - 1,  # debt max
+            2**256 - 1,  # amount in max
+            sqrt_price_limit_x96,
+            margin,
+            sender.address,
+            deadline,
+        )
+
+    yield params
+
+
+def test_quoter_quote_actions__quotes_swaps_in_sequence(
+    pool_initialized_with_liquidity,
+    quoter,
+    router,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+):
+    state = pool_initialized_with_liquidity.state()
+    maintenance = pool_initialized_with_liquidity.maintenance()
+    oracle = pool_initialized_with_liquidity.oracle()
+    deadline = chain.pending_timestamp + 3600
+
+    reserve0, reserve1 = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    params = [
+        (
+            token0.address,
+            token1.address,
+            maintenance,
+            oracle,
+            alice.address,  # recipient
+            deadline,
+            1 * reserve0 // 100,  # amount in
+            0,  # amount out min
+            0,  # sqrt price limit
+        ),
+        (
+            token1.address,
+            token0.address,
+            maintenance,
+            oracle,
+            alice.address,  # recipient
+            deadline,
+            2 * reserve1 // 100,  # amount in
+            0,  # amount out min
+            0,  # sqrt price limit
+        ),
+    ]
+    actions = [
+        (
+            ACTION_TYPE_EXACT_INPUT_SINGLE,
+            encode([EXACT_INPUT_SINGLE_PARAMS_TYPE], [p]),
+        )
+        for p in params
+    ]
+
+    # quote first before state change
+    results = quoter.quoteActions(actions)
+    assert len(results) == len(actions)
+
+    # second swap quoted against state after first swap
+    for i, p in enumerate(params):
+        amount_out, liquidity_after, sqrt_price_x96_after = decode(
+            ["uint256", "uint128", "uint160"], results[i]
+        )
+
+        token_out = token1 if i == 0 else token0
+        balance_alice = token_out.balanceOf(alice.address)
+        router.exactInputSingle(p, sender=sender)
+        assert token_out.balanceOf(alice.address) - balance_alice == amount_out
+
+        state = pool_initialized_with_liquidity.state()
+        assert liquidity_after == state.liquidity
+        assert sqrt_price_x96_after == state.sqrtPriceX96
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quoter_quote_actions__quotes_mixed_actions_in_sequence(
+    pool_initialized_with_liquidity,
+    quoter,
+    router,
+    manager,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    liquidity_math_lib,
+    zero_for_one,
+    mint_params,
+    rewards,
+):
+    state = pool_initialized_with_liquidity.state()
+    maintenance = pool_initialized_with_liquidity.maintenance()
+    oracle = pool_initialized_with_liquidity.oracle()
+    deadline = chain.pending_timestamp + 3600
+
+    (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    amount0_desired, amount1_desired = liquidity_math_lib.toAmounts(
+        state.liquidity * 5 // 100, state.sqrtPriceX96
+    )  # 5% more liquidity added
+    shares_sender = pool_initialized_with_liquidity.balanceOf(sender.address)
+
+    mint = mint_params(zero_for_one, deadline)
+    add = (
+        token0.address,
+        token1.address,
+        maintenance,
+        oracle,
+        alice.address,
+        amount0_desired,
+        amount1_desired,
+        0,  # amount0 min
+        0,  # amount1 min
+        deadline,
+    )
+    swap = (
+        token0.address if zero_for_one else token1.address,
+        token1.address if zero_for_one else token0.address,
+        maintenance,
+        oracle,
+        alice.address,
+        deadline,
+        (reserve0 if zero_for_one else reserve1) * 2 // 100,  # amount in
+        0,  # amount out min
+        0,  # sqrt price limit
+    )
+    remove = (
+        token0.address,
+        token1.address,
+        maintenance,
+        oracle,
+        alice.address,
+        shares_sender // 4,
+        0,  # amount0 min
+        0,  # amount1 min
+        deadline,
+    )
+    actions = [
+        (ACTION_TYPE_MINT, encode([MINT_PARAMS_TYPE], [mint])),
+        (ACTION_TYPE_ADD_LIQUIDITY, encode([ADD_LIQUIDITY_PARAMS_TYPE], [add])),
+        (
+            ACTION_TYPE_EXACT_INPUT_SINGLE,
+            encode([EXACT_INPUT_SINGLE_PARAMS_TYPE], [swap]),
+        ),
+        (
+            ACTION_TYPE_REMOVE_LIQUIDITY,
+            encode([REMOVE_LIQUIDITY_PARAMS_TYPE], [remove]),
+        ),
+    ]
+
+    # quote first before state change
+    results = quoter.quoteActions(actions)
+    assert len(results) == len(actions)
+
+    # mint quoted against current state
+    result = decode(QUOTE_MINT_RESULT_TYPES, results[0])
+    tx = manager.mint(mint, sender=sender, value=rewards)
+    token_id = tx.decode_logs(manager.Mint)[0].tokenId
+    position = manager.positions(token_id)
+    assert result[0] == position.size
+    assert result[1] == position.debt
+
+    state = pool_initialized_with_liquidity.state()
+    assert result[7] == state.liquidity
+    assert result[8] == state.sqrtPriceX96
+    assert result[9] == pool_initialized_with_liquidity.liquidityLocked()
+
+    # add liquidity quoted against state after mint
+    shares, amount0, amount1, liquidity_after = decode(
+        ["uint256", "uint256", "uint256", "uint128"], results[1]
+    )
+    shares_alice = pool_initialized_with_liquidity.balanceOf(alice.address)
+    balance0_sender = token0.balanceOf(sender.address)
+    balance1_sender = token1.balanceOf(sender.address)
+    router.addLiquidity(add, sender=sender)
+
+    shares_alice_after = pool_initialized_with_liquidity.balanceOf(alice.address)
+    assert shares_alice_after - shares_alice == shares
+    assert balance0_sender - token0.balanceOf(sender.address) == amount0
+    assert balance1_sender - token1.balanceOf(sender.address) == amount1
+    assert pool_initialized_with_liquidity.state().liquidity == liquidity_after
+
+    # swap quoted against state after add liquidity
+    amount_out, liquidity_after, sqrt_price_x96_after = decode(
+        ["uint256", "uint128", "uint160"], results[2]
+    )
+    token_out = token1 if zero_for_one else token0
+    balance_out_alice = token_out.balanceOf(alice.address)
+    router.exactInputSingle(swap, sender=sender)
+
+    assert token_out.balanceOf(alice.address) - balance_out_alice == amount_out
+    state = pool_initialized_with_liquidity.state()
+    assert state.liquidity == liquidity_after
+    assert state.sqrtPriceX96 == sqrt_price_x96_after
+
+    # remove liquidity quoted against state after swap, with total supply after add
+    liquidity_delta, amount0, amount1, liquidity_after = decode(
+        ["uint128", "uint256", "uint256", "uint128"], results[3]
+    )
+    liquidity_before = pool_initialized_with_liquidity.state().liquidity
+    balance0_alice = token0.balanceOf(alice.address)
+    balance1_alice = token1.balanceOf(alice.address)
+    router.removeLiquidity(remove, sender=sender)
+
+    assert token0.balanceOf(alice.address) - balance0_alice == amount0
+    assert token1.balanceOf(alice.address) - balance1_alice == amount1
+    state = pool_initialized_with_liquidity.state()
+    assert liquidity_before - state.liquidity == liquidity_delta
+    assert state.liquidity == liquidity_after
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quoter_quote_actions__quotes_burn_then_actions_in_sequence(
+    pool_initialized_with_liquidity,
+    quoter,
+    router,
+    manager,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    mint_params,
+    rewards,
+):
+    tx = manager.mint(
+        mint_params(zero_for_one, chain.pending_timestamp + 3600),
+        sender=sender,
+        value=rewards,
+    )
+    token_id = tx.decode_logs(manager.Mint)[0].tokenId
+
+    # forward the chain one funding period for debts after funding
+    chain.mine(deltatime=FUNDING_PERIOD)
+
+    state = pool_initialized_with_liquidity.state()
+    maintenance = pool_initialized_with_liquidity.maintenance()
+    oracle = pool_initialized_with_liquidity.oracle()
+    deadline = chain.pending_timestamp + 3600
+
+    (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    burn = (
+        token0.address,
+        token1.address,
+        maintenance,
+        oracle,
+        token_id,
+        alice.address,
+        deadline,
+    )
+    swap = (
+        token1.address if zero_for_one else token0.address,
+        token0.address if zero_for_one else token1.address,
+        maintenance,
+        oracle,
+        alice.address,
+        deadline,
+        (reserve1 if zero_for_one else reserve0) * 1 // 100,  # amount in
+        0,  # amount out min
+        0,  # sqrt price limit
+    )
+    remove = (
+        token0.address,
+        token1.address,
+        maintenance,
+        oracle,
+        alice.address,
+        pool_initialized_with_liquidity.balanceOf(sender.address) // 4,
+        0,  # amount0 min
+        0,  # amount1 min
+        deadline,
+    )
+    actions = [
+        (ACTION_TYPE_BURN, encode([BURN_PARAMS_TYPE], [burn])),
+        (
+            ACTION_TYPE_EXACT_INPUT_SINGLE,
+            encode([EXACT_INPUT_SINGLE_PARAMS_TYPE], [swap]),
+        ),
+        (
+            ACTION_TYPE_REMOVE_LIQUIDITY,
+            encode([REMOVE_LIQUIDITY_PARAMS_TYPE], [remove]),
+        ),
+    ]
+
+    # quote first before state change
+    results = quoter.quoteActions(actions)
+    assert len(results) == len(actions)
+
+    # burn quoted against current state
+    result = decode(QUOTE_BURN_RESULT_TYPES, results[0])
+    tx = manager.burn(burn, sender=sender)
+    event = tx.decode_logs(manager.Burn)[0]
+    assert result[0] == event.amountIn
+    assert result[1] == event.amountOut
+    assert result[2] == event.rewards
+
+    state = pool_initialized_with_liquidity.state()
+    assert result[3] == state.liquidity
+    assert result[4] == state.sqrtPriceX96
+    assert result[5] == pool_initialized_with_liquidity.liquidityLocked()
+
+    # swap quoted against state after burn
+    amount_out, liquidity_after, sqrt_price_x96_after = decode(
+        ["uint256", "uint128", "uint160"], results[1]
+    )
+    token_out = token0 if zero_for_one else token1
+    balance_out_alice = token_out.balanceOf(alice.address)
+    router.exactInputSingle(swap, sender=sender)
+
+    assert token_out.balanceOf(alice.address) - balance_out_alice == amount_out
+    state = pool_initialized_with_liquidity.state()
+    assert state.liquidity == liquidity_after
+    assert state.sqrtPriceX96 == sqrt_price_x96_after
+
+    # remove liquidity quoted against state after swap, with locked liquidity released on burn
+    liquidity_delta, amount0, amount1, liquidity_after = decode(
+        ["uint128", "uint256", "uint256", "uint128"], results[2]
+    )
+    liquidity_before = pool_initialized_with_liquidity.state().liquidity
+    balance0_alice = token0.balanceOf(alice.address)
+    balance1_alice = token1.balanceOf(alice.address)
+    router.removeLiquidity(remove, sender=sender)
+
+    assert token0.balanceOf(alice.address) - balance0_alice == amount0
+    assert token1.balanceOf(alice.address) - balance1_alice == amount1
+    state = pool_initialized_with_liquidity.state()
+    assert liquidity_before - state.liquidity == liquidity_delta
+    assert state.liquidity == liquidity_after
@@ -0,0 +1,30 @@
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+def test_quoter_quote_add_liquidity_with_state__quotes_liquidity_add(
+    pool_initialized_with_liquidity,
+    quoter,
+    alice,
+    chain,
+    pool_state,
+):
+    state = pool_initialized_with_liquidity.state()
+    liquidity_delta = state.liquidity * 5 // 100
+    amount0_desired, amount1_desired = calc_amounts_from_liquidity_sqrt_price_x96(
+        liquidity_delta, state.sqrtPriceX96
+    )
+
+    params = (
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.token1(),
+        pool_initialized_with_liquidity.maintenance(),
+        pool_initialized_with_liquidity.oracle(),
+        alice.address,
+        amount0_desired,
+        amount1_desired,
+        0,  # amount0 min
+        0,  # amount1 min
+        chain.pending_timestamp + 3600,  # deadline
+    )
+    result = quoter.quoteAddLiquidityWithState(params, pool_state)
+    assert result == quoter.quoteAddLiquidity(params)
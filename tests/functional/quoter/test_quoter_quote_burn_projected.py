@@ -0,0 +1,138 @@
+import pytest
+
+from ape import reverts
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+    BASE_FEE_MIN,
+    GAS_LIQUIDATE,
+    FUNDING_PERIOD,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.fixture
+def mint_position(
+    pool_initialized_with_liquidity, position_lib, chain, manager, sender
+):
+    def mint(zero_for_one: bool) -> int:
+        state = pool_initialized_with_liquidity.state()
+        maintenance = pool_initialized_with_liquidity.maintenance()
+        oracle = pool_initialized_with_liquidity.oracle()
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = reserve * 1 // 100  # 1% of reserves
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        size_min = (size * 80) // 100
+        debt_max = 2**128 - 1
+        amount_in_max = 2**256 - 1
+        deadline = chain.pending_timestamp + 3600
+
+        mint_params = (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            maintenance,
+            oracle,
+            zero_for_one,
+            size,
+            size_min,
+            debt_max,
+            amount_in_max,
+            sqrt_price_limit_x96,
+            margin,
+            sender.address,
+            deadline,
+        )
+
+        premium = pool_initialized_with_liquidity.rewardPremium()
+        base_fee = chain.blocks[-1].base_fee
+        rewards = position_lib.liquidationRewards(
+            base_fee,
+            BASE_FEE_MIN,
+            GAS_LIQUIDATE,
+            premium,
+        )
+
+        tx = manager.mint(mint_params, sender=sender, value=rewards)
+        token_id = tx.decode_logs(manager.Mint)[0].tokenId
+        return int(token_id)
+
+    yield mint
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quoter_quote_burn_projected__quotes_burn_at_times_ahead(
+    pool_initialized_with_liquidity,
+    quoter,
+    manager,
+    zero_for_one,
+    alice,
+    chain,
+    mint_position,
+):
+    token_id = mint_position(zero_for_one)
+
+    # forward the chain for debts after funding
+    chain.mine(deltatime=3600)
+
+    deadline = chain.pending_timestamp + 3600
+    burn_params = (
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.token1(),
+        pool_initialized_with_liquidity.maintenance(),
+        pool_initialized_with_liquidity.oracle(),
+        token_id,
+        alice.address,
+        deadline,
+    )
+    seconds_ahead = [0, 3600, 28800, 86400, FUNDING_PERIOD]
+    projections = quoter.quoteBurnProjected(burn_params, seconds_ahead)
+    assert len(projections) == len(seconds_ahead)
+
+    # zero seconds ahead is burn now
+    result = quoter.quoteBurn(burn_params)
+    position = manager.positions(token_id)
+    assert projections[0].amountIn == result.amountIn
+    assert projections[0].amountOut == result.amountOut
+    assert projections[0].debt == position.debt
+    assert projections[0].margin == position.margin
+    assert projections[0].safe == position.safe
+    assert projections[0].health == position.health
+
+    block_timestamp = projections[0].blockTimestamp
+    for projection, seconds in zip(projections, seconds_ahead):
+        assert projection.blockTimestamp == block_timestamp + seconds
+        assert projection.amountIn == projection.debt
+        assert projection.amountOut == position.size + projection.margin
+
+    # funding accrues to debt over the horizon
+    assert projections[-1].debt != projections[0].debt
+
+
+def test_quoter_quote_burn_projected__reverts_when_invalid_position(
+    pool_initialized_with_liquidity,
+    quoter,
+    manager,
+    alice,
+    chain,
+):
+    burn_params = (
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.token1(),
+        pool_initialized_with_liquidity.maintenance(),
+        pool_initialized_with_liquidity.oracle(),
+        1,  # not minted
+        alice.address,
+        chain.pending_timestamp + 3600,
+    )
+    with reverts():
+        quoter.quoteBurnProjected(burn_params, [0])
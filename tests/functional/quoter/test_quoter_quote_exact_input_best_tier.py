@@ -0,0 +1,61 @@
+import pytest
+
+from ape.utils import ZERO_ADDRESS
+
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quoter_quote_exact_input_best_tier__quotes_swaps(
+    pool_initialized_with_liquidity,
+    pool_two,
+    quoter,
+    zero_for_one,
+    alice,
+    chain,
+):
+    state = pool_initialized_with_liquidity.state()
+    oracle = pool_initialized_with_liquidity.oracle()
+    token0 = pool_initialized_with_liquidity.token0()
+    token1 = pool_initialized_with_liquidity.token1()
+    token_in = token0 if zero_for_one else token1
+    token_out = token1 if zero_for_one else token0
+
+    reserve0, reserve1 = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    amount_in = 1 * reserve0 // 100 if zero_for_one else 1 * reserve1 // 100
+
+    tiers = [
+        (pool_two.maintenance(), oracle),  # not initialized
+        (pool_initialized_with_liquidity.maintenance(), oracle),
+        (1000000, oracle),  # not created
+    ]
+    best_index, quotes = quoter.quoteExactInputBestTier(
+        token_in, token_out, tiers, amount_in
+    )
+    assert best_index == 1
+    assert len(quotes) == len(tiers)
+
+    assert quotes[0].pool == pool_two.address
+    assert quotes[0].success is False
+    assert quotes[2].pool == ZERO_ADDRESS
+    assert quotes[2].success is False
+
+    params = (
+        token_in,
+        token_out,
+        pool_initialized_with_liquidity.maintenance(),
+        oracle,
+        alice.address,  # recipient
+        chain.pending_timestamp + 3600,  # deadline
+        amount_in,
+        0,  # amount out min
+        0,  # sqrt price limit
+    )
+    result = quoter.quoteExactInputSingle(params)
+    assert quotes[1].pool == pool_initialized_with_liquidity.address
+    assert quotes[1].success is True
+    assert quotes[1].amount == result.amountOut
+    assert quotes[1].liquidityAfter == result.liquidityAfter
+    assert quotes[1].sqrtPriceX96After == result.sqrtPriceX96After
@@ -0,0 +1,35 @@
+import pytest
+
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quoter_quote_exact_input_single_with_state__quotes_swap(
+    pool_initialized_with_liquidity,
+    quoter,
+    zero_for_one,
+    alice,
+    chain,
+    pool_state,
+):
+    state = pool_initialized_with_liquidity.state()
+    token0 = pool_initialized_with_liquidity.token0()
+    token1 = pool_initialized_with_liquidity.token1()
+    reserve0, reserve1 = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    amount_in = 1 * reserve0 // 100 if zero_for_one else 1 * reserve1 // 100
+
+    params = (
+        token0 if zero_for_one else token1,
+        token1 if zero_for_one else token0,
+        pool_initialized_with_liquidity.maintenance(),
+        pool_initialized_with_liquidity.oracle(),
+        alice.address,  # recipient
+        chain.pending_timestamp + 3600,  # deadline
+        amount_in,
+        0,  # amount out min
+        0,  # sqrt price limit
+    )
+    result = quoter.quoteExactInputSingleWithState(params, pool_state)
+    assert result == quoter.quoteExactInputSingle(params)
@@ -0,0 +1,160 @@
+import pytest
+
+from ape import reverts
+
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.fixture
+def pool_two_initialized_with_liquidity(
+    pool_two,
+    spot_liquidity,
+    callee,
+    router,
+    token0,
+    token1,
+    sender,
+):
+    liquidity_delta = spot_liquidity * 50 // 10000  # 0.5% of spot reserves
+    callee.mint(pool_two.address, sender.address, liquidity_delta, sender=sender)
+    pool_two.approve(pool_two.address, 2**256 - 1, sender=sender)
+    pool_two.approve(router.address, 2**256 - 1, sender=sender)
+    return pool_two
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quoter_quote_exact_input_split__quotes_single_pool(
+    pool_initialized_with_liquidity,
+    pool_two,
+    quoter,
+    zero_for_one,
+    alice,
+    chain,
+):
+    state = pool_initialized_with_liquidity.state()
+    oracle = pool_initialized_with_liquidity.oracle()
+    token0 = pool_initialized_with_liquidity.token0()
+    token1 = pool_initialized_with_liquidity.token1()
+    token_in = token0 if zero_for_one else token1
+    token_out = token1 if zero_for_one else token0
+
+    reserve0, reserve1 = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    amount_in = 1 * reserve0 // 100 if zero_for_one else 1 * reserve1 // 100
+
+    tiers = [
+        (pool_two.maintenance(), oracle),  # not initialized
+        (pool_initialized_with_liquidity.maintenance(), oracle),
+    ]
+    result = quoter.quoteExactInputSplit(token_in, token_out, tiers, amount_in)
+    assert result.amountsIn == [0, amount_in]
+    assert result.quotes[0].success is False
+
+    params = (
+        token_in,
+        token_out,
+        pool_initialized_with_liquidity.maintenance(),
+        oracle,
+        alice.address,  # recipient
+        chain.pending_timestamp + 3600,  # deadline
+        amount_in,
+        0,  # amount out min
+        0,  # sqrt price limit
+    )
+    quote = quoter.quoteExactInputSingle(params)
+    assert result.amountOut == quote.amountOut
+    assert result.quotes[1].pool == pool_initialized_with_liquidity.address
+    assert result.quotes[1].success is True
+    assert result.quotes[1].amount == quote.amountOut
+    assert result.quotes[1].liquidityAfter == quote.liquidityAfter
+    assert result.quotes[1].sqrtPriceX96After == quote.sqrtPriceX96After
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quoter_quote_exact_input_split__splits_across_pools(
+    pool_initialized_with_liquidity,
+    pool_two_initialized_with_liquidity,
+    quoter,
+    zero_for_one,
+    alice,
+    chain,
+):
+    state = pool_initialized_with_liquidity.state()
+    state_two = pool_two_initialized_with_liquidity.state()
+    oracle = pool_initialized_with_liquidity.oracle()
+    token0 = pool_initialized_with_liquidity.token0()
+    token1 = pool_initialized_with_liquidity.token1()
+    token_in = token0 if zero_for_one else token1
+    token_out = token1 if zero_for_one else token0
+
+    reserve0, reserve1 = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    amount_in = 1 * reserve0 // 100 if zero_for_one else 1 * reserve1 // 100
+
+    tiers = [
+        (pool_initialized_with_liquidity.maintenance(), oracle),
+        (pool_two_initialized_with_liquidity.maintenance(), oracle),
+    ]
+    result = quoter.quoteExactInputSplit(token_in, token_out, tiers, amount_in)
+    assert sum(result.amountsIn) == amount_in
+    assert result.amountsIn[0] > 0
+    assert result.amountsIn[1] > 0
+    assert result.amountOut == result.quotes[0].amount + result.quotes[1].amount
+
+    # same price before so amounts in split by liquidity
+    assert state.sqrtPriceX96 == state_two.sqrtPriceX96
+    assert (
+        pytest.approx(result.amountsIn[0] / result.amountsIn[1], rel=1e-6)
+        == state.liquidity / state_two.liquidity
+    )
+
+    # same price after across pools
+    assert (
+        pytest.approx(result.quotes[0].sqrtPriceX96After, rel=1e-9)
+        == result.quotes[1].sqrtPriceX96After
+    )
+
+    # better than swapping through either pool alone
+    for tier in tiers:
+        params = (
+            token_in,
+            token_out,
+            tier[0],
+            tier[1],
+            alice.address,  # recipient
+            chain.pending_timestamp + 3600,  # deadline
+            amount_in,
+            0,  # amount out min
+            0,  # sqrt price limit
+        )
+        quote = quoter.quoteExactInputSingle(params)
+        assert result.amountOut > quote.amountOut
+
+
+def test_quoter_quote_exact_input_split__reverts_when_no_valid_pool(
+    pool_two,
+    quoter,
+    token0,
+    token1,
+):
+    oracle = pool_two.oracle()
+    tiers = [(pool_two.maintenance(), oracle), (1000000, oracle)]
+    with reverts("No valid pool"):
+        quoter.quoteExactInputSplit(token0.address, token1.address, tiers, 1000000)
+
+
+def test_quoter_quote_exact_input_split__reverts_when_amount_in_zero(
+    pool_initialized_with_liquidity,
+    quoter,
+):
+    oracle = pool_initialized_with_liquidity.oracle()
+    tiers = [(pool_initialized_with_liquidity.maintenance(), oracle)]
+    with reverts("Invalid amountIn"):
+        quoter.quoteExactInputSplit(
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            tiers,
+            0,
+        )
@@ -1,5 +1,9 @@
 import pytest
 
+from ape import reverts
+from ape.utils import ZERO_ADDRESS
+from math import floor, log
+
 from utils.constants import (
     MIN_SQRT_RATIO,
     MAX_SQRT_RATIO,
@@ -37,6 +41,17 @@ def spot_pool_initialized_with_liquidity(
     return mock_univ3_pool
 
 
+@pytest.fixture(scope="module")
+def quoter_without_static_quoter(project, accounts, factory, WETH9, manager):
+    return project.Quoter.deploy(
+        factory.address,
+        WETH9.address,
+        manager.address,
+        ZERO_ADDRESS,
+        sender=accounts[0],
+    )
+
+
 @pytest.fixture
 def mint_position(
     pool_initialized_with_liquidity,
@@ -152,4 +167,84 @@ def test_quoter_quote_ignite__quotes_ignite(
     assert result.liquidityLockedAfter == liquidity_locked
 
 
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quoter_quote_ignite__quotes_ignite_within_tick_range(
+    pool_initialized_with_liquidity,
+    spot_pool_initialized_with_liquidity,
+    quoter_without_static_quoter,
+    manager,
+    zero_for_one,
+    sender,
+    alice,
+    chain,
+    mint_position,
+):
+    token_id = mint_position(zero_for_one)
+
+    # set spot tick consistent with spot price and wide tick spacing so swap stays in range
+    slot0 = spot_pool_initialized_with_liquidity.slot0()
+    slot0.tick = floor(2 * log(slot0.sqrtPriceX96 / (1 << 96)) / log(1.0001))
+    spot_pool_initialized_with_liquidity.setSlot0(slot0, sender=sender)
+    spot_pool_initialized_with_liquidity.setTickSpacing(4000, sender=sender)
+
+    # forward the chain one funding period for debts after funding
+    chain.mine(deltatime=FUNDING_PERIOD)
+
+    deadline = chain.pending_timestamp + 3600
+    amount_out_min = 0
+
+    ignite_params = (
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.token1(),
+        pool_initialized_with_liquidity.maintenance(),
+        pool_initialized_with_liquidity.oracle(),
+        token_id,
+        amount_out_min,
+        alice.address,
+        deadline,
+    )
+
+    # quote first before state change
+    result = quoter_without_static_quoter.quoteIgnite(ignite_params)
+
+    # actually ignite and check result same as quote up to rounding in mock spot pool swap math
+    tx = manager.ignite(ignite_params, sender=sender)
+    events = tx.decode_logs(manager.Ignite)
+    assert len(events) == 1
+    event = events[0]
+
+    assert pytest.approx(result.amountOut, rel=1e-9) == event.amountOut
+    assert result.rewards == event.rewards
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quoter_quote_ignite__reverts_when_tick_boundary_crossed_without_static_quoter(
+    pool_initialized_with_liquidity,
+    spot_pool_initialized_with_liquidity,
+    quoter_without_static_quoter,
+    manager,
+    zero_for_one,
+    alice,
+    chain,
+    mint_position,
+):
+    token_id = mint_position(zero_for_one)
+
+    # spot tick not consistent with spot price so current tick range not usable
+    chain.mine(deltatime=FUNDING_PERIOD)
+
+    ignite_params = (
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.token1(),
+        pool_initialized_with_liquidity.maintenance(),
+        pool_initialized_with_liquidity.oracle(),
+        token_id,
+        0,
+        alice.address,
+        chain.pending_timestamp + 3600,
+    )
+    with reverts("Tick boundary crossed"):
+        quoter_without_static_quoter.quoteIgnite(ignite_params)
+
+
 # TODO: test revert statements
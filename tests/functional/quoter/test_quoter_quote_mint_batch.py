@@ -0,0 +1,83 @@
+import pytest
+
+from ape import reverts
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.fixture
+def get_mint_params(pool_initialized_with_liquidity, sender, chain):
+    def mint_params(zero_for_one: bool, size_pct: int) -> tuple:
+        state = pool_initialized_with_liquidity.state()
+        maintenance = pool_initialized_with_liquidity.maintenance()
+        oracle = pool_initialized_with_liquidity.oracle()
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        reserve0, reserve1 = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        reserve = reserve1 if zero_for_one else reserve0
+
+        size = reserve * size_pct // 100
+        margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+        size_min = (size * 80) // 100
+        debt_max = 2**128 - 1
+        amount_in_max = 2**256 - 1
+        deadline = chain.pending_timestamp + 3600
+
+        return (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            maintenance,
+            oracle,
+            zero_for_one,
+            size,
+            size_min,
+            debt_max,
+            amount_in_max,
+            sqrt_price_limit_x96,
+            margin,
+            sender.address,
+            deadline,
+        )
+
+    yield mint_params
+
+
+def test_quoter_quote_mint_batch__quotes_mints(quoter, get_mint_params):
+    params = [
+        get_mint_params(True, 1),
+        get_mint_params(False, 1),
+        get_mint_params(True, 2),
+    ]
+    results = quoter.quoteMintBatch(params)
+    assert len(results) == len(params)
+
+    for i, mint_params in enumerate(params):
+        result = quoter.quoteMint(mint_params)
+        assert results[i].size == result.size
+        assert results[i].debt == result.debt
+        assert results[i].margin == result.margin
+        assert results[i].safeMarginMinimum == result.safeMarginMinimum
+        assert results[i].fees == result.fees
+        assert results[i].safe == result.safe
+        assert results[i].health == result.health
+        assert results[i].liquidityAfter == result.liquidityAfter
+        assert results[i].sqrtPriceX96After == result.sqrtPriceX96After
+        assert results[i].liquidityLockedAfter == result.liquidityLockedAfter
+
+
+def test_quoter_quote_mint_batch__reverts_when_mint_would_revert(
+    quoter, get_mint_params
+):
+    params = list(get_mint_params(True, 1))
+    params[7] = 1  # debt max < debt
+    with reverts("Debt greater than max"):
+        quoter.quoteMintBatch([get_mint_params(False, 1), tuple(params)])
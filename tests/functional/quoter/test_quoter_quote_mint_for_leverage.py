@@ -0,0 +1,82 @@
+import pytest
+
+from ape import reverts
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.fixture
+def get_mint_params(pool_initialized_with_liquidity, sender, chain):
+    def mint_params(zero_for_one: bool, margin: int) -> list:
+        maintenance = pool_initialized_with_liquidity.maintenance()
+        oracle = pool_initialized_with_liquidity.oracle()
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        size_desired = 0  # @dev ignored by quoter
+        size_min = 0
+        debt_max = 2**128 - 1
+        amount_in_max = 2**256 - 1
+        deadline = chain.pending_timestamp + 3600
+
+        return [
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            maintenance,
+            oracle,
+            zero_for_one,
+            size_desired,
+            size_min,
+            debt_max,
+            amount_in_max,
+            sqrt_price_limit_x96,
+            margin,
+            sender.address,
+            deadline,
+        ]
+
+    yield mint_params
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quoter_quote_mint_for_leverage__quotes_mint(
+    pool_initialized_with_liquidity, quoter, zero_for_one, get_mint_params
+):
+    state = pool_initialized_with_liquidity.state()
+    reserve0, reserve1 = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    reserve = reserve1 if zero_for_one else reserve0
+
+    margin = reserve * 1 // 1000  # 0.1% of reserves
+    leverage = 2500000  # 2.5x
+    mint_params = get_mint_params(zero_for_one, margin)
+
+    size_desired, result = quoter.quoteMintForLeverage(tuple(mint_params), leverage)
+    assert size_desired == (margin * (leverage - 1000000)) // 1000000
+
+    mint_params[5] = size_desired
+    quote = quoter.quoteMint(tuple(mint_params))
+    assert result.size == quote.size
+    assert result.debt == quote.debt
+    assert result.margin == quote.margin
+    assert result.safeMarginMinimum == quote.safeMarginMinimum
+    assert result.fees == quote.fees
+    assert result.safe == quote.safe
+    assert result.health == quote.health
+    assert result.liquidityAfter == quote.liquidityAfter
+    assert result.sqrtPriceX96After == quote.sqrtPriceX96After
+    assert result.liquidityLockedAfter == quote.liquidityLockedAfter
+
+
+def test_quoter_quote_mint_for_leverage__reverts_when_leverage_less_than_one(
+    quoter, get_mint_params
+):
+    mint_params = get_mint_params(True, 1000000)
+    with reverts("Invalid leverage"):
+        quoter.quoteMintForLeverage(tuple(mint_params), 1000000)
@@ -0,0 +1,68 @@
+import pytest
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quoter_quote_mint_ladder__quotes_mints(
+    pool_initialized_with_liquidity,
+    quoter,
+    zero_for_one,
+    sender,
+    chain,
+):
+    state = pool_initialized_with_liquidity.state()
+    maintenance = pool_initialized_with_liquidity.maintenance()
+    oracle = pool_initialized_with_liquidity.oracle()
+
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    reserve0, reserve1 = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    reserve = reserve1 if zero_for_one else reserve0
+
+    sizes = [reserve * pct // 1000 for pct in [5, 10, 15, 20]]  # 0.5% to 2% of reserves
+    margin = (sizes[-1] * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+    size_min = 0
+    debt_max = 2**128 - 1
+    amount_in_max = 2**256 - 1
+    deadline = chain.pending_timestamp + 3600
+
+    mint_params = [
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.token1(),
+        maintenance,
+        oracle,
+        zero_for_one,
+        sizes[0],
+        size_min,
+        debt_max,
+        amount_in_max,
+        sqrt_price_limit_x96,
+        margin,
+        sender.address,
+        deadline,
+    ]
+
+    results = quoter.quoteMintLadder(tuple(mint_params), sizes)
+    assert len(results) == len(sizes)
+
+    for i, size in enumerate(sizes):
+        mint_params[5] = size
+        result = quoter.quoteMint(tuple(mint_params))
+        assert results[i].size == result.size
+        assert results[i].debt == result.debt
+        assert results[i].fees == result.fees
+        assert results[i].sqrtPriceX96After == result.sqrtPriceX96After
+        assert results[i].health == result.health
+        assert results[i].safeMarginMinimum == result.safeMarginMinimum
+
+    # larger rungs give larger positions
+    for i in range(1, len(sizes)):
+        assert results[i].size > results[i - 1].size
+        assert results[i].debt > results[i - 1].debt
@@ -0,0 +1,65 @@
+import pytest
+
+from utils.constants import (
+    MIN_SQRT_RATIO,
+    MAX_SQRT_RATIO,
+    MAINTENANCE_UNIT,
+)
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quoter_quote_mint_with_state__quotes_mint(
+    pool_initialized_with_liquidity,
+    quoter,
+    zero_for_one,
+    sender,
+    chain,
+    pool_state,
+):
+    state = pool_initialized_with_liquidity.state()
+    maintenance = pool_initialized_with_liquidity.maintenance()
+    oracle = pool_initialized_with_liquidity.oracle()
+
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    reserve0, reserve1 = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    reserve = reserve1 if zero_for_one else reserve0
+
+    size = reserve * 1 // 100  # 1% of reserves
+    margin = (size * maintenance * 125) // (MAINTENANCE_UNIT * 100)
+    size_min = (size * 80) // 100
+    debt_max = 2**128 - 1
+    amount_in_max = 2**256 - 1
+    deadline = chain.pending_timestamp + 3600
+
+    mint_params = (
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.token1(),
+        maintenance,
+        oracle,
+        zero_for_one,
+        size,
+        size_min,
+        debt_max,
+        amount_in_max,
+        sqrt_price_limit_x96,
+        margin,
+        sender.address,
+        deadline,
+    )
+
+    result = quoter.quoteMintWithState(mint_params, pool_state)
+    quote = quoter.quoteMint(mint_params)
+
+    assert result.size == quote.size
+    assert result.debt == quote.debt
+    assert result.margin == quote.margin
+    assert result.safeMarginMinimum == quote.safeMarginMinimum
+    assert result.fees == quote.fees
+    assert result.safe == quote.safe
+    assert result.health == quote.health
+    assert result.liquidityAfter == quote.liquidityAfter
+    assert result.sqrtPriceX96After == quote.sqrtPriceX96After
+    assert result.liquidityLockedAfter == quote.liquidityLockedAfter
@@ -0,0 +1,23 @@
+def test_quoter_quote_remove_liquidity_with_state__quotes_liquidity_remove(
+    pool_initialized_with_liquidity,
+    quoter,
+    sender,
+    alice,
+    chain,
+    pool_state,
+):
+    shares_sender = pool_initialized_with_liquidity.balanceOf(sender.address)
+
+    params = (
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.token1(),
+        pool_initialized_with_liquidity.maintenance(),
+        pool_initialized_with_liquidity.oracle(),
+        alice.address,
+        shares_sender // 2,
+        0,  # amount0 min
+        0,  # amount1 min
+        chain.pending_timestamp + 3600,  # deadline
+    )
+    result = quoter.quoteRemoveLiquidityWithState(params, pool_state)
+    assert result == quoter.quoteRemoveLiquidity(params)
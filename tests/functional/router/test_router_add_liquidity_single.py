@@ -0,0 +1,279 @@
+import pytest
+
+from ape import reverts
+from math import sqrt
+
+from utils.constants import MIN_SQRT_RATIO
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.fixture
+def add_liquidity_single_params(pool_initialized_with_liquidity, alice):
+    def params(
+        zero_for_one: bool, amount_in: int, shares_min: int, deadline: int
+    ) -> tuple:
+        return (
+            pool_initialized_with_liquidity.token0(),
+            pool_initialized_with_liquidity.token1(),
+            pool_initialized_with_liquidity.maintenance(),
+            pool_initialized_with_liquidity.oracle(),
+            alice.address,
+            zero_for_one,
+            amount_in,
+            shares_min,
+            deadline,
+        )
+
+    yield params
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_add_liquidity_single__mints_shares(
+    pool_initialized_with_liquidity,
+    router,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    add_liquidity_single_params,
+):
+    shares_before = pool_initialized_with_liquidity.balanceOf(alice.address)
+    total_shares_before = pool_initialized_with_liquidity.totalSupply()
+
+    token_in = token0 if zero_for_one else token1
+    reserve_in = token_in.balanceOf(pool_initialized_with_liquidity.address)
+    amount_in = reserve_in * 5 // 100  # 5% of reserves
+
+    deadline = chain.pending_timestamp + 3600
+    params = add_liquidity_single_params(zero_for_one, amount_in, 0, deadline)
+    tx = router.addLiquiditySingle(params, sender=sender)
+    shares = tx.return_value[0]
+
+    assert shares > 0
+    assert (
+        pool_initialized_with_liquidity.balanceOf(alice.address)
+        == shares_before + shares
+    )
+    assert pool_initialized_with_liquidity.totalSupply() == total_shares_before + shares
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_add_liquidity_single__transfers_funds(
+    pool_initialized_with_liquidity,
+    router,
+    sender,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    add_liquidity_single_params,
+):
+    (token_in, token_out) = (token0, token1) if zero_for_one else (token1, token0)
+    balance_in_sender = token_in.balanceOf(sender.address)
+    balance_out_sender = token_out.balanceOf(sender.address)
+
+    reserve_in = token_in.balanceOf(pool_initialized_with_liquidity.address)
+    amount_in = reserve_in * 5 // 100  # 5% of reserves
+
+    deadline = chain.pending_timestamp + 3600
+    params = add_liquidity_single_params(zero_for_one, amount_in, 0, deadline)
+    router.addLiquiditySingle(params, sender=sender)
+
+    # only dust from rounding returned to sender
+    balance_in_sender_after = token_in.balanceOf(sender.address)
+    assert balance_in_sender_after < balance_in_sender
+    assert balance_in_sender_after >= balance_in_sender - amount_in
+    assert token_out.balanceOf(sender.address) >= balance_out_sender
+
+    assert token0.balanceOf(router.address) == 0
+    assert token1.balanceOf(router.address) == 0
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_add_liquidity_single__emits_increase_liquidity(
+    pool_initialized_with_liquidity,
+    router,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    add_liquidity_single_params,
+):
+    token_in = token0 if zero_for_one else token1
+    reserve_in = token_in.balanceOf(pool_initialized_with_liquidity.address)
+    amount_in = reserve_in * 5 // 100  # 5% of reserves
+
+    deadline = chain.pending_timestamp + 3600
+    params = add_liquidity_single_params(zero_for_one, amount_in, 0, deadline)
+    tx = router.addLiquiditySingle(params, sender=sender)
+    (shares, amount0, amount1) = tx.return_value
+
+    events = tx.decode_logs(router.IncreaseLiquidity)
+    assert len(events) == 1
+    event = events[0]
+
+    assert event.shares == shares
+    assert event.amount0 == amount0
+    assert event.amount1 == amount1
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_add_liquidity_single__reverts_when_past_deadline(
+    pool_initialized_with_liquidity,
+    router,
+    sender,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    add_liquidity_single_params,
+):
+    token_in = token0 if zero_for_one else token1
+    reserve_in = token_in.balanceOf(pool_initialized_with_liquidity.address)
+    amount_in = reserve_in * 5 // 100  # 5% of reserves
+
+    deadline = chain.pending_timestamp - 1
+    params = add_liquidity_single_params(zero_for_one, amount_in, 0, deadline)
+    with reverts("Transaction too old"):
+        router.addLiquiditySingle(params, sender=sender)
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_add_liquidity_single__reverts_when_shares_less_than_min(
+    pool_initialized_with_liquidity,
+    router,
+    sender,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    add_liquidity_single_params,
+):
+    token_in = token0 if zero_for_one else token1
+    reserve_in = token_in.balanceOf(pool_initialized_with_liquidity.address)
+    amount_in = reserve_in * 5 // 100  # 5% of reserves
+
+    shares_min = 2**256 - 1
+    deadline = chain.pending_timestamp + 3600
+    params = add_liquidity_single_params(zero_for_one, amount_in, shares_min, deadline)
+    with reverts("Too little received"):
+        router.addLiquiditySingle(params, sender=sender)
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_add_liquidity_single__mints_shares_when_pool_lopsided(
+    pool_initialized_with_liquidity,
+    router,
+    callee,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    add_liquidity_single_params,
+):
+    # swap 90% of token1 reserves out so pool price moves to 1% of original
+    state = pool_initialized_with_liquidity.state()
+    (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    amount1 = int(reserve1 * (sqrt(0.01) - 1))  # specified one out
+    callee.swap(
+        pool_initialized_with_liquidity.address,
+        sender.address,
+        True,
+        amount1,
+        MIN_SQRT_RATIO + 1,
+        sender=sender,
+    )
+
+    token_in = token0 if zero_for_one else token1
+    balance_in_sender = token_in.balanceOf(sender.address)
+    shares_before = pool_initialized_with_liquidity.balanceOf(alice.address)
+
+    reserve_in = token_in.balanceOf(pool_initialized_with_liquidity.address)
+    amount_in = reserve_in * 5 // 100  # 5% of reserves
+
+    deadline = chain.pending_timestamp + 3600
+    params = add_liquidity_single_params(zero_for_one, amount_in, 0, deadline)
+    tx = router.addLiquiditySingle(params, sender=sender)
+    shares = tx.return_value[0]
+
+    assert shares > 0
+    assert (
+        pool_initialized_with_liquidity.balanceOf(alice.address)
+        == shares_before + shares
+    )
+    assert token_in.balanceOf(sender.address) >= balance_in_sender - amount_in
+    assert token0.balanceOf(router.address) == 0
+    assert token1.balanceOf(router.address) == 0
+
+
+def test_router_add_liquidity_single__refunds_excess_ETH(
+    pool_with_WETH9_initialized_with_liquidity,
+    router,
+    sender,
+    alice,
+    chain,
+    WETH9,
+    token0_with_WETH9,
+    token1_with_WETH9,
+):
+    # set WETH9 allowance to zero to ensure all payment in ETH
+    WETH9.approve(router.address, 0, sender=sender)
+
+    zero_for_one = token0_with_WETH9.address == WETH9.address
+    reserve_in = WETH9.balanceOf(pool_with_WETH9_initialized_with_liquidity.address)
+    amount_in = reserve_in * 5 // 100  # 5% of reserves
+    excess = amount_in // 2
+
+    balancee_sender = sender.balance
+    balance_WETH9_sender = WETH9.balanceOf(sender.address)
+
+    deadline = chain.pending_timestamp + 3600
+    params = (
+        pool_with_WETH9_initialized_with_liquidity.token0(),
+        pool_with_WETH9_initialized_with_liquidity.token1(),
+        pool_with_WETH9_initialized_with_liquidity.maintenance(),
+        pool_with_WETH9_initialized_with_liquidity.oracle(),
+        alice.address,
+        zero_for_one,
+        amount_in,
+        0,
+        deadline,
+    )
+    tx = router.addLiquiditySingle(params, sender=sender, value=amount_in + excess)
+
+    assert tx.return_value[0] > 0
+    assert (
+        sender.balance == balancee_sender - amount_in - tx.gas_used * tx.gas_price
+    )  # excess refunded, with only amount in wrapped
+    assert WETH9.balanceOf(sender.address) >= balance_WETH9_sender  # dust returned
+    assert WETH9.balanceOf(router.address) == 0
+    assert token0_with_WETH9.balanceOf(router.address) == 0
+    assert token1_with_WETH9.balanceOf(router.address) == 0
+    assert router.balance == 0
+
+
+@pytest.mark.parametrize("amount_in", [0, 1])
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_add_liquidity_single__reverts_when_amount_in_too_small(
+    pool_initialized_with_liquidity,
+    router,
+    sender,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    amount_in,
+    add_liquidity_single_params,
+):
+    deadline = chain.pending_timestamp + 3600
+    params = add_liquidity_single_params(zero_for_one, amount_in, 0, deadline)
+    with reverts("Amount in too small"):
+        router.addLiquiditySingle(params, sender=sender)
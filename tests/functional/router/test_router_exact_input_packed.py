@@ -0,0 +1,157 @@
+import pytest
+
+from ape import reverts
+from eth_abi.packed import encode_packed
+from eth_utils import keccak
+from hexbytes import HexBytes
+from math import sqrt
+
+from utils.constants import MIN_SQRT_RATIO
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.fixture
+def pool_two_initialized_with_liquidity(
+    pool_two,
+    spot_liquidity,
+    callee,
+    router,
+    token0,
+    token1,
+    sender,
+):
+    # add liquidity
+    liquidity_delta = spot_liquidity * 100 // 10000  # 1% of spot reserves
+    callee.mint(pool_two.address, sender.address, liquidity_delta, sender=sender)
+    pool_two.approve(pool_two.address, 2**256 - 1, sender=sender)
+    pool_two.approve(router.address, 2**256 - 1, sender=sender)
+
+    # initialize with price 10% lower than original pool for arb tests
+    # by swapping through the pool
+    state = pool_two.state()
+    reserve0, reserve1 = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    amount1 = int(reserve1 * (sqrt(0.9) - 1))  # specified one out
+    callee.swap(
+        pool_two.address,
+        sender.address,
+        True,
+        amount1,
+        MIN_SQRT_RATIO + 1,
+        sender=sender,
+    )
+
+    return pool_two
+
+
+@pytest.fixture
+def multi_path(mock_univ3_pool, token0, token1):
+    # e.g. token_in => pool => token_out => pool_two => token_in
+    def _multi_path(zero_for_one: bool) -> HexBytes:
+        # zero_for_one == True: 0 => 1 => 0
+        # zero_for_one == False: 1 => 0 => 1
+        token_in = token0.address if zero_for_one else token1.address
+        token_out = token1.address if zero_for_one else token0.address
+        return encode_packed(
+            [
+                "address",  # token in 0
+                "uint24",  # maintenance 0
+                "address",  # oracle 0
+                "address",  # token out 0 / token in 1
+                "uint24",  # maintenance 1
+                "address",  # oracle 1
+                "address",  # token in 1
+            ],
+            [
+                token_in,
+                250000,
+                mock_univ3_pool.address,
+                token_out,
+                500000,
+                mock_univ3_pool.address,
+                token_in,
+            ],
+        )
+
+    return _multi_path
+
+
+def encode_exact_input_packed(params: tuple) -> bytes:
+    path, recipient, deadline, amount_in, amount_out_min = params
+    return (
+        keccak(text="exactInputPacked()")[:4]
+        + encode_packed(
+            [
+                "address",  # recipient
+                "uint32",  # deadline
+                "uint128",  # amount in
+                "uint128",  # amount out min
+            ],
+            [recipient, deadline, amount_in, amount_out_min],
+        )
+        + path
+    )
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_exact_input_packed__swaps(
+    pool_initialized_with_liquidity,
+    pool_two_initialized_with_liquidity,
+    router,
+    sender,
+    alice,
+    chain,
+    zero_for_one,
+    token0,
+    token1,
+    multi_path,
+):
+    state = pool_initialized_with_liquidity.state()
+    deadline = chain.pending_timestamp + 3600
+    path = multi_path(zero_for_one)
+
+    (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    amount_in = 1 * reserve0 // 100 if zero_for_one else 1 * reserve1 // 100
+
+    params = (path, alice.address, deadline, amount_in, 0)
+    amount_out = router.exactInput.call(params, sender=sender)
+
+    token = token0 if zero_for_one else token1
+    balance_sender = token.balanceOf(sender.address)
+    balance_alice = token.balanceOf(alice.address)
+
+    sender.transfer(router.address, 0, data=encode_exact_input_packed(params))
+
+    assert token.balanceOf(sender.address) == balance_sender - amount_in
+    assert token.balanceOf(alice.address) == balance_alice + amount_out
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_exact_input_packed__reverts_when_amount_out_less_than_min(
+    pool_initialized_with_liquidity,
+    pool_two_initialized_with_liquidity,
+    router,
+    sender,
+    alice,
+    chain,
+    zero_for_one,
+    multi_path,
+):
+    state = pool_initialized_with_liquidity.state()
+    deadline = chain.pending_timestamp + 3600
+    path = multi_path(zero_for_one)
+
+    (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    amount_in = 1 * reserve0 // 100 if zero_for_one else 1 * reserve1 // 100
+
+    params = (path, alice.address, deadline, amount_in, 0)
+    amount_out = router.exactInput.call(params, sender=sender)
+
+    params = (path, alice.address, deadline, amount_in, amount_out + 1)
+    with reverts("Too little received"):
+        sender.transfer(router.address, 0, data=encode_exact_input_packed(params))
@@ -0,0 +1,94 @@
+import pytest
+
+from ape import reverts
+from eth_abi.packed import encode_packed
+from eth_utils import keccak
+
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.fixture
+def exact_input_single_params(pool_initialized_with_liquidity, alice, chain):
+    def params(zero_for_one: bool, deadline: int) -> tuple:
+        state = pool_initialized_with_liquidity.state()
+        token0 = pool_initialized_with_liquidity.token0()
+        token1 = pool_initialized_with_liquidity.token1()
+
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        amount_in = 1 * reserve0 // 100 if zero_for_one else 1 * reserve1 // 100
+        return (
+            token0 if zero_for_one else token1,
+            token1 if zero_for_one else token0,
+            pool_initialized_with_liquidity.maintenance(),
+            pool_initialized_with_liquidity.oracle(),
+            alice.address,  # recipient
+            deadline,
+            amount_in,
+            0,  # amount out min
+            0,  # sqrt price limit
+        )
+
+    yield params
+
+
+def encode_exact_input_single_packed(params: tuple) -> bytes:
+    return keccak(text="exactInputSinglePacked()")[:4] + encode_packed(
+        [
+            "address",  # token in
+            "address",  # token out
+            "uint24",  # maintenance
+            "address",  # oracle
+            "address",  # recipient
+            "uint32",  # deadline
+            "uint128",  # amount in
+            "uint128",  # amount out min
+            "uint160",  # sqrt price limit
+        ],
+        list(params),
+    )
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_exact_input_single_packed__swaps(
+    pool_initialized_with_liquidity,
+    router,
+    sender,
+    alice,
+    chain,
+    zero_for_one,
+    token0,
+    token1,
+    exact_input_single_params,
+):
+    deadline = chain.pending_timestamp + 3600
+    params = exact_input_single_params(zero_for_one, deadline)
+    amount_out = router.exactInputSingle.call(params, sender=sender)
+
+    token_in = token0 if zero_for_one else token1
+    token_out = token1 if zero_for_one else token0
+    balance_in_sender = token_in.balanceOf(sender.address)
+    balance_out_alice = token_out.balanceOf(alice.address)
+
+    sender.transfer(router.address, 0, data=encode_exact_input_single_packed(params))
+
+    assert token_in.balanceOf(sender.address) == balance_in_sender - params[6]
+    assert token_out.balanceOf(alice.address) == balance_out_alice + amount_out
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_exact_input_single_packed__reverts_when_past_deadline(
+    pool_initialized_with_liquidity,
+    router,
+    sender,
+    chain,
+    zero_for_one,
+    exact_input_single_params,
+):
+    deadline = chain.pending_timestamp - 1
+    params = exact_input_single_params(zero_for_one, deadline)
+    with reverts("Transaction too old"):
+        sender.transfer(
+            router.address, 0, data=encode_exact_input_single_packed(params)
+        )
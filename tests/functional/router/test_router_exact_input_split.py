@@ -0,0 +1,348 @@
+import pytest
+
+from ape import reverts
+from eth_abi.packed import encode_packed
+from hexbytes import HexBytes
+from math import sqrt
+
+from utils.constants import MIN_SQRT_RATIO
+from utils.utils import calc_amounts_from_liquidity_sqrt_price_x96
+
+
+@pytest.fixture
+def pool_two_initialized_with_liquidity(
+    pool_two,
+    spot_liquidity,
+    callee,
+    router,
+    token0,
+    token1,
+    sender,
+):
+    # add liquidity
+    liquidity_delta = spot_liquidity * 100 // 10000  # 1% of spot reserves
+    callee.mint(pool_two.address, sender.address, liquidity_delta, sender=sender)
+    pool_two.approve(pool_two.address, 2**256 - 1, sender=sender)
+    pool_two.approve(router.address, 2**256 - 1, sender=sender)
+
+    # initialize with price 10% lower than original pool for arb tests
+    # by swapping through the pool
+    state = pool_two.state()
+    reserve0, reserve1 = calc_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96
+    )
+    amount1 = int(reserve1 * (sqrt(0.9) - 1))  # specified one out
+    callee.swap(
+        pool_two.address,
+        sender.address,
+        True,
+        amount1,
+        MIN_SQRT_RATIO + 1,
+        sender=sender,
+    )
+
+    return pool_two
+
+
+@pytest.fixture
+def single_path(mock_univ3_pool, token0, token1):
+    def _single_path(zero_for_one: bool, maintenance: int) -> HexBytes:
+        token_in = token0.address if zero_for_one else token1.address
+        token_out = token1.address if zero_for_one else token0.address
+        return encode_packed(
+            [
+                "address",  # token in
+                "uint24",  # maintenance
+                "address",  # oracle
+                "address",  # token out
+            ],
+            [token_in, maintenance, mock_univ3_pool.address, token_out],
+        )
+
+    return _single_path
+
+
+@pytest.fixture
+def split_params(pool_initialized_with_liquidity, alice, token0, token1, single_path):
+    def _split_params(zero_for_one: bool, deadline: int, amount_out_min: int) -> tuple:
+        state = pool_initialized_with_liquidity.state()
+        (reserve0, reserve1) = calc_amounts_from_liquidity_sqrt_price_x96(
+            state.liquidity, state.sqrtPriceX96
+        )
+        amount_in = 1 * reserve0 // 100 if zero_for_one else 1 * reserve1 // 100
+        amount_in_one = amount_in * 3 // 4
+        amount_in_two = amount_in - amount_in_one
+
+        token_in = token0 if zero_for_one else token1
+        token_out = token1 if zero_for_one else token0
+        legs = [
+            (single_path(zero_for_one, 250000), amount_in_one),  # pool
+            (single_path(zero_for_one, 500000), amount_in_two),  # pool two
+        ]
+        return (
+            token_in.address,
+            token_out.address,
+            legs,
+            alice.address,  # recipient
+            deadline,
+            amount_in,
+            amount_out_min,
+        )
+
+    return _split_params
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_exact_input_split__transfers_funds(
+    pool_initialized_with_liquidity,
+    pool_two_initialized_with_liquidity,
+    router,
+    sender,
+    alice,
+    chain,
+    zero_for_one,
+    token0,
+    token1,
+    split_params,
+):
+    deadline = chain.pending_timestamp + 3600
+    params = split_params(zero_for_one, deadline, 0)
+
+    # legs swap through different pools so quote each independently
+    amount_out = sum(
+        router.exactInput.call(
+            (path, alice.address, deadline, amount_in, 0), sender=sender
+        )
+        for (path, amount_in) in params[2]
+    )
+
+    token_in = token0 if zero_for_one else token1
+    token_out = token1 if zero_for_one else token0
+    balance_in_sender = token_in.balanceOf(sender.address)
+    balance_out_alice = token_out.balanceOf(alice.address)
+
+    tx = router.exactInputSplit(params, sender=sender)
+
+    assert tx.return_value == amount_out
+    assert token_in.balanceOf(sender.address) == balance_in_sender - params[5]
+    assert token_out.balanceOf(alice.address) == balance_out_alice + amount_out
+    assert token_in.balanceOf(router.address) == 0
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_exact_input_split__reverts_when_past_deadline(
+    pool_initialized_with_liquidity,
+    pool_two_initialized_with_liquidity,
+    router,
+    sender,
+    chain,
+    zero_for_one,
+    split_params,
+):
+    deadline = chain.pending_timestamp - 1
+    params = split_params(zero_for_one, deadline, 0)
+    with reverts("Transaction too old"):
+        router.exactInputSplit(params, sender=sender)
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_exact_input_split__reverts_when_amount_in_not_sum_of_legs(
+    pool_initialized_with_liquidity,
+    pool_two_initialized_with_liquidity,
+    router,
+    sender,
+    chain,
+    zero_for_one,
+    split_params,
+):
+    deadline = chain.pending_timestamp + 3600
+    params = list(split_params(zero_for_one, deadline, 0))
+    params[5] += 1
+    with reverts("Invalid amount in"):
+        router.exactInputSplit(tuple(params), sender=sender)
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_exact_input_split__reverts_when_leg_amount_in_zero(
+    pool_initialized_with_liquidity,
+    pool_two_initialized_with_liquidity,
+    router,
+    sender,
+    chain,
+    zero_for_one,
+    split_params,
+):
+    deadline = chain.pending_timestamp + 3600
+    params = list(split_params(zero_for_one, deadline, 0))
+    (path_one, amount_in_one), (path_two, amount_in_two) = params[2]
+    params[2] = [
+        (path_one, amount_in_one + amount_in_two),
+        (path_two, 0),
+    ]  # amount in still sums to total
+    with reverts("Invalid leg amount in"):
+        router.exactInputSplit(tuple(params), sender=sender)
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_exact_input_split__reverts_when_leg_path_invalid(
+    pool_initialized_with_liquidity,
+    pool_two_initialized_with_liquidity,
+    router,
+    sender,
+    chain,
+    zero_for_one,
+    split_params,
+    single_path,
+):
+    deadline = chain.pending_timestamp + 3600
+    params = list(split_params(zero_for_one, deadline, 0))
+    _, amount_in_two = params[2][1]
+    params[2] = [
+        params[2][0],
+        (single_path(not zero_for_one, 500000), amount_in_two),
+    ]  # reversed direction on second leg
+    with reverts("Invalid path"):
+        router.exactInputSplit(tuple(params), sender=sender)
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_router_exact_input_split__reverts_when_amount_out_less_than_min(
+    pool_initialized_with_liquidity,
+    pool_two_initialized_with_liquidity,
+    router,
+    sender,
+    alice,
+    chain,
+    zero_for_one,
+    split_params,
+):
+    deadline = chain.pending_timestamp + 3600
+    params = split_params(zero_for_one, deadline, 0)
+    amount_out = sum(
+        router.exactInput.call(
+            (path, alice.address, deadline, amount_in, 0), sender=sender
+        )
+        for (path, amount_in) in params[2]
+    )
+
+    params = list(params)
+    params[6] = amount_out + 1
+    with reverts("Too little received"):
+        router.exactInputSplit(tuple(params), sender=sender)
+
+
+@pytest.fixture
+def split_params_with_WETH9(
+    pool_with_WETH9_initialized_with_liquidity,
+    alice,
+    WETH9,
+    token0_with_WETH9,
+    token1_with_WETH9,
+):
+    def _split_params(deadline: int) -> tuple:
+        token_out = (
+            token1_with_WETH9
+            if token0_with_WETH9.address == WETH9.address
+            else token0_with_WETH9
+        )
+        reserve_in = WETH9.balanceOf(pool_with_WETH9_initialized_with_liquidity.address)
+        amount_in = 1 * reserve_in // 100
+        amount_in_one = amount_in * 3 // 4
+        amount_in_two = amount_in - amount_in_one
+
+        path = encode_packed(
+            ["address", "uint24", "address", "address"],
+            [
+                WETH9.address,
+                pool_with_WETH9_initialized_with_liquidity.maintenance(),
+                pool_with_WETH9_initialized_with_liquidity.oracle(),
+                token_out.address,
+            ],
+        )
+        legs = [(path, amount_in_one), (path, amount_in_two)]
+        return (
+            WETH9.address,
+            token_out.address,
+            legs,
+            alice.address,  # recipient
+            deadline,
+            amount_in,
+            0,  # amount out min
+        )
+
+    return _split_params
+
+
+def test_router_exact_input_split__wraps_ETH_once_and_refunds_excess(
+    pool_with_WETH9_initialized_with_liquidity,
+    router,
+    sender,
+    chain,
+    WETH9,
+    split_params_with_WETH9,
+):
+    # set WETH9 allowance to zero to ensure all payment in ETH
+    WETH9.approve(router.address, 0, sender=sender)
+
+    deadline = chain.pending_timestamp + 3600
+    params = split_params_with_WETH9(deadline)
+    amount_in = params[5]
+    excess = amount_in // 2
+
+    balance_WETH9_pool = WETH9.balanceOf(
+        pool_with_WETH9_initialized_with_liquidity.address
+    )
+    balancee_sender = sender.balance
+    tx = router.exactInputSplit(params, sender=sender, value=amount_in + excess)
+
+    # legs paid from router held WETH9 rather than wrapping excess ETH again
+    assert (
+        WETH9.balanceOf(pool_with_WETH9_initialized_with_liquidity.address)
+        == balance_WETH9_pool + amount_in
+    )
+    assert WETH9.balanceOf(router.address) == 0
+    assert router.balance == 0
+    assert (
+        sender.balance == balancee_sender - amount_in - tx.gas_used * tx.gas_price
+    )  # excess ETH refunded
+
+
+def test_router_exact_input_split__refunds_excess_ETH_with_multicall(
+    pool_with_WETH9_initialized_with_liquidity,
+    router,
+    sender,
+    alice,
+    chain,
+    WETH9,
+    token0_with_WETH9,
+    token1_with_WETH9,
+    split_params_with_WETH9,
+):
+    # set WETH9 allowance to zero to ensure all payment in ETH
+    WETH9.approve(router.address, 0, sender=sender)
+
+    deadline = chain.pending_timestamp + 3600
+    params = split_params_with_WETH9(deadline)
+    amount_in = params[5]
+    excess = amount_in // 2
+
+    token_out = (
+        token1_with_WETH9
+        if token0_with_WETH9.address == WETH9.address
+        else token0_with_WETH9
+    )
+    balance_out_alice = token_out.balanceOf(alice.address)
+    balancee_sender = sender.balance
+
+    calldata = [
+        router.exactInputSplit.as_transaction(params, sender=sender).data,
+        router.refundETH.as_transaction(sender=sender).data,
+    ]
+    tx = router.multicall(calldata, sender=sender, value=amount_in + excess)
+
+    assert (
+        sender.balance == balancee_sender - amount_in - tx.gas_used * tx.gas_price
+    )  # only amount in wrapped and spent
+    assert token_out.balanceOf(alice.address) > balance_out_alice
+    assert WETH9.balanceOf(router.address) == 0
+    assert router.balance == 0
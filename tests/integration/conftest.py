@@ -68,10 +68,19 @@ def mrglv1_factory(project, accounts, univ3_factory):
 
 
 @pytest.fixture(scope="module")
-def mrglv1_manager(project, accounts, mrglv1_factory, WETH9):
+def permit2(assert_mainnet_fork, Contract):
+    return Contract("0x000000000022D473030F116dDEE9F6B43aC78BA3")
+
+
+@pytest.fixture(scope="module")
+def mrglv1_manager(project, accounts, mrglv1_factory, WETH9, permit2):
     # TODO: replace zero address with descriptor
     return project.NonfungiblePositionManager.deploy(
-        mrglv1_factory.address, WETH9.address, ZERO_ADDRESS, sender=accounts[0]
+        mrglv1_factory.address,
+        WETH9.address,
+        permit2.address,
+        ZERO_ADDRESS,
+        sender=accounts[0],
     )
 
 